@@ -0,0 +1,74 @@
+"""asyncio integration example with an input latency check"""
+
+import sys
+import os
+import asyncio
+import random
+import time
+
+# Add the parent directory to the Python path so we can import src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import App, async_handler
+from src.widgets import Button, Frame, Label
+
+COROUTINES = 5000
+PROBE_INTERVAL = 10  # ms between latency probes
+DURATION = 5.0       # seconds to measure for
+
+def main():
+    app = App(theme="default", title="Async Demo", geometry="420x220")
+    latencies = []
+    
+    main_frame = Frame(app, style={'bg': '#f8f9fa', 'padding': 20})
+    main_frame.pack(fill='both', expand=True)
+    
+    status = Label(main_frame, text="Starting coroutines...", style={'bg': '#f8f9fa'})
+    status.pack(pady=(0, 10))
+    
+    result = Label(main_frame, text="", style={'bg': '#f8f9fa', 'fg': '#6c757d'})
+    result.pack(pady=(0, 10))
+    
+    @async_handler
+    async def fetch():
+        # Simulated network call; the UI keeps handling input meanwhile
+        result.set_text("Fetching...")
+        await asyncio.sleep(1.0)
+        result.set_text("Fetched at %s" % time.strftime('%H:%M:%S'))
+    
+    Button(main_frame, text="Fetch", command=fetch).pack()
+    
+    async def io_worker():
+        while True:
+            await asyncio.sleep(0.2 + random.random() * 0.8)
+    
+    def send_probe():
+        # A timer that comes due while the loop sleeps behaves like input
+        # arriving from the window system; its lateness is the input latency.
+        due = time.perf_counter() + PROBE_INTERVAL / 1000.0
+        
+        def on_probe():
+            latencies.append((time.perf_counter() - due) * 1000)
+            send_probe()
+        
+        app.root.after(PROBE_INTERVAL, on_probe)
+    
+    async def measure():
+        for _ in range(COROUTINES):
+            app.spawn(io_worker())
+        status.set_text("%d coroutines running" % COROUTINES)
+        
+        send_probe()
+        await asyncio.sleep(DURATION)
+        
+        samples = sorted(latencies)
+        p50 = samples[len(samples) // 2]
+        p99 = samples[int(len(samples) * 0.99)]
+        report = "input latency p50 %.1f ms, p99 %.1f ms (%d events)" % (p50, p99, len(samples))
+        print(report)
+        status.set_text(report)
+    
+    app.run_async(measure())
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -27,6 +27,9 @@ setup(
         "Pillow>=8.0.0",
     ],
     extras_require={
+        "speedups": [
+            "numpy>=1.17",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov",
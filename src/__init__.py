@@ -10,6 +10,8 @@ __version__ = "0.1.0"
 # Core imports
 from .core.theme_manager import ThemeManager
 from .core.style_engine import StyleEngine
+from .core.dispatcher import UIDispatcher
+from .core.async_loop import AsyncTkLoop, spawn, async_handler, wait_event
 
 # Widget imports
 from .widgets.button import Button
@@ -36,8 +38,10 @@ from .themes import default_theme, dark_theme, material_theme, fluent_theme
 # Utility classes
 from .utils.colors import Color
 from .utils.fonts import FontManager
+from .utils.frame_clock import FrameClock
 
 # Main application class
+import asyncio
 import tkinter as tk
 from typing import Optional, Dict, Any
 
@@ -49,6 +53,13 @@ class App:
         self.theme_manager = ThemeManager()
         self.style_engine = StyleEngine(self.theme_manager)
         
+        # Queue for UI updates posted from worker threads; effects rendered
+        # off the Tk thread hand their results back through it too
+        self.dispatcher = UIDispatcher.for_widget(self.root)
+        
+        # asyncio integration, used by run_async()
+        self.async_loop = AsyncTkLoop(self.root)
+        
         # Set theme
         if theme == "default":
             self.theme_manager.set_theme(default_theme)
@@ -68,6 +79,30 @@ class App:
         """Start the application main loop"""
         self.root.mainloop()
     
+    def run_async(self, main=None):
+        """Start the application with an asyncio loop driving Tk events"""
+        asyncio.run(self.async_loop.run(main))
+    
+    async def run_in_loop(self, main=None):
+        """Pump Tk from an already running asyncio loop until the window closes"""
+        await self.async_loop.run(main)
+    
+    def spawn(self, coro):
+        """Schedule a coroutine while the app runs async"""
+        return self.async_loop.spawn(coro)
+    
+    def call_from_thread(self, callback, *args, **kwargs):
+        """Run a callable on the Tk thread; safe to call from worker threads"""
+        self.dispatcher.post(callback, *args, **kwargs)
+    
+    def set_low_power_mode(self, enabled: bool = True, fps: int = 15):
+        """Cap the animation frame rate while the window is unfocused"""
+        FrameClock.set_low_power(enabled, fps)
+    
+    def set_resize_idle_delay(self, delay: int = 150):
+        """Wait this many ms after the window stops resizing before re-rendering effects at full quality"""
+        FrameClock.set_resize_idle_delay(delay)
+    
     def __getattr__(self, name):
         """Delegate to root window"""
         return getattr(self.root, name)
@@ -101,7 +136,8 @@ class Theme:
 
 __all__ = [
     # Core classes
-    'App', 'Theme', 'StyleClass',
+    'App', 'Theme', 'StyleClass', 'UIDispatcher',
+    'AsyncTkLoop', 'spawn', 'async_handler', 'wait_event',
     
     # Widgets
     'Button', 'Frame', 'Label', 'Entry', 'Text',
@@ -5,11 +5,15 @@ from .theme_manager import ThemeManager
 from .base_widget import BaseWidget
 from .style_resolver import StyleResolver
 from .event_manager import EventManager
+from .dispatcher import UIDispatcher
+from .async_loop import AsyncTkLoop
 
 __all__ = [
     'StyleEngine',
     'ThemeManager', 
     'BaseWidget',
     'StyleResolver',
-    'EventManager'
+    'EventManager',
+    'UIDispatcher',
+    'AsyncTkLoop'
 ]
\ No newline at end of file
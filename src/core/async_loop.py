@@ -0,0 +1,164 @@
+"""
+asyncio integration for Modern TK.
+Runs Tk event processing inside an asyncio event loop so coroutines and
+the UI share one thread.
+"""
+
+import asyncio
+import functools
+import tkinter as tk
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.core.event_manager import unbind_tk_handler
+
+try:
+    from _tkinter import DONT_WAIT
+except ImportError:  # pragma: no cover
+    DONT_WAIT = 2
+
+# Loop currently pumping Tk; used by spawn() from event handlers
+_active_loop = None
+
+
+class AsyncTkLoop:
+    """Interleaves the asyncio event loop with Tk event processing"""
+    
+    def __init__(self, root, min_interval: float = 1.0, max_interval: float = 16.0,
+                 max_events: int = 500):
+        self.root = root
+        self.min_interval = min_interval  # ms to sleep right after Tk activity
+        self.max_interval = max_interval  # ms to sleep once Tk has gone idle
+        self.max_events = max_events      # Tk events handled per pump before yielding
+        self.loop = None
+        self.tasks = set()
+        self._running = False
+        self._destroy_funcid = None
+        
+        self.stats = {
+            'pumps': 0,
+            'tk_events': 0
+        }
+    
+    async def run(self, main: Optional[Awaitable] = None):
+        """Pump Tk from the running asyncio loop until the root is destroyed"""
+        global _active_loop
+        
+        self.loop = asyncio.get_running_loop()
+        self._running = True
+        previous_loop, _active_loop = _active_loop, self
+        
+        try:
+            self._destroy_funcid = self.root.bind('<Destroy>', self._on_destroy, add='+')
+        except tk.TclError:
+            self._destroy_funcid = None
+        
+        if main is not None:
+            self.spawn(main)
+        
+        interval = self.min_interval
+        try:
+            while self._running:
+                handled = self._pump()
+                if handled:
+                    interval = self.min_interval
+                else:
+                    # Back off while idle so an idle UI does not spin a core;
+                    # the ceiling bounds worst-case input latency.
+                    interval = min(interval * 2, self.max_interval)
+                await asyncio.sleep(interval / 1000.0)
+        finally:
+            _active_loop = previous_loop
+            self._running = False
+            if self._destroy_funcid:
+                unbind_tk_handler(self.root, '<Destroy>', self._destroy_funcid)
+                self._destroy_funcid = None
+            for task in list(self.tasks):
+                task.cancel()
+            if self.tasks:
+                await asyncio.gather(*self.tasks, return_exceptions=True)
+    
+    def stop(self):
+        """Stop pumping Tk events"""
+        self._running = False
+    
+    def _pump(self) -> int:
+        """Process pending Tk events without blocking"""
+        handled = 0
+        dooneevent = self.root.tk.dooneevent
+        try:
+            while handled < self.max_events and dooneevent(DONT_WAIT):
+                handled += 1
+        except tk.TclError:
+            self._running = False
+        
+        self.stats['pumps'] += 1
+        self.stats['tk_events'] += handled
+        return handled
+    
+    def _on_destroy(self, event):
+        """Stop when the root window goes away"""
+        if event.widget is self.root:
+            self._running = False
+    
+    def spawn(self, coro: Awaitable) -> asyncio.Future:
+        """Schedule a coroutine on the loop and keep a reference to it"""
+        if not self._running:
+            # Before run() there is no loop to bind to; ensure_future would pick one that never runs
+            raise RuntimeError("The async loop is not running; pass the coroutine to run_async() or spawn it once running")
+        task = asyncio.ensure_future(coro, loop=self.loop)
+        self.tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+    
+    def _task_done(self, task):
+        """Drop finished tasks and report their errors"""
+        self.tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Error in async task: {task.exception()}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pump counters"""
+        stats = dict(self.stats)
+        stats['tasks'] = len(self.tasks)
+        return stats
+
+
+def spawn(coro: Awaitable) -> asyncio.Future:
+    """Schedule a coroutine from an event handler while the app runs async"""
+    if _active_loop is None:
+        raise RuntimeError("No async loop is running; start the app with App.run_async()")
+    return _active_loop.spawn(coro)
+
+
+def async_handler(func: Callable) -> Callable:
+    """Wrap a coroutine function so it can be used as a Tk command or event handler"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return spawn(func(*args, **kwargs))
+    return wrapper
+
+
+async def wait_event(widget, event_name: str, timeout: Optional[float] = None):
+    """Wait for the next Modern TK event or Tk sequence (e.g. '<Button-1>') on a widget"""
+    future = asyncio.get_running_loop().create_future()
+    
+    def on_event(event):
+        if not future.done():
+            future.set_result(event)
+    
+    if event_name.startswith('<'):
+        tk_widget = getattr(widget, 'tk_widget', widget)
+        funcid = tk_widget.bind(event_name, on_event, add='+')
+        
+        def cleanup():
+            unbind_tk_handler(tk_widget, event_name, funcid)
+    else:
+        token = widget.event_manager.bind(event_name, on_event)
+        
+        def cleanup():
+            widget.event_manager.remove_handler(token)
+    
+    try:
+        return await asyncio.wait_for(future, timeout)
+    finally:
+        cleanup()
\ No newline at end of file
@@ -8,17 +8,24 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Callable
 
 from src.core.event_manager import EventManager
+from src.core.async_loop import wait_event
 from src.core.style_engine import StyleEngine
+from src.effects.shadows import shadow_manager
+from src.effects.background import background_manager
 
 
 class BaseWidget(ABC):
     """Abstract base class for all Modern TK widgets"""
     
+    # The FlexLayout holding this widget, told when its requested size may have changed
+    layout_parent = None
+    
     def __init__(self, parent=None, style=None, style_class=None, **kwargs):
         self.parent = parent or tk._default_root
         self.style_dict = style or {}
         self.style_class = style_class
         self.event_manager = EventManager()
+        self._applied_style = None  # Last resolved style, the start point for transitions
         
         # Widget state
         self.state = {
@@ -85,11 +92,24 @@ class BaseWidget(ABC):
         # Get style engine
         style_engine = StyleEngine(_global_theme_manager)
         
-        # Build final style from various sources
-        final_style = self._resolve_final_style()
+        # Build final style from various sources; translucent colors are
+        # flattened onto the parent here, before transitions compare them
+        final_style = style_engine.resolve_colors(self.tk_widget, self._resolve_final_style())
         
         # Apply to widget
-        style_engine.apply_to_widget(self, final_style)
+        style_engine.apply_to_widget(self, final_style, self._applied_style)
+        self._applied_style = final_style
+        self._invalidate_layout()
+    
+    def _invalidate_layout(self):
+        """Have the enclosing FlexLayout re-measure this widget"""
+        if self.layout_parent is not None:
+            self.layout_parent.invalidate(self)
+    
+    def _content_changed(self):
+        """Text or font changed: re-pin the background layer's size, then re-measure in the layout"""
+        background_manager.remeasure(self)
+        self._invalidate_layout()
     
     def _resolve_final_style(self) -> Dict[str, Any]:
         """Resolve the final style from all sources"""
@@ -193,14 +213,22 @@ class BaseWidget(ABC):
             self.state[state] = active
             self._apply_styles()
     
-    def bind_event(self, event_name: str, callback: Callable):
-        """Bind a custom event handler"""
-        self.event_manager.bind(event_name, callback)
+    def bind_event(self, event_name: str, callback: Callable, priority: int = 0, weak: bool = False) -> int:
+        """Bind a custom event handler and return its token"""
+        return self.event_manager.bind(event_name, callback, priority=priority, weak=weak)
+    
+    def unbind_event(self, event_name, callback: Optional[Callable] = None):
+        """Unbind a custom event handler by token, callback, or event name"""
+        self.event_manager.unbind(event_name, callback)
     
     def trigger_event(self, event_name: str, *args, **kwargs):
         """Trigger a custom event"""
         self.event_manager.trigger(event_name, self, *args, **kwargs)
     
+    async def wait_event(self, event_name: str, timeout: Optional[float] = None):
+        """Wait for the next custom event or Tk sequence on this widget"""
+        return await wait_event(self, event_name, timeout)
+    
     # Delegate common Tkinter methods
     def pack(self, **kwargs):
         return self.tk_widget.pack(**kwargs)
@@ -213,7 +241,7 @@ class BaseWidget(ABC):
     
     def configure(self, **kwargs):
         # Split between style and tkinter options
-        style_keys = {'bg', 'fg', 'font', 'radius', 'shadow', 'hover_bg', 'hover_fg'}
+        style_keys = {'bg', 'fg', 'font', 'radius', 'shadow', 'hover_bg', 'hover_fg', 'transition'}
         
         style_options = {k: v for k, v in kwargs.items() if k in style_keys}
         tk_options = {k: v for k, v in kwargs.items() if k not in style_keys}
@@ -222,11 +250,20 @@ class BaseWidget(ABC):
             self.update_style(style_options)
         
         if tk_options:
-            return self.tk_widget.configure(**tk_options)
+            result = self.tk_widget.configure(**tk_options)
+            self._content_changed()
+            return result
     
     def cget(self, key):
         return self.tk_widget.cget(key)
     
+    def destroy(self):
+        """Destroy the widget and drop its event handlers"""
+        self.event_manager.clear()
+        shadow_manager.remove(self)
+        background_manager.remove(self)
+        self.tk_widget.destroy()
+    
     def __getattr__(self, name):
         """Delegate to the underlying Tkinter widget"""
         return getattr(self.tk_widget, name)
\ No newline at end of file
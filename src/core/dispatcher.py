@@ -0,0 +1,160 @@
+"""
+Thread-safe UI dispatch queue for Modern TK.
+Lets background workers hand work to the Tk thread without touching Tk.
+"""
+
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+
+class UIDispatcher:
+    """Batches callables posted from worker threads onto the Tk thread"""
+    
+    def __init__(self, root, interval: int = 16, idle_interval: int = 50,
+                 budget: float = 8.0, max_batch: int = 10000):
+        self.root = root
+        self.interval = interval            # ms between ticks while work is pending
+        self.idle_interval = idle_interval  # ms between ticks while the queue is empty
+        self.budget = budget                # ms of Tk-thread time spent per tick
+        self.max_batch = max_batch          # max items pulled off the inbox per tick
+        
+        # Workers only ever append to the inbox. deque.append/popleft are atomic,
+        # so posting never takes a lock and never waits for the UI.
+        self._inbox = deque()
+        
+        # Tk-thread-only state: pulled items keyed for coalescing, in post order
+        self._pending = {}  # {key: (callback, args, kwargs)}
+        self._sequence = 0
+        self._after_id = None
+        self._running = False
+        
+        self.stats = {
+            'posted': 0,
+            'executed': 0,
+            'coalesced': 0,
+            'errors': 0,
+            'ticks': 0
+        }
+    
+    @classmethod
+    def for_widget(cls, widget) -> 'UIDispatcher':
+        """Get the dispatcher for the root that owns a widget, starting one if there is none yet"""
+        tk_widget = getattr(widget, 'tk_widget', widget)
+        root = tk_widget._root()
+        dispatcher = getattr(root, '_modern_tk_dispatcher', None)
+        if dispatcher is None:
+            dispatcher = cls(root)
+            dispatcher.start()
+            root._modern_tk_dispatcher = dispatcher
+        return dispatcher
+    
+    def start(self):
+        """Start draining the queue (must be called on the Tk thread)"""
+        if not self._running:
+            self._running = True
+            self._schedule(0)
+    
+    def stop(self):
+        """Stop draining the queue; pending work is kept"""
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+    
+    def post(self, callback: Callable, *args, **kwargs):
+        """Queue a callable to run on the Tk thread (safe from any thread)"""
+        self._inbox.append((None, callback, args, kwargs))
+    
+    def post_update(self, widget, property_name: str, callback: Callable, *args, **kwargs):
+        """Queue a widget update; only the latest one per (widget, property) runs"""
+        self._inbox.append(((id(widget), property_name), callback, args, kwargs))
+    
+    def post_event(self, widget, event_name: str, *args, **kwargs):
+        """Queue a Modern TK event to be triggered on the Tk thread"""
+        self.post(widget.trigger_event, event_name, *args, **kwargs)
+    
+    def set_text(self, widget, text: str):
+        """Coalesced ``widget.set_text`` from a worker thread"""
+        self.post_update(widget, 'text', widget.set_text, text)
+    
+    def set_value(self, widget, value):
+        """Coalesced ``widget.set_value`` from a worker thread"""
+        self.post_update(widget, 'value', widget.set_value, value)
+    
+    def pending_count(self) -> int:
+        """Approximate number of queued items"""
+        return len(self._inbox) + len(self._pending)
+    
+    def drain(self, budget: Optional[float] = None) -> int:
+        """Run queued work on the Tk thread within a time budget (ms)"""
+        budget = self.budget if budget is None else budget
+        self._pull()
+        
+        if not self._pending:
+            return 0
+        
+        deadline = time.perf_counter() + budget / 1000.0
+        executed = 0
+        pending = self._pending
+        
+        while pending:
+            key = next(iter(pending))
+            callback, args, kwargs = pending.pop(key)
+            try:
+                callback(*args, **kwargs)
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"Error in dispatched callback: {e}")
+            executed += 1
+            
+            if time.perf_counter() >= deadline:
+                break
+        
+        self.stats['executed'] += executed
+        return executed
+    
+    def _pull(self):
+        """Move items from the inbox into the coalescing table"""
+        inbox = self._inbox
+        pending = self._pending
+        
+        for _ in range(min(len(inbox), self.max_batch)):
+            key, callback, args, kwargs = inbox.popleft()
+            self.stats['posted'] += 1
+            if key is None:
+                # Plain callables are never coalesced
+                self._sequence += 1
+                key = self._sequence
+            elif key in pending:
+                self.stats['coalesced'] += 1
+            pending[key] = (callback, args, kwargs)
+    
+    def _tick(self):
+        """Periodic drain on the Tk thread"""
+        self._after_id = None
+        if not self._running:
+            return
+        
+        self.stats['ticks'] += 1
+        self.drain()
+        
+        self._schedule(self.interval if self.pending_count() else self.idle_interval)
+    
+    def _schedule(self, delay: int):
+        """Schedule the next tick"""
+        try:
+            self._after_id = self.root.after(delay, self._tick)
+        except Exception:
+            # Root destroyed
+            self._running = False
+            self._after_id = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get dispatcher counters"""
+        stats = dict(self.stats)
+        stats['pending'] = self.pending_count()
+        return stats
\ No newline at end of file
@@ -3,34 +3,112 @@ Enhanced event management system for Modern TK widgets.
 Provides hover, focus, and custom event handling.
 """
 
-from typing import Dict, List, Callable, Any
+from typing import Dict, List, Callable, Any, Optional, Union
+import itertools
 import tkinter as tk
+import weakref
+
+# Handler tokens are unique across all managers
+_token_counter = itertools.count(1)
+
+class HandlerEntry:
+    """A bound handler with its ordering and optional weak reference"""
+    
+    __slots__ = ('token', 'priority', 'order', 'callback', 'ref', 'key')
+    
+    def __init__(self, token: int, callback: Callable, priority: int, weak: bool, on_dead: Callable):
+        self.token = token
+        self.priority = priority
+        self.order = token
+        self.key = _callback_key(callback)
+        
+        if weak:
+            # Bound methods need WeakMethod; a plain ref to one dies immediately
+            if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+                self.ref = weakref.WeakMethod(callback, lambda _: on_dead(token))
+            else:
+                self.ref = weakref.ref(callback, lambda _: on_dead(token))
+            self.callback = None
+        else:
+            self.ref = None
+            self.callback = callback
+    
+    def resolve(self) -> Optional[Callable]:
+        """Get the callable, or None if its referent was collected"""
+        if self.ref is None:
+            return self.callback
+        return self.ref()
+
+def _callback_key(callback: Callable):
+    """Identity key for a callback that treats equal bound methods as the same"""
+    if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+        return (id(callback.__self__), id(callback.__func__))
+    return id(callback)
 
 class EventManager:
     """Enhanced event handling for modern widgets"""
     
     def __init__(self):
-        self.event_handlers = {}
-        self.global_handlers = {}
+        self.event_handlers = {}   # {event_name: {token: HandlerEntry}}
+        self.global_handlers = {}  # {event_name: {token: HandlerEntry}}
         self.event_propagation = True
+        
+        self._tokens = {}          # {token: (handler table, event_name)}
+        self._ordered = {}         # {(table id, event_name): [HandlerEntry]} sorted for dispatch
     
-    def bind(self, event_name: str, callback: Callable):
-        """Bind an event handler"""
-        if event_name not in self.event_handlers:
-            self.event_handlers[event_name] = []
-        
-        self.event_handlers[event_name].append(callback)
-    
-    def unbind(self, event_name: str, callback: Callable = None):
-        """Unbind event handler(s)"""
-        if event_name in self.event_handlers:
-            if callback:
-                try:
-                    self.event_handlers[event_name].remove(callback)
-                except ValueError:
-                    pass
-            else:
-                self.event_handlers[event_name] = []
+    def bind(self, event_name: str, callback: Callable, priority: int = 0, weak: bool = False) -> int:
+        """Bind an event handler and return a token for unbinding it"""
+        # Higher priorities run first, ties in bind order. A weak handler does
+        # not keep its callback (or a bound method's instance) alive.
+        return self._add(self.event_handlers, event_name, callback, priority, weak)
+    
+    def unbind(self, event_name: Union[str, int], callback: Callable = None):
+        """Unbind a handler by token, a specific callback, or all handlers for an event"""
+        if isinstance(event_name, int):
+            self.remove_handler(event_name)
+            return
+        
+        handlers = self.event_handlers.get(event_name)
+        if not handlers:
+            return
+        
+        if callback:
+            key = _callback_key(callback)
+            for token, entry in handlers.items():
+                if entry.key == key:
+                    self.remove_handler(token)
+                    break
+        else:
+            for token in list(handlers):
+                self.remove_handler(token)
+    
+    def remove_handler(self, token: int) -> bool:
+        """Remove a handler by the token returned from bind()"""
+        location = self._tokens.pop(token, None)
+        if location is None:
+            return False
+        
+        table, event_name = location
+        handlers = table.get(event_name)
+        if handlers is not None:
+            handlers.pop(token, None)
+            if not handlers:
+                del table[event_name]
+        self._ordered.pop((id(table), event_name), None)
+        return True
+    
+    def clear(self):
+        """Remove every handler"""
+        self.event_handlers.clear()
+        self.global_handlers.clear()
+        self._tokens.clear()
+        self._ordered.clear()
+    
+    def handler_count(self, event_name: Optional[str] = None) -> int:
+        """Number of bound handlers, optionally for one event"""
+        if event_name is not None:
+            return len(self.event_handlers.get(event_name, ())) + len(self.global_handlers.get(event_name, ()))
+        return len(self._tokens)
     
     def trigger(self, event_name: str, widget, *args, **kwargs):
         """Trigger an event"""
@@ -38,31 +116,61 @@ class EventManager:
         event_obj = ModernEvent(event_name, widget, *args, **kwargs)
         
         # Call widget-specific handlers
-        if event_name in self.event_handlers:
-            for handler in self.event_handlers[event_name]:
-                try:
-                    handler(event_obj)
-                    if event_obj.stop_propagation:
-                        break
-                except Exception as e:
-                    print(f"Error in event handler: {e}")
+        for handler in self._dispatch_order(self.event_handlers, event_name):
+            try:
+                handler(event_obj)
+                if event_obj.stop_propagation:
+                    break
+            except Exception as e:
+                print(f"Error in event handler: {e}")
         
         # Call global handlers
-        if event_name in self.global_handlers:
-            for handler in self.global_handlers[event_name]:
-                try:
-                    handler(event_obj)
-                    if event_obj.stop_propagation:
-                        break
-                except Exception as e:
-                    print(f"Error in global event handler: {e}")
-    
-    def bind_global(self, event_name: str, callback: Callable):
-        """Bind a global event handler"""
-        if event_name not in self.global_handlers:
-            self.global_handlers[event_name] = []
-        
-        self.global_handlers[event_name].append(callback)
+        for handler in self._dispatch_order(self.global_handlers, event_name):
+            try:
+                handler(event_obj)
+                if event_obj.stop_propagation:
+                    break
+            except Exception as e:
+                print(f"Error in global event handler: {e}")
+    
+    def bind_global(self, event_name: str, callback: Callable, priority: int = 0, weak: bool = False) -> int:
+        """Bind a global event handler and return its token"""
+        return self._add(self.global_handlers, event_name, callback, priority, weak)
+    
+    def _add(self, table: Dict[str, Dict[int, HandlerEntry]], event_name: str,
+             callback: Callable, priority: int, weak: bool) -> int:
+        """Store a handler entry in a handler table"""
+        token = next(_token_counter)
+        entry = HandlerEntry(token, callback, priority, weak, self._on_handler_dead)
+        
+        table.setdefault(event_name, {})[token] = entry
+        self._tokens[token] = (table, event_name)
+        self._ordered.pop((id(table), event_name), None)
+        return token
+    
+    def _on_handler_dead(self, token: int):
+        """Drop a weak handler whose referent was collected"""
+        self.remove_handler(token)
+    
+    def _dispatch_order(self, table: Dict[str, Dict[int, HandlerEntry]], event_name: str) -> List[Callable]:
+        """Live callables for an event in priority order"""
+        handlers = table.get(event_name)
+        if not handlers:
+            return []
+        
+        cache_key = (id(table), event_name)
+        ordered = self._ordered.get(cache_key)
+        if ordered is None:
+            # Re-sorted only after bind/unbind, not on every trigger
+            ordered = sorted(handlers.values(), key=lambda entry: (-entry.priority, entry.order))
+            self._ordered[cache_key] = ordered
+        
+        callables = []
+        for entry in ordered:
+            handler = entry.resolve()
+            if handler is not None:
+                callables.append(handler)
+        return callables
     
     def create_hover_handler(self, enter_callback: Callable = None, leave_callback: Callable = None):
         """Create hover event handlers"""
@@ -118,6 +226,17 @@ class EventManager:
         
         return throttled_func
 
+def unbind_tk_handler(tk_widget, sequence: str, funcid: str):
+    """Remove one handler added with bind(..., add='+') without dropping the others"""
+    # tkinter's unbind(sequence, funcid) clears every script bound to the sequence
+    try:
+        script = tk_widget.bind(sequence)
+        remaining = [line for line in script.split('\n') if line and funcid not in line]
+        tk_widget.bind(sequence, '\n'.join(remaining))
+        tk_widget.deletecommand(funcid)
+    except tk.TclError:
+        pass
+
 class ModernEvent:
     """Enhanced event object for Modern TK"""
     
@@ -9,12 +9,18 @@ from typing import Dict, Any, Optional, Union
 from src.effects.shadows import ShadowEffect
 from src.effects.borders import BorderEffect
 from src.effects.gradients import GradientEffect
+from src.effects.transitions import TransitionEffect
 from src.utils.validators import StyleValidator
+from src.utils.colors import ColorUtils, alpha_blend_cache
 
 
 class StyleEngine:
     """Central style processing and application engine"""
     
+    # Style properties holding colors; fg-like ones are drawn over the widget's own background
+    COLOR_PROPERTIES = ['bg', 'fg', 'border_color', 'hover_bg', 'hover_fg']
+    FOREGROUND_PROPERTIES = {'fg': 'bg', 'hover_fg': 'hover_bg'}
+    
     def __init__(self, theme_manager=None):
         self.theme_manager = theme_manager
         self.validator = StyleValidator()
@@ -24,6 +30,7 @@ class StyleEngine:
         self.shadow_effect = ShadowEffect()
         self.border_effect = BorderEffect()
         self.gradient_effect = GradientEffect()
+        self.transition_effect = TransitionEffect()
     
     def parse_style_dict(self, style_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Parse and normalize a style dictionary"""
@@ -44,18 +51,63 @@ class StyleEngine:
         
         return parsed
     
-    def apply_to_widget(self, widget, style_dict: Dict[str, Any]):
+    def apply_to_widget(self, widget, style_dict: Dict[str, Any], previous_style: Optional[Dict[str, Any]] = None):
         """Apply parsed style to a widget"""
         if not style_dict:
             return
         
         tk_widget = getattr(widget, 'tk_widget', widget)
         
+        # Colors covered by a 'transition' animate instead of being set directly
+        target_style = style_dict
+        if 'transition' in style_dict and hasattr(widget, 'tk_widget'):
+            style_dict = self.transition_effect.transition_styles(widget, previous_style, style_dict)
+        
         # Apply basic properties
         self._apply_basic_properties(tk_widget, style_dict)
         
-        # Apply special effects
-        self._apply_special_effects(widget, style_dict)
+        # Apply special effects; a background layer covers the animated Tk color, so it gets the target one
+        self._apply_special_effects(widget, target_style)
+    
+    def resolve_colors(self, tk_widget, style_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve @theme references and composite #RRGGBBAA colors into opaque ones Tk accepts"""
+        resolved = style_dict
+        parent_bg = None
+        
+        for prop in self.COLOR_PROPERTIES:
+            value = style_dict.get(prop)
+            if not isinstance(value, str):
+                continue
+            
+            color = self._parse_color(value) if value.startswith('@') else value
+            if color is None:
+                continue
+            
+            if ColorUtils.split_alpha(color)[1] is not None:
+                under = resolved.get(self.FOREGROUND_PROPERTIES.get(prop))
+                if not isinstance(under, str) or under.startswith('@') or ColorUtils.split_alpha(under)[1] is not None:
+                    if parent_bg is None:
+                        parent_bg = self._parent_background(tk_widget)
+                    under = parent_bg
+                try:
+                    color = alpha_blend_cache.get(color, under, tk_widget)
+                except (tk.TclError, ValueError):
+                    continue
+            
+            if color != value:
+                if resolved is style_dict:
+                    resolved = dict(style_dict)
+                resolved[prop] = color
+        
+        return resolved
+    
+    @staticmethod
+    def _parent_background(tk_widget) -> str:
+        """Background translucent colors are composited onto"""
+        try:
+            return tk_widget.master.cget('bg')
+        except (tk.TclError, AttributeError):
+            return '#ffffff'
     
     def validate_style(self, style_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Validate style properties and values"""
@@ -95,7 +147,7 @@ class StyleEngine:
     
     def _parse_property_value(self, prop: str, value: Any) -> Any:
         """Parse property value based on its type"""
-        if prop in ['bg', 'fg', 'border_color', 'hover_bg', 'hover_fg']:
+        if prop in self.COLOR_PROPERTIES:
             return self._parse_color(value)
         elif prop in ['font_size', 'border_width', 'radius']:
             return self._parse_number(value)
@@ -105,6 +157,8 @@ class StyleEngine:
             return self._parse_spacing(value)
         elif prop == 'shadow':
             return self._parse_shadow(value)
+        elif prop == 'transition':
+            return TransitionEffect.parse_config(value) or {}
         else:
             return value
     
@@ -114,7 +168,11 @@ class StyleEngine:
             # Handle theme references
             if self.theme_manager and color.startswith('@'):
                 theme_key = color[1:]
-                return self.theme_manager.get_theme_value(f"colors.{theme_key}")
+                # Palette entries first, then any dotted theme path such as @acrylic.background
+                value = self.theme_manager.get_theme_value(f"colors.{theme_key}")
+                if value is None:
+                    value = self.theme_manager.get_theme_value(theme_key)
+                return value
             return color
         elif isinstance(color, tuple) and len(color) == 3:
             return f"#{color[0]:02x}{color[1]:02x}{color[2]:02x}"
@@ -232,9 +290,9 @@ class StyleEngine:
         if 'shadow' in style_dict and style_dict['shadow']:
             self.shadow_effect.apply(widget, style_dict['shadow'])
         
-        # Border radius
-        if 'radius' in style_dict and style_dict['radius'] > 0:
-            self.border_effect.apply_radius(widget, style_dict['radius'])
+        # Border radius; a radius of 0 removes earlier rounding
+        if 'radius' in style_dict and hasattr(widget, 'tk_widget'):
+            self.border_effect.apply_radius(widget, style_dict['radius'], style_dict)
         
         # Gradient background
         if 'gradient' in style_dict:
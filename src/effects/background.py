@@ -0,0 +1,385 @@
+"""Composited background layer: fill or gradient, border and rounded corners as one image"""
+
+import tkinter as tk
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+
+from PIL import Image, ImageDraw
+
+from src.core.event_manager import unbind_tk_handler
+from src.utils.frame_clock import FrameClock
+from src.utils.image_cache import image_cache
+from .gradients import gradient_pixels
+from .render_pool import render_pool
+
+# Supersampling factor for anti-aliased corners
+CORNER_SUPERSAMPLE = 4
+
+# Tag of a canvas's background image item; clear a canvas with delete(CANVAS_CONTENT) to keep it
+CANVAS_TAG = 'modern_tk_background'
+CANVAS_CONTENT = '!' + CANVAS_TAG
+
+RGB = Tuple[int, int, int]
+
+def render_background(width: int, height: int, fill: RGB, gradient: Optional[tuple], radius: int,
+                      border_width: int, border_color: RGB, outside: RGB) -> bytes:
+    """Render the whole layer as binary PPM data for a single PhotoImage(data=...) call"""
+    header = b'P6 %d %d 255\n' % (width, height)
+    r = min(radius, width // 2, height // 2)
+    bw = min(border_width, width // 2, height // 2)
+    if gradient is not None:
+        pixels = gradient_pixels(width, height, *gradient)
+        if not r and not bw:
+            return header + pixels
+        image = Image.frombytes('RGB', (width, height), pixels)
+    else:
+        image = Image.new('RGB', (width, height), fill)
+    
+    # Straight border edges are plain fills; only the r x r corner boxes need masks
+    if bw:
+        for box in ((0, 0, width, bw), (0, height - bw, width, height), (0, 0, bw, height), (width - bw, 0, width, height)):
+            image.paste(border_color, box)
+    
+    if r:
+        outer, inner = _corner_masks(r, bw)
+        for x, y, transpose in ((0, 0, None), (width - r, 0, Image.FLIP_LEFT_RIGHT),
+                                (0, height - r, Image.FLIP_TOP_BOTTOM), (width - r, height - r, Image.ROTATE_180)):
+            box = (x, y, x + r, y + r)
+            corner = Image.new('RGB', (r, r), outside)
+            outer_mask = outer.transpose(transpose) if transpose is not None else outer
+            inner_mask = inner.transpose(transpose) if transpose is not None else inner
+            if bw:
+                corner.paste(border_color, (0, 0, r, r), outer_mask)
+            corner.paste(image.crop(box), (0, 0), inner_mask)
+            image.paste(corner, box)
+    
+    return header + image.tobytes()
+
+@lru_cache(maxsize=64)
+def _corner_masks(radius: int, border_width: int) -> Tuple[Image.Image, Image.Image]:
+    """Anti-aliased top-left corner coverage of the outer edge and of the area inside the border"""
+    outer = _quarter_circle(radius)
+    if not border_width:
+        return outer, outer
+    
+    inner = Image.new('L', (radius, radius), 0)
+    if radius > border_width:
+        inner.paste(_quarter_circle(radius - border_width), (border_width, border_width))
+    return outer, inner
+
+def _quarter_circle(radius: int) -> Image.Image:
+    """Top-left quarter of a circle, supersampled and scaled down"""
+    size = 2 * radius * CORNER_SUPERSAMPLE
+    image = Image.new('L', (size, size), 0)
+    ImageDraw.Draw(image).ellipse((0, 0, size - 1, size - 1), fill=255)
+    quarter = radius * CORNER_SUPERSAMPLE
+    return image.crop((0, 0, quarter, quarter)).resize((radius, radius), Image.LANCZOS)
+
+class BackgroundLayerManager:
+    """Owns each widget's single background image; radius, border and gradient are parts of it"""
+    
+    # Plain layers up to this many pixels keep re-rendering every frame while the
+    # window is being dragged; larger or gradient layers go flat until it settles
+    live_resize_pixels = 200 * 1000
+    
+    def __init__(self):
+        self.widgets = {}  # {widget: entry}
+        self.pending = {}  # {widget: (width, height)} waiting for the next frame
+    
+    def update(self, widget, style: Optional[Dict[str, Any]] = None, **parts):
+        """Change parts of a widget's layer (radius, border, gradient); an empty layer is removed"""
+        entry = self.widgets.get(widget)
+        current = dict(entry['parts']) if entry else {'radius': 0, 'border': None, 'gradient': None}
+        current.update(parts)
+        if not current['radius'] and not current['border'] and not current['gradient']:
+            self.remove(widget)
+            return
+        
+        tk_widget = widget.tk_widget
+        if entry is None:
+            if isinstance(tk_widget, (tk.Label, tk.Button)):
+                mode = 'image'
+            elif isinstance(tk_widget, tk.Frame):
+                mode = 'backdrop'
+            elif isinstance(tk_widget, tk.Canvas):
+                mode = 'canvas'
+            else:
+                # Entries, text areas and lists draw their own content edge to edge and
+                # have no image slot; a gradient falls back to its first stop as a flat fill
+                if current['gradient']:
+                    tk_widget.configure(bg='#%02x%02x%02x' % current['gradient'][1][0][1])
+                return
+            entry = self._create(widget, mode)
+            self.widgets[widget] = entry
+        
+        entry['parts'] = current
+        if style is not None:
+            entry['style'] = style
+        
+        # The image is the background and border; the basic style pass sets
+        # Tk's own border and padding again on every restyle, so reset them each time
+        if entry['mode'] == 'image':
+            # A restyle may also have changed the font
+            self._pin(entry, tk_widget)
+        else:
+            tk_widget.configure(bd=0, highlightthickness=0)
+        
+        spec = self._spec(tk_widget, current, entry['style'])
+        if entry['spec'] == spec:
+            return
+        entry['spec'] = spec
+        entry['size'] = None
+        
+        width, height = tk_widget.winfo_width(), tk_widget.winfo_height()
+        if width > 1 and height > 1:
+            self._queue(widget, (width, height))
+    
+    def _spec(self, tk_widget, parts: Dict[str, Any], style: Dict[str, Any]) -> tuple:
+        """Everything the rendered image depends on except its size"""
+        # Scale with the display so corners stay equally round on high-DPI screens
+        scale = tk_widget.winfo_fpixels('1i') / 96.0
+        fill = self._to_rgb(tk_widget, style.get('bg') or tk_widget.cget('bg'))
+        
+        border = parts['border']
+        if border:
+            border_width, border_color = border.get('width', 1), border.get('color', '#000000')
+        elif parts['radius']:
+            border_width, border_color = style.get('border_width', 0), style.get('border_color')
+        else:
+            border_width, border_color = 0, None
+        
+        radius = int(round(parts['radius'] * scale))
+        return (fill, parts['gradient'], radius, int(round(border_width * scale)),
+                self._to_rgb(tk_widget, border_color) if border_color else fill,
+                self._to_rgb(tk_widget, self._parent_bg(tk_widget)))
+    
+    def _create(self, widget, mode: str) -> Dict[str, Any]:
+        """Set up the image holder and its single Configure binding"""
+        tk_widget = widget.tk_widget
+        entry = {'mode': mode, 'parts': None, 'style': {}, 'spec': None, 'size': None,
+                 'key': None, 'deferred': None, 'rendering': None, 'holder': tk_widget}
+        
+        if mode == 'image':
+            entry['saved'] = {option: tk_widget.cget(option)
+                              for option in ('bd', 'highlightthickness', 'padx', 'pady', 'width', 'height', 'compound')}
+            # Width and height count characters until the label shows an image; a
+            # placeholder makes the pixel size pinned in _pin() mean pixels right away
+            entry['placeholder'] = tk.PhotoImage(master=tk_widget, width=1, height=1)
+            tk_widget.configure(image=entry['placeholder'], compound='center')
+        elif mode == 'canvas':
+            # An image item below every other item; the border and focus ring would offset it
+            entry['saved'] = {option: tk_widget.cget(option) for option in ('bd', 'highlightthickness')}
+            entry['item'] = tk_widget.create_image(0, 0, anchor='nw', tags=CANVAS_TAG)
+            tk_widget.tag_lower(entry['item'])
+        else:
+            # One lowered label behind the frame's children carries the whole layer
+            entry['saved'] = {option: tk_widget.cget(option) for option in ('bd', 'highlightthickness')}
+            holder = tk.Label(tk_widget, bd=0, highlightthickness=0, padx=0, pady=0)
+            holder.place(x=0, y=0, relwidth=1, relheight=1)
+            holder.lower()
+            entry['holder'] = holder
+        
+        entry['funcid'] = tk_widget.bind('<Configure>', lambda e: self._on_configure(widget, e), add='+')
+        entry['destroy_funcid'] = tk_widget.bind('<Destroy>', lambda e: self._on_destroy(widget, e), add='+')
+        return entry
+    
+    def _pin(self, entry: Dict[str, Any], tk_widget):
+        """Measure the content as it is without the layer, then pin that size so a larger image never grows the widget"""
+        image = tk_widget.cget('image') or entry['placeholder']
+        # One configure each way: the label computes its requested size synchronously in between
+        tk_widget.configure(image='', **entry['saved'])
+        entry['natural'] = (tk_widget.winfo_reqwidth(), tk_widget.winfo_reqheight())
+        tk_widget.configure(image=image, compound='center', bd=0, highlightthickness=0, padx=0, pady=0,
+                            width=entry['natural'][0], height=entry['natural'][1])
+    
+    def remeasure(self, widget):
+        """Re-pin an image-mode widget's size after its text or font changed"""
+        entry = self.widgets.get(widget)
+        if entry is None or entry['mode'] != 'image':
+            return
+        try:
+            self._pin(entry, widget.tk_widget)
+        except tk.TclError:
+            pass
+    
+    def _on_destroy(self, widget, event):
+        """Destroying an ancestor never calls destroy() on the wrapper; drop the entry and its pinned image anyway"""
+        if event.widget is widget.tk_widget:
+            self.remove(widget)
+    
+    def _on_configure(self, widget, event):
+        """Render the new size, or defer it while the user is dragging the window edge"""
+        entry = self.widgets.get(widget)
+        if entry is None:
+            return
+        
+        size = (event.width, event.height)
+        clock = FrameClock.for_widget(widget)
+        rendered = entry['size'] is not None or entry['deferred'] is not None
+        if clock.resizing and rendered and \
+                (entry['spec'][1] is not None or size[0] * size[1] > self.live_resize_pixels):
+            if entry['deferred'] is None:
+                self._show_flat(entry)
+            entry['deferred'] = size
+            clock.add_resize_end_handler(self._on_resize_end)
+            return
+        
+        self._queue(widget, size)
+    
+    def _show_flat(self, entry: Dict[str, Any]):
+        """Cheap stand-in during a drag: a backdrop shows its flat fill, an image keeps the last render"""
+        if entry['mode'] == 'backdrop':
+            fill, gradient = entry['spec'][:2]
+            if gradient is not None:
+                fill = gradient[1][0][1]
+            try:
+                entry['holder'].configure(image='', bg='#%02x%02x%02x' % fill)
+            except tk.TclError:
+                pass
+            entry['size'] = None
+    
+    @staticmethod
+    def _show(entry: Dict[str, Any], photo: tk.PhotoImage):
+        """Put a rendered layer in the widget's image slot"""
+        if entry['mode'] == 'canvas':
+            canvas = entry['holder']
+            if not canvas.find_withtag(entry['item']):
+                # Deleted along with everything else by a plain delete('all')
+                entry['item'] = canvas.create_image(0, 0, anchor='nw', tags=CANVAS_TAG)
+                canvas.tag_lower(entry['item'])
+            canvas.itemconfigure(entry['item'], image=photo)
+        else:
+            entry['holder'].configure(image=photo)
+    
+    def _on_resize_end(self):
+        """Render every layer deferred during the drag at its final size"""
+        for widget, entry in list(self.widgets.items()):
+            if entry['deferred'] is not None:
+                size, entry['deferred'] = entry['deferred'], None
+                self._queue(widget, size)
+    
+    def _queue(self, widget, size: Tuple[int, int]):
+        """Render on the next frame"""
+        first = not self.pending
+        self.pending[widget] = size
+        if first:
+            FrameClock.for_widget(widget).add(self, self._flush)
+    
+    def _flush(self, now: float) -> bool:
+        """Render every layer whose size or parts changed since the last frame"""
+        pending, self.pending = self.pending, {}
+        for widget, (width, height) in pending.items():
+            entry = self.widgets.get(widget)
+            if entry is None or entry['spec'] is None or entry['size'] == (width, height) or width <= 1 or height <= 1:
+                continue
+            
+            spec = entry['spec']
+            key = ('background', width, height) + spec
+            if spec[1] is not None and key not in image_cache and width * height >= render_pool.min_pixels:
+                # Large gradient: render in the pool, show the flat fill meanwhile
+                if entry['rendering'] != key:
+                    entry['rendering'] = key
+                    self._show_flat(entry)
+                    render_pool.submit(widget, key, render_background, (width, height) + spec,
+                                       lambda data, widget=widget, key=key: self._rendered(widget, key, data))
+                continue
+            
+            master = widget.tk_widget
+            if spec[1] is None:
+                factory = lambda: self._assemble(master, width, height, spec)
+            else:
+                factory = lambda: tk.PhotoImage(master=master, data=render_background(width, height, *spec), format='ppm')
+            try:
+                # Pinned while shown; equally sized, equally styled widgets share it
+                photo = image_cache.acquire(key, factory)
+                image_cache.release(entry['key'])
+                entry['key'] = key
+                self._show(entry, photo)
+            except tk.TclError:
+                self.remove(widget)
+                continue
+            entry['rendering'] = None
+            entry['size'] = (width, height)
+        return False
+    
+    @staticmethod
+    def _assemble(master, width: int, height: int, spec: tuple) -> tk.PhotoImage:
+        """Nine-slice a layer without a gradient: Tk fills for the middle and edges, cached corner tiles copied in"""
+        fill, _, radius, border_width, border_color, outside = spec
+        r = min(radius, width // 2, height // 2)
+        bw = min(border_width, width // 2, height // 2)
+        
+        photo = tk.PhotoImage(master=master, width=width, height=height)
+        photo.put('#%02x%02x%02x' % fill, to=(0, 0, width, height))
+        if bw:
+            border = '#%02x%02x%02x' % border_color
+            for box in ((0, 0, width, bw), (0, height - bw, width, height), (0, 0, bw, height), (width - bw, 0, width, height)):
+                photo.put(border, to=box)
+        
+        if r:
+            # The four corners of a 2r x 2r layer, rasterized once per radius, border and colors
+            tiles = image_cache.get(('background-corners', r, bw, fill, border_color, outside), lambda: tk.PhotoImage(
+                master=master, data=render_background(2 * r, 2 * r, fill, None, r, bw, border_color, outside), format='ppm'))
+            for x, y in ((0, 0), (r, 0), (0, r), (r, r)):
+                photo.tk.call(photo, 'copy', tiles, '-from', x, y, x + r, y + r,
+                              '-to', 0 if x == 0 else width - r, 0 if y == 0 else height - r)
+        return photo
+    
+    def _rendered(self, widget, key: tuple, data: bytes):
+        """Pool result: show it if the widget still wants that size, pinned from the start"""
+        entry = self.widgets.get(widget)
+        if entry is None or entry['rendering'] != key:
+            return
+        entry['rendering'] = None
+        try:
+            # An unpinned entry could be evicted before it is shown when pinned images fill the budget
+            photo = image_cache.acquire(key, lambda: tk.PhotoImage(master=widget.tk_widget, data=data, format='ppm'))
+            image_cache.release(entry['key'])
+            entry['key'] = key
+            self._show(entry, photo)
+        except tk.TclError:
+            return
+        entry['size'] = key[1:3]
+    
+    def remove(self, widget):
+        """Drop the layer and restore the widget's own background and border"""
+        entry = self.widgets.pop(widget, None)
+        self.pending.pop(widget, None)
+        if entry is None:
+            return
+        
+        tk_widget = widget.tk_widget
+        unbind_tk_handler(tk_widget, '<Configure>', entry['funcid'])
+        unbind_tk_handler(tk_widget, '<Destroy>', entry['destroy_funcid'])
+        image_cache.release(entry['key'])
+        try:
+            if entry['mode'] == 'image':
+                tk_widget.configure(image='', **entry['saved'])
+            elif entry['mode'] == 'canvas':
+                tk_widget.delete(entry['item'])
+                tk_widget.configure(**entry['saved'])
+            else:
+                entry['holder'].destroy()
+                tk_widget.configure(**entry['saved'])
+        except tk.TclError:
+            pass
+    
+    @staticmethod
+    def _parent_bg(tk_widget) -> str:
+        """Background of the surface around the widget"""
+        try:
+            return tk_widget.master.cget('bg')
+        except (tk.TclError, AttributeError):
+            return '#ffffff'
+    
+    @staticmethod
+    def _to_rgb(tk_widget, color: str) -> RGB:
+        """Resolve any Tk color to an RGB tuple"""
+        try:
+            r, g, b = tk_widget.winfo_rgb(color)
+        except tk.TclError:
+            return (255, 255, 255)
+        return (r >> 8, g >> 8, b >> 8)
+
+# Global background layer manager instance
+background_manager = BackgroundLayerManager()
\ No newline at end of file
@@ -1,15 +1,12 @@
 """Border effects implementation"""
 
-import tkinter as tk
 from typing import Dict, Any, Union
 
+from src.effects.background import background_manager
+
 class BorderEffect:
     """Handles border effects for widgets"""
     
-    def __init__(self):
-        self.border_widgets = {}
-        self.radius_widgets = {}
-    
     def apply(self, widget, border_config: Union[bool, Dict[str, Any]]):
         """Apply border effect to a widget"""
         if isinstance(border_config, bool) and not border_config:
@@ -20,70 +17,23 @@ class BorderEffect:
         config = {
             'width': 1,
             'color': '#000000',
-            'style': 'solid'  # solid, dashed, dotted
+            'style': 'solid'  # only solid borders can be drawn into the background layer
         }
         
         if isinstance(border_config, dict):
             config.update(border_config)
         
-        self._create_border(widget, config)
+        # Drawn into the widget's composited background layer instead of four helper frames
+        background_manager.update(widget, border={'width': config['width'], 'color': config['color']})
     
-    def apply_radius(self, widget, radius: int):
+    def apply_radius(self, widget, radius: int, style: Dict[str, Any] = None):
         """Apply border radius effect to a widget"""
-        # For tkinter, border radius is simulated using a canvas
-        # This is a simplified implementation
-        
-        # Store radius reference
-        self.radius_widgets[widget] = radius
-        
-        # For a basic implementation, we'll just set a relief style
-        # A full implementation would use a canvas to create rounded corners
-        try:
-            widget.tk_widget.configure(relief='flat')
-        except:
-            pass
+        background_manager.update(widget, style or {}, radius=max(0, radius))
     
-    def _create_border(self, widget, config: Dict[str, Any]):
-        """Create border for widget"""
-        # For tkinter, we'll simulate borders using frames around the widget
-        parent = widget.tk_widget.master
-        
-        # Store border references
-        if widget not in self.border_widgets:
-            self.border_widgets[widget] = []
-        
-        # Remove existing borders first
-        self.remove(widget)
-        
-        width = config['width']
-        color = config['color']
-        
-        # Create frames for each side of the border
-        # Top border
-        top_border = tk.Frame(parent, bg=color, height=width)
-        self.border_widgets[widget].append(top_border)
-        
-        # Bottom border
-        bottom_border = tk.Frame(parent, bg=color, height=width)
-        self.border_widgets[widget].append(bottom_border)
-        
-        # Left border
-        left_border = tk.Frame(parent, bg=color, width=width)
-        self.border_widgets[widget].append(left_border)
-        
-        # Right border
-        right_border = tk.Frame(parent, bg=color, width=width)
-        self.border_widgets[widget].append(right_border)
-        
-        # Note: Full implementation would need more sophisticated positioning
-        # This is a simplified version for demonstration
+    def remove_radius(self, widget):
+        """Drop rounded corners from a widget"""
+        background_manager.update(widget, radius=0)
     
     def remove(self, widget):
-        """Remove border from widget"""
-        if widget in self.border_widgets:
-            for border in self.border_widgets[widget]:
-                border.destroy()
-            del self.border_widgets[widget]
-        
-        if widget in self.radius_widgets:
-            del self.radius_widgets[widget]
\ No newline at end of file
+        """Remove border and rounded corners from widget"""
+        background_manager.update(widget, border=None, radius=0)
\ No newline at end of file
@@ -1,14 +1,144 @@
 """Gradient effects implementation"""
 
-import tkinter as tk
-from typing import Dict, Any, Union, List
+import math
+from typing import Dict, Any, Union, List, Tuple
+
+from PIL import Image
+
+from src.utils.colors import ColorUtils
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Entries in the color lookup table that gradient positions are quantized to
+RAMP_SIZE = 1024
+
+# Largest side rendered by the pure-Python fallback before upscaling
+FALLBACK_MAX_SIDE = 128
+
+Stops = Tuple[Tuple[float, Tuple[int, int, int]], ...]
+
+def normalize_stops(colors: List[Any], tk_widget=None) -> Stops:
+    """Turn ['#fff', '#000'] or [(0.0, '#fff'), (0.3, 'red'), ...] into sorted (offset, rgb) stops"""
+    stops = []
+    count = len(colors)
+    for i, stop in enumerate(colors):
+        if isinstance(stop, (tuple, list)) and len(stop) == 2 and isinstance(stop[0], (int, float)):
+            offset, color = stop
+        else:
+            offset, color = (i / (count - 1) if count > 1 else 0.0), stop
+        stops.append((min(1.0, max(0.0, float(offset))), _to_rgb(color, tk_widget)))
+    stops.sort(key=lambda s: s[0])
+    return tuple(stops)
+
+def _to_rgb(color: Union[str, tuple], tk_widget=None) -> Tuple[int, int, int]:
+    """Parse a hex, named or RGB-tuple color"""
+    if isinstance(color, tuple):
+        return tuple(int(c) for c in color[:3])
+    try:
+        return ColorUtils.parse_hex(color)
+    except ValueError:
+        if tk_widget is None:
+            raise
+        r, g, b = tk_widget.winfo_rgb(color)
+        return (r >> 8, g >> 8, b >> 8)
+
+def gradient_angle(direction: Union[str, int, float]) -> float:
+    """CSS angle in degrees: 0 points up, 90 right, 180 down"""
+    if direction == 'vertical':
+        return 180.0
+    if direction == 'horizontal':
+        return 90.0
+    return float(direction)
+
+def _ramp(stops: Stops) -> List[Tuple[int, int, int]]:
+    """Colors at RAMP_SIZE evenly spaced positions"""
+    ramp = []
+    index = 0
+    for i in range(RAMP_SIZE):
+        t = i / (RAMP_SIZE - 1)
+        while index < len(stops) - 2 and t > stops[index + 1][0]:
+            index += 1
+        (t0, c0), (t1, c1) = stops[index], stops[min(index + 1, len(stops) - 1)]
+        f = 0.0 if t1 <= t0 else min(1.0, max(0.0, (t - t0) / (t1 - t0)))
+        ramp.append(tuple(int(round(a + (b - a) * f)) for a, b in zip(c0, c1)))
+    return ramp
+
+def render_gradient(width: int, height: int, gradient_type: str, stops: Stops, angle: float = 180.0) -> bytes:
+    """Render a gradient as binary PPM data for a single PhotoImage(data=...) call"""
+    return b'P6 %d %d 255\n' % (width, height) + gradient_pixels(width, height, gradient_type, stops, angle)
+
+def gradient_pixels(width: int, height: int, gradient_type: str, stops: Stops, angle: float = 180.0) -> bytes:
+    """Render a gradient as raw RGB rows"""
+    if len(stops) == 1:
+        return bytes(stops[0][1]) * (width * height)
+    if np is not None:
+        return _render_numpy(width, height, gradient_type, stops, angle)
+    return _render_python(width, height, gradient_type, stops, angle)
+
+def _render_numpy(width: int, height: int, gradient_type: str, stops: Stops, angle: float) -> bytes:
+    """Vectorized renderer: position field -> ramp index -> RGB buffer"""
+    ramp = np.array(_ramp(stops), dtype=np.uint8)
+    x = (np.arange(width, dtype=np.float32) + 0.5) - width / 2.0
+    y = (np.arange(height, dtype=np.float32) + 0.5) - height / 2.0
+    
+    if gradient_type == 'radial':
+        # Ellipse reaching the farthest corner, as CSS radial-gradient() defaults to
+        dx = (x / (width / 2.0)) ** 2
+        dy = (y / (height / 2.0)) ** 2
+        t = np.sqrt(dx[np.newaxis, :] + dy[:, np.newaxis]) / math.sqrt(2.0)
+    else:
+        rad = math.radians(angle)
+        sx, sy = math.sin(rad), -math.cos(rad)
+        if abs(sx) < 1e-9 or abs(sy) < 1e-9:
+            # Axis-aligned: one row or column of colors, repeated across the image
+            line = x * (1 if sx > 0 else -1) / width if abs(sy) < 1e-9 else y * (1 if sy > 0 else -1) / height
+            colors = np.take(ramp, _ramp_index(line + 0.5), axis=0)
+            if abs(sy) < 1e-9:
+                return np.tile(colors, (height, 1)).tobytes()
+            return np.repeat(colors, width, axis=0).tobytes()
+        length = abs(width * sx) + abs(height * sy)
+        t = (x[np.newaxis, :] * sx + y[:, np.newaxis] * sy) / length + 0.5
+    
+    # take() is several times faster than fancy indexing for a 2-D index
+    return np.take(ramp, _ramp_index(t), axis=0).tobytes()
+
+def _ramp_index(t):
+    """Quantize positions in [0, 1] to ramp entries"""
+    return np.clip(t * (RAMP_SIZE - 1) + 0.5, 0, RAMP_SIZE - 1).astype(np.intp)
+
+def _render_python(width: int, height: int, gradient_type: str, stops: Stops, angle: float) -> bytes:
+    """Fallback without NumPy: render small, then let PIL upscale the smooth result"""
+    scale = min(1.0, FALLBACK_MAX_SIDE / max(width, height))
+    small_w, small_h = max(1, int(width * scale)), max(1, int(height * scale))
+    ramp = [bytes(c) for c in _ramp(stops)]
+    top = RAMP_SIZE - 1
+    
+    rows = []
+    if gradient_type == 'radial':
+        for j in range(small_h):
+            dy = ((j + 0.5) / small_h * 2 - 1) ** 2
+            rows.append(b''.join(ramp[min(top, int(math.sqrt(((i + 0.5) / small_w * 2 - 1) ** 2 + dy) / math.sqrt(2.0) * top + 0.5))]
+                                 for i in range(small_w)))
+    else:
+        rad = math.radians(angle)
+        sx, sy = math.sin(rad), -math.cos(rad)
+        length = abs(width * sx) + abs(height * sy) or 1.0
+        for j in range(small_h):
+            y = ((j + 0.5) / small_h - 0.5) * height
+            rows.append(b''.join(ramp[min(top, max(0, int((((i + 0.5) / small_w - 0.5) * width * sx + y * sy) / length * top + top / 2 + 0.5)))]
+                                 for i in range(small_w)))
+    
+    image = Image.frombytes('RGB', (small_w, small_h), b''.join(rows))
+    if (small_w, small_h) != (width, height):
+        image = image.resize((width, height), Image.BILINEAR)
+    return image.tobytes()
 
 class GradientEffect:
     """Handles gradient effects for widgets"""
     
-    def __init__(self):
-        self.gradient_widgets = {}
-    
     def apply(self, widget, gradient_config: Union[bool, Dict[str, Any]]):
         """Apply gradient effect to a widget"""
         if isinstance(gradient_config, bool) and not gradient_config:
@@ -18,40 +148,23 @@ class GradientEffect:
         # Default gradient config
         config = {
             'type': 'linear',  # linear or radial
-            'colors': ['#ffffff', '#000000'],
-            'direction': 'vertical'  # vertical, horizontal, or angle for linear
+            'colors': ['#ffffff', '#000000'],  # colors, or (offset, color) stops
+            'direction': 'vertical'  # vertical, horizontal, or angle in degrees for linear
         }
         
         if isinstance(gradient_config, dict):
             config.update(gradient_config)
         
-        self._create_gradient(widget, config)
-    
-    def _create_gradient(self, widget, config: Dict[str, Any]):
-        """Create gradient effect for widget"""
-        # For tkinter, we'll simulate gradients using canvas or color blending
-        # This is a simplified implementation
-        
-        parent = widget.tk_widget.master
-        
-        # Store gradient reference
-        self.gradient_widgets[widget] = {
-            'type': config['type'],
-            'colors': config['colors'],
-            'direction': config['direction']
-        }
-        
-        # For a basic implementation, we'll just set the background color
-        # to the first color in the gradient
-        if config['colors']:
-            widget.tk_widget.configure(bg=config['colors'][0])
+        if not config['colors']:
+            return
         
-        # Note: Full implementation would need more sophisticated graphics
-        # This is a simplified version for demonstration
+        # Drawn as the base of the widget's composited background layer
+        from src.effects.background import background_manager
+        tk_widget = widget.tk_widget
+        gradient = (config['type'], normalize_stops(config['colors'], tk_widget), gradient_angle(config['direction']))
+        background_manager.update(widget, gradient=gradient)
     
     def remove(self, widget):
         """Remove gradient from widget"""
-        if widget in self.gradient_widgets:
-            # Reset to default background
-            widget.tk_widget.configure(bg='')
-            del self.gradient_widgets[widget]
\ No newline at end of file
+        from src.effects.background import background_manager
+        background_manager.update(widget, gradient=None)
\ No newline at end of file
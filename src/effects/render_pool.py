@@ -0,0 +1,90 @@
+"""Off-thread rasterization of heavy effect images"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from src.core.dispatcher import UIDispatcher
+
+class RenderPool:
+    """Runs pixel-producing jobs in a worker pool; identical keys share one computation"""
+    
+    # Images smaller than this are cheaper to render inline than to hand off
+    min_pixels = 250 * 1000
+    
+    def __init__(self, max_workers: int = 2, use_processes: bool = False):
+        self.max_workers = max_workers
+        self.use_processes = use_processes  # PIL and NumPy release the GIL, so threads are the default
+        self.jobs = {}  # {key: [callback(data)]}, only touched on the Tk thread
+        self._executor = None
+        self.stats = {
+            'submitted': 0,
+            'deduplicated': 0,
+            'completed': 0,
+            'errors': 0
+        }
+    
+    def _get_executor(self):
+        """Start the worker pool on first use"""
+        if self._executor is None:
+            executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            self._executor = executor_class(max_workers=self.max_workers)
+        return self._executor
+    
+    def submit(self, widget, key: Hashable, func: Callable[..., bytes], args: tuple,
+               callback: Callable[[bytes], None]):
+        """Run func(*args) in the pool and call callback(data) on the widget's Tk thread"""
+        waiting = self.jobs.get(key)
+        if waiting is not None:
+            waiting.append(callback)
+            self.stats['deduplicated'] += 1
+            return
+        
+        self.jobs[key] = [callback]
+        self.stats['submitted'] += 1
+        dispatcher = UIDispatcher.for_widget(widget)
+        future = self._get_executor().submit(func, *args)
+        # Runs on the worker thread; the dispatcher hands the result to the Tk thread
+        future.add_done_callback(lambda f: dispatcher.post(self._finish, key, f))
+    
+    def is_pending(self, key: Hashable) -> bool:
+        """Whether a job for key is still running"""
+        return key in self.jobs
+    
+    def _finish(self, key: Hashable, future):
+        """Deliver a finished job to everyone waiting for it"""
+        callbacks = self.jobs.pop(key, [])
+        try:
+            data = future.result()
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"Error rendering {key[0] if isinstance(key, tuple) else key}: {e}")
+            return
+        
+        self.stats['completed'] += 1
+        for callback in callbacks:
+            try:
+                callback(data)
+            except Exception as e:
+                print(f"Error applying rendered image: {e}")
+    
+    def set_workers(self, max_workers: int, use_processes: Optional[bool] = None):
+        """Change the pool size or kind; running jobs finish on the old pool"""
+        self.max_workers = max_workers
+        if use_processes is not None:
+            self.use_processes = use_processes
+        self.shutdown()
+    
+    def shutdown(self):
+        """Stop the workers; a new pool is started by the next submit"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool counters"""
+        stats = dict(self.stats)
+        stats['pending'] = len(self.jobs)
+        return stats
+
+# Global render pool instance
+render_pool = RenderPool()
\ No newline at end of file
@@ -1,13 +1,220 @@
 """Shadow effects implementation"""
 
+import math
 import tkinter as tk
-from typing import Dict, Any, Union
+from typing import Dict, Any, Union, Tuple
 
-class ShadowEffect:
-    """Handles shadow effects for widgets"""
+from PIL import Image, ImageFilter
+
+from src.core.event_manager import unbind_tk_handler
+from src.utils.frame_clock import FrameClock
+from src.utils.image_cache import image_cache
+from .render_pool import render_pool
+
+def render_shadow(width: int, height: int, blur: float, color: Tuple[int, int, int, int],
+                  background: Tuple[int, int, int]) -> bytes:
+    """Blur a box and composite it over the background color, as binary PPM data"""
+    margin = shadow_margin(blur)
+    size = (width + 2 * margin, height + 2 * margin)
+    
+    # Tk has no alpha, so the shadow is pre-blended with what is behind it
+    mask = Image.new('L', size, 0)
+    mask.paste(color[3], (margin, margin, margin + width, margin + height))
+    if blur > 0:
+        mask = mask.filter(ImageFilter.GaussianBlur(blur))
+    
+    image = Image.composite(Image.new('RGB', size, color[:3]), Image.new('RGB', size, background), mask)
+    return b'P6 %d %d 255\n' % size + image.tobytes()
+
+def shadow_margin(blur: float) -> int:
+    """Pixels a shadow of the given blur extends past its box"""
+    return int(math.ceil(blur * 2))
+
+class ShadowManager:
+    """Owns every widget shadow: one <Configure> binding each, repositioned at most once per frame"""
     
     def __init__(self):
-        self.shadow_widgets = {}
+        self.shadows = {}  # {widget: {'label', 'config', 'funcid', 'key', 'placed'}}
+        self.pending = {}  # {widget: (x, y, width, height)} waiting for the next frame
+    
+    def apply(self, widget, config: Dict[str, Any]):
+        """Show or update a widget's shadow; re-applying the same config is a no-op"""
+        entry = self.shadows.get(widget)
+        if entry is not None:
+            if entry['config'] == config:
+                return
+            entry['config'] = config
+            entry['placed'] = None
+        else:
+            tk_widget = widget.tk_widget
+            # The blurred image is shown by a borderless label behind the widget
+            label = tk.Label(tk_widget.master, bd=0, highlightthickness=0, padx=0, pady=0)
+            label.lower(tk_widget)
+            funcid = tk_widget.bind('<Configure>', lambda e: self._on_configure(widget, e), add='+')
+            destroy_funcid = tk_widget.bind('<Destroy>', lambda e: self._on_destroy(widget, e), add='+')
+            entry = {'label': label, 'config': config, 'funcid': funcid, 'destroy_funcid': destroy_funcid,
+                     'key': None, 'placed': None, 'deferred': None, 'rendering': None}
+            self.shadows[widget] = entry
+        
+        # Already laid out widgets get no Configure event, so read the current
+        # geometry once; it is only as fresh as the last layout pass
+        tk_widget = widget.tk_widget
+        width, height = tk_widget.winfo_width(), tk_widget.winfo_height()
+        if width > 1 and height > 1:
+            self._queue(widget, (tk_widget.winfo_x(), tk_widget.winfo_y(), width, height))
+    
+    def _on_configure(self, widget, event):
+        """Record the new geometry carried by the event"""
+        self._queue(widget, (event.x, event.y, event.width, event.height))
+    
+    def _on_destroy(self, widget, event):
+        """Destroying an ancestor never calls destroy() on the wrapper; drop the entry and its pinned image anyway"""
+        if event.widget is widget.tk_widget:
+            self.remove(widget)
+    
+    def _queue(self, widget, geometry: Tuple[int, int, int, int]):
+        """Reposition on the next frame"""
+        first = not self.pending
+        self.pending[widget] = geometry
+        if first:
+            FrameClock.for_widget(widget).add(self, self._flush)
+    
+    def _flush(self, now: float) -> bool:
+        """Place every shadow whose widget moved or resized since the last frame"""
+        pending, self.pending = self.pending, {}
+        for widget, geometry in pending.items():
+            entry = self.shadows.get(widget)
+            if entry is not None:
+                try:
+                    self._place(widget, entry, geometry)
+                except tk.TclError:
+                    # Widget destroyed in the meantime
+                    self.remove(widget)
+        return False
+    
+    def _place(self, widget, entry: Dict[str, Any], geometry: Tuple[int, int, int, int]):
+        """Render (or fetch from cache) and position one shadow"""
+        x, y, width, height = geometry
+        if width <= 1 or height <= 1:
+            return
+        entry['geometry'] = geometry  # latest, for work finishing later
+        
+        config = entry['config']
+        tk_widget = widget.tk_widget
+        blur = config['blur']
+        x_offset, y_offset = config['offset']
+        margin = shadow_margin(blur)
+        
+        color = self._parse_color(tk_widget, config)
+        background = self._parent_background(tk_widget)
+        key = ('shadow', width, height, blur, color, background)
+        position = (x + x_offset - margin, y + y_offset - margin)
+        if entry['placed'] == (key, position):
+            return
+        
+        placed = entry['placed']
+        if placed is not None and placed[0][1:3] != (width, height):
+            clock = FrameClock.for_widget(widget)
+            if clock.resizing:
+                # Mid-drag: carry the last image along and blur the final size once it settles
+                entry['deferred'] = geometry
+                clock.add_resize_end_handler(self._on_resize_end)
+                key = placed[0]
+                if placed == (key, position):
+                    return
+        
+        if key not in image_cache and (width + 2 * margin) * (height + 2 * margin) >= render_pool.min_pixels:
+            # Large blur: render in the pool; the previous image (if any) keeps following the widget
+            if entry['rendering'] != key:
+                entry['rendering'] = key
+                render_pool.submit(widget, key, render_shadow, (width, height, blur, color, background),
+                                   lambda data: self._rendered(widget, key, data))
+            if placed is None:
+                return
+            key = placed[0]
+            if placed == (key, position):
+                return
+        
+        label = entry['label']
+        if entry['key'] != key:
+            # Equally sized cards share one image; it stays pinned while shown
+            photo = image_cache.acquire(key, lambda: tk.PhotoImage(
+                master=tk_widget, data=render_shadow(width, height, blur, color, background), format='ppm'))
+            image_cache.release(entry['key'])
+            entry['key'] = key
+            label.configure(image=photo)
+        label.place(x=position[0], y=position[1])
+        entry['placed'] = (key, position)
+    
+    def _rendered(self, widget, key: tuple, data: bytes):
+        """Pool result: show it if the widget still wants it, pinned from the start"""
+        entry = self.shadows.get(widget)
+        if entry is None or entry['rendering'] != key:
+            return
+        entry['rendering'] = None
+        try:
+            # An unpinned entry could be evicted before _place() sees it, and be submitted again
+            photo = image_cache.acquire(key, lambda: tk.PhotoImage(master=widget.tk_widget, data=data, format='ppm'))
+            image_cache.release(entry['key'])
+            entry['key'] = key
+            entry['label'].configure(image=photo)
+        except tk.TclError:
+            return
+        self._queue(widget, entry['geometry'])
+    
+    def _on_resize_end(self):
+        """Render the shadows deferred during an interactive resize"""
+        for widget, entry in list(self.shadows.items()):
+            if entry['deferred'] is not None:
+                geometry, entry['deferred'] = entry['deferred'], None
+                self._queue(widget, geometry)
+    
+    @staticmethod
+    def _parse_color(tk_widget, config: Dict[str, Any]) -> Tuple[int, int, int, int]:
+        """Shadow color as RGBA; #RRGGBBAA carries its own alpha, otherwise 'opacity' is used"""
+        color = config['color']
+        alpha = int(config.get('opacity', 0.25) * 255)
+        if isinstance(color, str) and color.startswith('#') and len(color) == 9:
+            alpha = int(color[7:9], 16)
+            color = color[:7]
+        
+        try:
+            r, g, b = tk_widget.winfo_rgb(color)
+            return (r >> 8, g >> 8, b >> 8, alpha)
+        except tk.TclError:
+            return (0, 0, 0, alpha)
+    
+    @staticmethod
+    def _parent_background(tk_widget) -> Tuple[int, int, int]:
+        """RGB of the surface the shadow is drawn on"""
+        try:
+            r, g, b = tk_widget.winfo_rgb(tk_widget.master.cget('bg'))
+            return (r >> 8, g >> 8, b >> 8)
+        except (tk.TclError, AttributeError):
+            return (255, 255, 255)
+    
+    def remove(self, widget):
+        """Remove a widget's shadow and only its own Configure handler"""
+        entry = self.shadows.pop(widget, None)
+        self.pending.pop(widget, None)
+        if entry is None:
+            return
+        
+        unbind_tk_handler(widget.tk_widget, '<Configure>', entry['funcid'])
+        unbind_tk_handler(widget.tk_widget, '<Destroy>', entry['destroy_funcid'])
+        image_cache.release(entry['key'])
+        try:
+            entry['label'].destroy()
+        except tk.TclError:
+            pass
+    
+    def get_config(self, widget) -> Dict[str, Any]:
+        """Shadow config currently applied to a widget"""
+        entry = self.shadows.get(widget)
+        return dict(entry['config']) if entry else {}
+
+class ShadowEffect:
+    """Handles shadow effects for widgets"""
     
     def apply(self, widget, shadow_config: Union[bool, Dict[str, Any]]):
         """Apply shadow effect to a widget"""
@@ -25,83 +232,11 @@ class ShadowEffect:
         if isinstance(shadow_config, dict):
             config.update(shadow_config)
         
-        self._create_shadow(widget, config)
-    
-    def _create_shadow(self, widget, config: Dict[str, Any]):
-        """Create shadow widget"""
-        # For now, simulate shadow with a frame behind the widget
-        # In a full implementation, this would use more sophisticated graphics
-        
-        parent = widget.tk_widget.master
-        
-        # Remove existing shadow first
-        self.remove(widget)
-        
-        # Create shadow frame
-        shadow_frame = tk.Frame(
-            parent,
-            bg=config['color'],
-            highlightthickness=0,
-            bd=0
-        )
-        
-        # Position shadow frame
-        x_offset, y_offset = config['offset']
-        
-        # Get widget position and size
-        widget.tk_widget.update_idletasks()
-        x = widget.tk_widget.winfo_x()
-        y = widget.tk_widget.winfo_y()
-        width = widget.tk_widget.winfo_width()
-        height = widget.tk_widget.winfo_height()
-        
-        # Place shadow behind widget
-        shadow_frame.place(
-            x=x + x_offset,
-            y=y + y_offset,
-            width=width,
-            height=height
-        )
-        
-        # Lower the shadow below the widget
-        shadow_frame.lower(widget.tk_widget)
-        
-        # Store shadow reference
-        self.shadow_widgets[widget] = shadow_frame
-        
-        # Bind to widget events to update shadow position
-        widget.tk_widget.bind("<Configure>", lambda e: self._update_shadow_position(widget), add="+")
-    
-    def _update_shadow_position(self, widget):
-        """Update shadow position when widget moves or resizes"""
-        if widget in self.shadow_widgets:
-            shadow_frame = self.shadow_widgets[widget]
-            
-            # Get widget position and size
-            widget.tk_widget.update_idletasks()
-            x = widget.tk_widget.winfo_x()
-            y = widget.tk_widget.winfo_y()
-            width = widget.tk_widget.winfo_width()
-            height = widget.tk_widget.winfo_height()
-            
-            # Update shadow position
-            # Note: We would need to get the offset from stored config for a complete implementation
-            shadow_frame.place(
-                x=x + 2,  # Default offset
-                y=y + 2,
-                width=width,
-                height=height
-            )
+        shadow_manager.apply(widget, config)
     
     def remove(self, widget):
         """Remove shadow from widget"""
-        if widget in self.shadow_widgets:
-            shadow = self.shadow_widgets[widget]
-            shadow.destroy()
-            del self.shadow_widgets[widget]
-            
-            # Unbind events
-            try:
-                widget.tk_widget.unbind("<Configure>")
-            except:
-                pass
\ No newline at end of file
+        shadow_manager.remove(widget)
+
+# Global shadow manager instance
+shadow_manager = ShadowManager()
\ No newline at end of file
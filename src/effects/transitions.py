@@ -1,15 +1,24 @@
 """Transition effects implementation"""
 
 import tkinter as tk
-from typing import Dict, Any, Union
-import time
+from typing import Dict, Any, Union, Optional
+
+from src.utils.animations import animation_manager
+
+# Style properties that can transition, and the Tk option each one drives
+TRANSITION_OPTIONS = {
+    'bg': 'bg',
+    'fg': 'fg',
+    'border_color': 'highlightbackground'
+}
 
 class TransitionEffect:
     """Handles transition effects for widgets"""
     
-    def __init__(self):
+    def __init__(self, manager=None):
         self.transition_widgets = {}
-        self.animations = {}
+        # Transitions share the animation engine and its frame clock
+        self.manager = manager or animation_manager
     
     def apply(self, widget, transition_config: Union[bool, Dict[str, Any]]):
         """Apply transition effect to a widget"""
@@ -17,123 +26,83 @@ class TransitionEffect:
             self.remove(widget)
             return
         
+        # Store transition config
+        self.transition_widgets[widget] = self.parse_config(transition_config)
+    
+    @staticmethod
+    def parse_config(transition_config: Union[bool, int, float, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Normalize a transition style value, or None if transitions are off"""
+        if not transition_config:
+            return None
+        
         # Default transition config
         config = {
             'duration': 300,  # milliseconds
             'easing': 'linear',  # linear, ease-in, ease-out, ease-in-out
-            'properties': ['bg', 'fg']  # properties to transition
+            'properties': ['bg', 'fg'],  # properties to transition
+            'color_space': 'srgb'  # srgb, or oklab for perceptually even fades
         }
         
-        if isinstance(transition_config, dict):
+        if isinstance(transition_config, (int, float)) and not isinstance(transition_config, bool):
+            config['duration'] = transition_config
+        elif isinstance(transition_config, dict):
             config.update(transition_config)
         
-        # Store transition config
-        self.transition_widgets[widget] = config
-    
-    def animate_property(self, widget, property_name, start_value, end_value, duration, easing='linear'):
-        """Animate a property change"""
-        if widget not in self.animations:
-            self.animations[widget] = {}
-        
-        # Cancel any existing animation for this property
-        if property_name in self.animations[widget]:
-            widget.tk_widget.after_cancel(self.animations[widget][property_name])
+        if isinstance(config['properties'], str):
+            config['properties'] = [config['properties']]
         
-        # Start new animation
-        animation_id = self._run_animation(widget, property_name, start_value, end_value, duration, easing)
-        self.animations[widget][property_name] = animation_id
+        return config
     
-    def _run_animation(self, widget, property_name, start_value, end_value, duration, easing):
-        """Run property animation"""
-        start_time = time.time()
+    def transition_styles(self, widget, previous_style: Optional[Dict[str, Any]],
+                          style_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Start transitions for changed colors and return the style left to apply directly"""
+        config = self.parse_config(style_dict.get('transition'))
+        if not config or previous_style is None or config['duration'] <= 0:
+            return style_dict
         
-        def update_property():
-            current_time = time.time()
-            elapsed = (current_time - start_time) * 1000  # Convert to milliseconds
-            
-            if elapsed >= duration:
-                # Animation complete
-                try:
-                    widget.tk_widget.configure(**{property_name: end_value})
-                except:
-                    pass
-                return
-            
-            # Calculate progress (0.0 to 1.0)
-            progress = elapsed / duration
-            
-            # Apply easing function
-            if easing == 'ease-in':
-                progress = progress ** 2
-            elif easing == 'ease-out':
-                progress = 1 - (1 - progress) ** 2
-            elif easing == 'ease-in-out':
-                if progress < 0.5:
-                    progress = 2 * progress ** 2
-                else:
-                    progress = 1 - (-2 * progress + 2) ** 2 / 2
+        tk_widget = widget.tk_widget
+        held = set()   # style keys driven by a transition instead of set directly
+        animated = {}  # {tk option: (start, end)}
+        
+        for prop in config['properties']:
+            option = TRANSITION_OPTIONS.get(prop)
+            if option is None or prop not in style_dict:
+                continue
             
-            # Interpolate value
-            if isinstance(start_value, str) and start_value.startswith('#') and end_value.startswith('#'):
-                # Color interpolation
-                new_value = self._interpolate_color(start_value, end_value, progress)
-            elif isinstance(start_value, (int, float)) and isinstance(end_value, (int, float)):
-                # Numeric interpolation
-                new_value = start_value + (end_value - start_value) * progress
-            else:
-                # For other types, just use end value when complete
-                new_value = start_value if progress < 1.0 else end_value
+            if style_dict[prop] == previous_style.get(prop):
+                # Unchanged; leave any transition towards it running undisturbed
+                if self.manager.is_animating(widget, option):
+                    held.add(prop)
+                continue
             
-            # Apply new value
             try:
-                widget.tk_widget.configure(**{property_name: new_value})
-            except:
-                pass
+                start = self._to_hex(tk_widget, tk_widget.cget(option))
+                end = self._to_hex(tk_widget, style_dict[prop])
+            except tk.TclError:
+                # Not a color Tk understands; apply it directly
+                continue
             
-            # Schedule next update
-            if elapsed < duration:
-                animation_id = widget.tk_widget.after(16, update_property)  # ~60 FPS
-                # Store animation ID for this property
-                if widget not in self.animations:
-                    self.animations[widget] = {}
-                self.animations[widget][property_name] = animation_id
-        
-        # Start animation
-        animation_id = widget.tk_widget.after(16, update_property)
-        return animation_id
-    
-    def _interpolate_color(self, start_color, end_color, progress):
-        """Interpolate between two hex colors"""
-        # Parse start color
-        if len(start_color) == 7:  # #RRGGBB
-            start_r = int(start_color[1:3], 16)
-            start_g = int(start_color[3:5], 16)
-            start_b = int(start_color[5:7], 16)
-        elif len(start_color) == 4:  # #RGB
-            start_r = int(start_color[1:2] + start_color[1:2], 16)
-            start_g = int(start_color[2:3] + start_color[2:3], 16)
-            start_b = int(start_color[3:4] + start_color[3:4], 16)
-        else:
-            return start_color
+            animated[option] = (start, end)
+            held.add(prop)
         
-        # Parse end color
-        if len(end_color) == 7:  # #RRGGBB
-            end_r = int(end_color[1:3], 16)
-            end_g = int(end_color[3:5], 16)
-            end_b = int(end_color[5:7], 16)
-        elif len(end_color) == 4:  # #RGB
-            end_r = int(end_color[1:2] + end_color[1:2], 16)
-            end_g = int(end_color[2:3] + end_color[2:3], 16)
-            end_b = int(end_color[3:4] + end_color[3:4], 16)
-        else:
-            return end_color
+        if not held:
+            return style_dict
         
-        # Interpolate
-        r = int(start_r + (end_r - start_r) * progress)
-        g = int(start_g + (end_g - start_g) * progress)
-        b = int(start_b + (end_b - start_b) * progress)
+        if animated:
+            self.manager.animate_properties(widget, animated, config['duration'], config['easing'],
+                                            color_space=config['color_space'])
         
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return {k: v for k, v in style_dict.items() if k not in held}
+    
+    def animate_property(self, widget, property_name, start_value, end_value, duration, easing='linear'):
+        """Animate a property change"""
+        return self.manager.animate_property(widget, property_name, start_value, end_value, duration, easing)
+    
+    @staticmethod
+    def _to_hex(tk_widget, color: str) -> str:
+        """Resolve any Tk color (named, #RGB, #RRGGBB) to #rrggbb"""
+        r, g, b = tk_widget.winfo_rgb(color)
+        return f"#{r >> 8:02x}{g >> 8:02x}{b >> 8:02x}"
     
     def remove(self, widget):
         """Remove transition from widget"""
@@ -141,10 +110,4 @@ class TransitionEffect:
             del self.transition_widgets[widget]
         
         # Cancel any running animations
-        if widget in self.animations:
-            for property_name, animation_id in self.animations[widget].items():
-                try:
-                    widget.tk_widget.after_cancel(animation_id)
-                except:
-                    pass
-            del self.animations[widget]
\ No newline at end of file
+        self.manager.stop_all_animations(widget)
\ No newline at end of file
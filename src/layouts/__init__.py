@@ -4,10 +4,12 @@ from .containers import Container
 from .flex import FlexLayout
 from .grid import ResponsiveGrid
 from .responsive import ResponsiveManager
+from .scheduler import LayoutScheduler
 
 __all__ = [
     'Container',
     'FlexLayout', 
     'ResponsiveGrid',
-    'ResponsiveManager'
+    'ResponsiveManager',
+    'LayoutScheduler'
 ]
\ No newline at end of file
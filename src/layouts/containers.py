@@ -3,6 +3,7 @@
 import tkinter as tk
 from typing import Dict, Any, List
 from ..core.base_widget import BaseWidget
+from .scheduler import LayoutScheduler
 
 class Container(BaseWidget):
     """Enhanced container with layout capabilities"""
@@ -11,6 +12,7 @@ class Container(BaseWidget):
         self.layout_type = layout
         self.children = []
         self.child_layout_info = {}  # Store layout info for each child
+        self.pending = {}  # Children waiting for their geometry manager call, in request order
         
         super().__init__(parent, style, style_class, **kwargs)
     
@@ -33,13 +35,35 @@ class Container(BaseWidget):
         """Add a child widget to the container"""
         self.children.append(widget)
         self.child_layout_info[widget] = layout_kwargs.copy()
-        
-        if self.layout_type == 'pack':
-            widget.pack(**layout_kwargs)
-        elif self.layout_type == 'grid':
-            widget.grid(**layout_kwargs) 
-        elif self.layout_type == 'place':
-            widget.place(**layout_kwargs)
+        self.pending[widget] = True
+        self._request_layout()
+    
+    def add_many(self, widgets, **layout_kwargs):
+        """Add several children in one layout pass; items are widgets or (widget, options) pairs"""
+        for item in widgets:
+            widget, options = item if isinstance(item, tuple) else (item, {})
+            self.add(widget, **{**layout_kwargs, **options})
+    
+    def _request_layout(self):
+        """Apply pending geometry once on the next idle pass"""
+        LayoutScheduler.for_widget(self).mark_dirty(self)
+    
+    def _layout_children(self):
+        """Hand every pending child to the current geometry manager"""
+        pending, self.pending = self.pending, {}
+        for widget in pending:
+            layout_kwargs = self.child_layout_info.get(widget)
+            if layout_kwargs is None:
+                continue
+            if self.layout_type == 'pack':
+                widget.pack(**layout_kwargs)
+            elif self.layout_type == 'grid':
+                widget.grid(**layout_kwargs)
+            elif self.layout_type == 'place':
+                widget.place(**layout_kwargs)
+        if pending and self.layout_parent is not None:
+            # Tk settles the new requested size at idle; re-measure once it has
+            self.tk_widget.after_idle(self._invalidate_layout)
     
     def remove(self, widget):
         """Remove a child widget"""
@@ -47,25 +71,34 @@ class Container(BaseWidget):
             self.children.remove(widget)
             if widget in self.child_layout_info:
                 del self.child_layout_info[widget]
+            self.pending.pop(widget, None)
             
             # Hide widget based on current layout type
-            if self.layout_type == 'pack':
-                widget.pack_forget()
-            elif self.layout_type == 'grid':
-                widget.grid_forget()
-            elif self.layout_type == 'place':
-                widget.place_forget()
+            self._forget(widget, self.layout_type)
     
     def clear(self):
         """Remove all child widgets"""
-        for child in self.children[:]:
-            self.remove(child)
+        for child in self.children:
+            self._forget(child, self.layout_type)
+        self.children = []
+        self.child_layout_info.clear()
+        self.pending.clear()
+    
+    @staticmethod
+    def _forget(widget, layout_type):
+        """Take a child out of the given geometry manager"""
+        if layout_type == 'pack':
+            widget.pack_forget()
+        elif layout_type == 'grid':
+            widget.grid_forget()
+        elif layout_type == 'place':
+            widget.place_forget()
     
     def reposition(self, widget, **layout_kwargs):
         """Reposition a child widget with new layout parameters"""
         if widget in self.children:
             # Update stored layout info
-            self.child_layout_info[widget].update(layout_kwargs)
+            layout_kwargs = {**self.child_layout_info[widget], **layout_kwargs}
             
             # Remove and re-add with new parameters
             self.remove(widget)
@@ -80,21 +113,8 @@ class Container(BaseWidget):
         old_layout = self.layout_type
         self.layout_type = layout_type
         
-        # Re-apply all children with their stored layout info
-        for child in self.children[:]:
-            layout_kwargs = self.child_layout_info.get(child, {})
-            # Remove from old layout
-            if old_layout == 'pack':
-                child.pack_forget()
-            elif old_layout == 'grid':
-                child.grid_forget()
-            elif old_layout == 'place':
-                child.place_forget()
-            
-            # Add to new layout
-            if self.layout_type == 'pack':
-                child.pack(**layout_kwargs)
-            elif self.layout_type == 'grid':
-                child.grid(**layout_kwargs)
-            elif self.layout_type == 'place':
-                child.place(**layout_kwargs)
\ No newline at end of file
+        # Remove from the old layout now; the new one is applied in the next layout pass
+        for child in self.children:
+            self._forget(child, old_layout)
+            self.pending[child] = True
+        self._request_layout()
\ No newline at end of file
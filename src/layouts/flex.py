@@ -1,22 +1,141 @@
 """Flexbox-like layout manager"""
 
 import tkinter as tk
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Tuple, Union
 from ..core.base_widget import BaseWidget
+from .scheduler import LayoutScheduler
+
+def compute_flex_layout(items: List[Dict[str, Any]], width: int, height: int, direction: str = 'row',
+                        wrap: str = 'nowrap', justify: str = 'start', align: str = 'stretch') -> Tuple[List[tuple], int]:
+    """Resolve flex items to (x, y, width, height) boxes, plus the cross size the lines need"""
+    # Items are {'grow', 'shrink', 'basis', 'align_self', 'size': (reqwidth, reqheight),
+    # 'margin': (left, top, right, bottom)}; every step is a single pass over them
+    row = direction.startswith('row')
+    reverse = direction.endswith('-reverse')
+    main_space, cross_space = (width, height) if row else (height, width)
+    
+    # Hypothetical main sizes and outer margins along both axes
+    hypothetical = []
+    for item in items:
+        left, top, right, bottom = item['margin']
+        main_margin, cross_margin = (left + right, top + bottom) if row else (top + bottom, left + right)
+        req_main, req_cross = item['size'] if row else item['size'][::-1]
+        basis = item['basis']
+        hypothetical.append((req_main if basis == 'auto' else basis, main_margin, req_cross, cross_margin))
+    
+    # Break into lines
+    lines = []
+    start, used = 0, 0
+    for i, (size, margin, _, _) in enumerate(hypothetical):
+        if wrap != 'nowrap' and i > start and used + size + margin > main_space:
+            lines.append((start, i))
+            start, used = i, 0
+        used += size + margin
+    if items:
+        lines.append((start, len(items)))
+    if wrap == 'wrap-reverse':
+        lines.reverse()
+    
+    # Cross size of each line; a single line fills the container, extra space is shared between lines
+    line_cross = [max(hypothetical[i][2] + hypothetical[i][3] for i in range(a, b)) for a, b in lines]
+    natural_cross = sum(line_cross)
+    if len(lines) == 1:
+        line_cross[0] = cross_space
+    elif lines and sum(line_cross) < cross_space:
+        extra = (cross_space - sum(line_cross)) / len(lines)
+        line_cross = [c + extra for c in line_cross]
+    
+    boxes = [None] * len(items)
+    cross_pos = 0.0
+    for (a, b), line_size in zip(lines, line_cross):
+        # Grow or shrink to fill the line
+        free = main_space - sum(size + margin for size, margin, _, _ in hypothetical[a:b])
+        sizes = [hypothetical[i][0] for i in range(a, b)]
+        if free > 0:
+            total_grow = sum(items[i]['grow'] for i in range(a, b))
+            if total_grow:
+                sizes = [size + free * items[i]['grow'] / total_grow for i, size in zip(range(a, b), sizes)]
+                free = 0
+        elif free < 0:
+            # As in CSS, larger items give up proportionally more
+            weights = [items[i]['shrink'] * size for i, size in zip(range(a, b), sizes)]
+            total_weight = sum(weights)
+            if total_weight:
+                sizes = [max(0.0, size + free * weight / total_weight) for size, weight in zip(sizes, weights)]
+                free = 0
+        
+        # Distribute what is left over
+        count = b - a
+        offset, gap = 0.0, 0.0
+        if free > 0:
+            if justify == 'end':
+                offset = free
+            elif justify == 'center':
+                offset = free / 2
+            elif justify == 'space-between' and count > 1:
+                gap = free / (count - 1)
+            elif justify == 'space-around':
+                gap = free / count
+                offset = gap / 2
+            elif justify == 'space-evenly':
+                gap = free / (count + 1)
+                offset = gap
+        
+        main_pos = offset
+        for i, size in zip(range(a, b), sizes):
+            _, main_margin, req_cross, cross_margin = hypothetical[i]
+            left, top, right, bottom = items[i]['margin']
+            lead_main, lead_cross = (left, top) if row else (top, left)
+            if reverse:
+                # Mirrored below, so the margin that comes first is the right (or bottom) one
+                lead_main = right if row else bottom
+            
+            item_align = items[i]['align_self'] or align
+            if item_align == 'stretch':
+                item_cross, cross_offset = max(0.0, line_size - cross_margin), 0.0
+            else:
+                item_cross = min(req_cross, max(0.0, line_size - cross_margin))
+                slack = line_size - cross_margin - item_cross
+                # Tk exposes no text baselines; 'baseline' lines items up at the start
+                cross_offset = slack if item_align == 'end' else slack / 2 if item_align == 'center' else 0.0
+            
+            main = main_pos + lead_main
+            if reverse:
+                main = main_space - main - size
+            cross = cross_pos + lead_cross + cross_offset
+            box = (main, cross, size, item_cross) if row else (cross, main, item_cross, size)
+            boxes[i] = tuple(int(round(v)) for v in box)
+            main_pos += size + main_margin + gap
+        cross_pos += line_size
+    
+    return boxes, natural_cross
+
+def _margin(value: Union[int, Tuple[int, int]]) -> Tuple[int, int]:
+    """Normalize a Tk style padx/pady value to (before, after)"""
+    if isinstance(value, (tuple, list)):
+        return (int(value[0]), int(value[1]))
+    return (int(value), int(value))
 
 class FlexLayout(BaseWidget):
     """Flexbox-like layout manager"""
     
-    def __init__(self, parent=None, direction='row', wrap='nowrap', justify='start', 
+    def __init__(self, parent=None, direction='row', wrap='nowrap', justify='start',
                  align='stretch', style=None, style_class=None, **kwargs):
-        self.direction = direction  # 'row' or 'column'
-        self.wrap = wrap            # 'wrap' or 'nowrap'
-        self.justify = justify      # 'start', 'end', 'center', 'space-between', 'space-around'
+        self.direction = direction  # 'row', 'column', 'row-reverse' or 'column-reverse'
+        self.wrap = wrap            # 'nowrap', 'wrap' or 'wrap-reverse'
+        self.justify = justify      # 'start', 'end', 'center', 'space-between', 'space-around', 'space-evenly'
         self.align = align          # 'stretch', 'start', 'end', 'center', 'baseline'
         self.children = []
         self.child_flex_info = {}   # Store flex properties for each child
+        self.placed = {}            # {child: (x, y, width, height)} last applied geometry
+        
+        # The frame only asks for its content's size when not given one
+        self._fixed_size = ('width' in kwargs, 'height' in kwargs)
         
         super().__init__(parent, style, style_class, **kwargs)
+        
+        self._size = None
+        self.tk_widget.bind('<Configure>', self._on_configure, add='+')
     
     def _create_widget(self, **kwargs) -> tk.Widget:
         """Create the underlying container frame"""
@@ -33,15 +152,30 @@ class FlexLayout(BaseWidget):
             'border_width': 0
         }
     
-    def add(self, widget, flex=0, align_self=None, **kwargs):
-        """Add a child widget with flex properties"""
+    def add(self, widget, flex=0, align_self=None, grow=None, shrink=None, basis=None, **kwargs):
+        """Add a child widget with flex properties; padx/pady in kwargs are its outer margins"""
+        # flex=n behaves like CSS 'flex: n', growing by ratio from a zero basis
+        if basis is None:
+            basis = 0 if flex > 0 else 'auto'
         self.children.append(widget)
         self.child_flex_info[widget] = {
             'flex': flex,
+            'grow': flex if grow is None else grow,
+            'shrink': 1 if shrink is None else shrink,
+            'basis': basis,
             'align_self': align_self,
-            'kwargs': kwargs.copy()
+            'kwargs': kwargs.copy(),
+            'size': self._measure(widget)
         }
-        self._layout_children()
+        if isinstance(widget, BaseWidget):
+            widget.layout_parent = self
+        self._request_layout()
+    
+    def add_many(self, widgets, **kwargs):
+        """Add several children in one layout pass; items are widgets or (widget, options) pairs"""
+        for item in widgets:
+            widget, options = item if isinstance(item, tuple) else (item, {})
+            self.add(widget, **{**kwargs, **options})
     
     def remove(self, widget):
         """Remove a child widget"""
@@ -49,76 +183,134 @@ class FlexLayout(BaseWidget):
             self.children.remove(widget)
             if widget in self.child_flex_info:
                 del self.child_flex_info[widget]
-            widget.pack_forget()
-            self._layout_children()
+            self.placed.pop(widget, None)
+            if isinstance(widget, BaseWidget):
+                widget.layout_parent = None
+            widget.place_forget()
+            self._request_layout()
     
     def clear(self):
         """Remove all child widgets"""
-        for child in self.children[:]:
-            self.remove(child)
+        for child in self.children:
+            if isinstance(child, BaseWidget):
+                child.layout_parent = None
+            child.place_forget()
+        self.children = []
+        self.child_flex_info.clear()
+        self.placed.clear()
+        self._request_layout()
+    
+    @staticmethod
+    def _measure(widget) -> Tuple[int, int]:
+        """Requested size of a child"""
+        tk_widget = getattr(widget, 'tk_widget', widget)
+        return (tk_widget.winfo_reqwidth(), tk_widget.winfo_reqheight())
+    
+    def invalidate(self, widget=None):
+        """Lay out again after one child's (or every child's) requested size may have changed"""
+        if widget is not None:
+            info = self.child_flex_info.get(widget)
+            # A restyle that keeps the size costs no layout pass
+            if info is None or info['size'] == self._measure(widget):
+                return
+        self._request_layout()
+    
+    def _request_layout(self):
+        """Lay out once on the next idle pass, however many changes come before it"""
+        LayoutScheduler.for_widget(self).mark_dirty(self)
+    
+    def _on_configure(self, event):
+        """Re-run the layout for the container's new size"""
+        if event.widget is self.tk_widget and (event.width, event.height) != self._size:
+            self._size = (event.width, event.height)
+            self._request_layout()
+    
+    def _items(self) -> List[Dict[str, Any]]:
+        """Flex items for compute_flex_layout(), re-measuring every child"""
+        items = []
+        for child in self.children:
+            info = self.child_flex_info[child]
+            # Text, font and nested layout changes all show up in the requested size
+            info['size'] = self._measure(child)
+            padx = _margin(info['kwargs'].get('padx', 0))
+            pady = _margin(info['kwargs'].get('pady', 0))
+            items.append({
+                'grow': info['grow'],
+                'shrink': info['shrink'],
+                'basis': info['basis'],
+                'align_self': info['align_self'],
+                'size': info['size'],
+                'margin': (padx[0], pady[0], padx[1], pady[1])
+            })
+        return items
     
     def _layout_children(self):
         """Layout children according to flex properties"""
-        # Clear existing layout
-        for child in self.children:
-            child.pack_forget()
+        items = self._items()
+        width, height = self._size or (0, 0)
+        if width <= 1 or height <= 1:
+            # Not mapped yet: lay out at the size last requested
+            width, height = self.tk_widget.winfo_reqwidth(), self.tk_widget.winfo_reqheight()
         
-        # Apply flex layout
-        if self.direction == 'row':
-            side = 'left'
-            fill = 'y' if self.align == 'stretch' else None
-        else:
-            side = 'top'
-            fill = 'x' if self.align == 'stretch' else None
-        
-        # Handle flex properties
-        total_flex = sum(self.child_flex_info[child].get('flex', 0) for child in self.children)
+        boxes, natural_cross = compute_flex_layout(items, width, height, self.direction, self.wrap,
+                                                   self.justify, self.align)
+        self._request_size(items, natural_cross)
+        for child, box in zip(self.children, boxes):
+            # Unchanged children cost no geometry request at all
+            if self.placed.get(child) != box:
+                self.placed[child] = box
+                x, y, w, h = box
+                child.place(x=x, y=y, width=w, height=h)
+    
+    def _request_size(self, items: List[Dict[str, Any]], cross: int):
+        """Ask for the content's natural size; placed children do not propagate it to the frame"""
+        if all(self._fixed_size):
+            return
+        row = self.direction.startswith('row')
+        main = 0
+        for item in items:
+            left, top, right, bottom = item['margin']
+            req_main = item['size'][0] if row else item['size'][1]
+            basis = item['basis']
+            main += (req_main if basis == 'auto' else basis) + (left + right if row else top + bottom)
         
-        for child in self.children:
-            flex_info = self.child_flex_info[child]
-            flex = flex_info.get('flex', 0)
-            align_self = flex_info.get('align_self', None)
-            kwargs = flex_info.get('kwargs', {})
-            
-            # Determine expand behavior based on flex
-            expand = flex > 0
-            
-            # Apply packing with flex properties
-            pack_kwargs = {
-                'side': side,
-                'fill': fill,
-                'expand': expand
-            }
-            
-            # Override with any specific kwargs
-            pack_kwargs.update(kwargs)
-            
-            child.pack(**pack_kwargs)
+        # Wrapped lines make the cross size follow the width actually given
+        width, height = (main, cross) if row else (cross, main)
+        request = {}
+        if not self._fixed_size[0]:
+            request['width'] = max(1, int(round(width)))
+        if not self._fixed_size[1]:
+            request['height'] = max(1, int(round(height)))
+        if any(int(self.tk_widget.cget(option)) != value for option, value in request.items()):
+            self.tk_widget.configure(**request)
+            # A nested flex growing or shrinking changes its parent's layout too
+            self._invalidate_layout()
     
     def set_direction(self, direction):
         """Set flex direction"""
         self.direction = direction
-        self._layout_children()
+        self._request_layout()
     
     def set_wrap(self, wrap):
         """Set flex wrap behavior"""
         self.wrap = wrap
-        self._layout_children()
+        self._request_layout()
     
     def set_justify(self, justify):
         """Set justify content"""
         self.justify = justify
-        self._layout_children()
+        self._request_layout()
     
     def set_align(self, align):
         """Set align items"""
         self.align = align
-        self._layout_children()
+        self._request_layout()
     
     def get_children(self) -> List:
         """Get all child widgets"""
         return self.children[:]
     
     def update_layout(self):
-        """Manually trigger layout update"""
-        self._layout_children()
\ No newline at end of file
+        """Re-read every child's requested size and lay out right away"""
+        self.invalidate()
+        LayoutScheduler.for_widget(self).flush()
\ No newline at end of file
@@ -1,28 +1,43 @@
 """Responsive grid layout manager"""
 
+import itertools
 import tkinter as tk
-from typing import Dict, Any, List, Tuple, Union
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from ..core.base_widget import BaseWidget
+from .scheduler import LayoutScheduler
 
 class ResponsiveGrid(BaseWidget):
     """Responsive grid layout manager"""
     
-    def __init__(self, parent=None, columns=1, rows=1, style=None, style_class=None, **kwargs):
+    def __init__(self, parent=None, columns=1, rows=1, auto_flow='row', breakpoint_columns=None,
+                 responsive_manager=None, style=None, style_class=None, **kwargs):
         self.columns = columns
         self.rows = rows
+        self.declared = (columns, rows)  # Track counts asked for; auto-flow may add implicit ones
+        self.auto_flow = auto_flow  # 'row', 'column', 'row dense' or 'column dense'
         self.children = []
         self.child_grid_info = {}  # Store grid properties for each child
+        self.cells = {}            # {(column, row): [widgets covering that cell]}
+        self._cursor = (0, 0)      # Sparse auto-flow resumes here, as (line, position in line)
+        self._first_free = 0       # Dense auto-flow: every slot before this one is occupied
         self.column_weights = [1] * columns  # Default weight for each column
         self.row_weights = [1] * rows        # Default weight for each row
+        self.pending = {}                    # Children waiting for their grid() call, in request order
+        self._weights_dirty = True
+        self.breakpoint_columns = {}         # {breakpoint name: columns}
+        self.responsive_manager = None
         
         super().__init__(parent, style, style_class, **kwargs)
         
         # Configure grid weights
-        self._configure_grid_weights()
+        self._request_layout()
+        
+        if breakpoint_columns and responsive_manager is not None:
+            self.set_breakpoint_columns(breakpoint_columns, responsive_manager)
     
     def _create_widget(self, **kwargs) -> tk.Widget:
         """Create the underlying container frame"""
-        custom_kwargs = {'columns', 'rows', 'style', 'style_class'}
+        custom_kwargs = {'columns', 'rows', 'auto_flow', 'breakpoint_columns', 'responsive_manager', 'style', 'style_class'}
         tk_kwargs = {k: v for k, v in kwargs.items() if k not in custom_kwargs}
         
         frame = tk.Frame(self.parent, **tk_kwargs)
@@ -37,17 +52,22 @@ class ResponsiveGrid(BaseWidget):
     
     def _configure_grid_weights(self):
         """Configure column and row weights for resizing"""
+        # Tracks dropped by a smaller count get no weight, so they stop taking up space
         for i, weight in enumerate(self.column_weights):
-            self.tk_widget.columnconfigure(i, weight=weight)
+            self.tk_widget.columnconfigure(i, weight=weight if i < self.columns else 0)
         
         for i, weight in enumerate(self.row_weights):
-            self.tk_widget.rowconfigure(i, weight=weight)
+            self.tk_widget.rowconfigure(i, weight=weight if i < self.rows else 0)
     
-    def add(self, widget, column=0, row=0, columnspan=1, rowspan=1, 
+    def add(self, widget, column=None, row=None, columnspan=1, rowspan=1, 
             sticky='nsew', padx=0, pady=0, **kwargs):
-        """Add a child widget to the grid"""
+        """Add a child widget to the grid; a missing column or row is filled in by auto-flow"""
+        auto = column is None and row is None
+        if column is None or row is None:
+            column, row = self._auto_place(columnspan, rowspan, column, row)
+        
         self.children.append(widget)
-        self.child_grid_info[widget] = {
+        info = {
             'column': column,
             'row': row,
             'columnspan': columnspan,
@@ -55,29 +75,166 @@ class ResponsiveGrid(BaseWidget):
             'sticky': sticky,
             'padx': padx,
             'pady': pady,
+            'auto': auto,
             'kwargs': kwargs
         }
+        self.child_grid_info[widget] = info
+        self._index(widget, info)
+        self._skip_occupied()
+        self.pending[widget] = True
+        self._request_layout()
+    
+    def add_many(self, widgets, **kwargs):
+        """Add several children in one layout pass; items are (widget, options) pairs or widgets"""
+        for item in widgets:
+            widget, options = item if isinstance(item, tuple) else (item, {})
+            self.add(widget, **{**kwargs, **options})
+    
+    def _request_layout(self):
+        """Apply pending grid changes once on the next idle pass"""
+        LayoutScheduler.for_widget(self).mark_dirty(self)
+    
+    def _layout_children(self):
+        """Apply weight changes and place every pending child in the grid"""
+        if self._weights_dirty:
+            self._weights_dirty = False
+            self._configure_grid_weights()
         
-        # Place widget in grid
-        widget.grid(
-            column=column, row=row,
-            columnspan=columnspan, rowspan=rowspan,
-            sticky=sticky, padx=padx, pady=pady,
-            **kwargs
-        )
+        pending, self.pending = self.pending, {}
+        for widget in pending:
+            info = self.child_grid_info.get(widget)
+            if info is None:
+                continue
+            widget.grid(
+                column=info['column'], row=info['row'],
+                columnspan=info['columnspan'], rowspan=info['rowspan'],
+                sticky=info['sticky'], padx=info['padx'], pady=info['pady'],
+                **info['kwargs']
+            )
+        if pending and self.layout_parent is not None:
+            # Tk settles the new requested size at idle; re-measure once it has
+            self.tk_widget.after_idle(self._invalidate_layout)
     
     def remove(self, widget):
         """Remove a child widget"""
         if widget in self.children:
             self.children.remove(widget)
             if widget in self.child_grid_info:
-                del self.child_grid_info[widget]
+                self._unindex(widget, self.child_grid_info.pop(widget))
+            self.pending.pop(widget, None)
             widget.grid_forget()
     
     def clear(self):
         """Remove all child widgets"""
-        for child in self.children[:]:
-            self.remove(child)
+        for child in self.children:
+            child.grid_forget()
+        self.children = []
+        self.child_grid_info.clear()
+        self.cells.clear()
+        self.pending.clear()
+        self._cursor = (0, 0)
+        self._first_free = 0
+    
+    @staticmethod
+    def _spanned_cells(column: int, row: int, columnspan: int, rowspan: int) -> Iterator[Tuple[int, int]]:
+        """Every (column, row) an item covers"""
+        for r in range(row, row + rowspan):
+            for c in range(column, column + columnspan):
+                yield (c, r)
+    
+    def _index(self, widget, info: Dict[str, Any]):
+        """Record the cells a child covers"""
+        for cell in self._spanned_cells(info['column'], info['row'], info['columnspan'], info['rowspan']):
+            self.cells.setdefault(cell, []).append(widget)
+    
+    def _unindex(self, widget, info: Dict[str, Any]):
+        """Forget the cells a child covered; freed slots become available to dense auto-flow"""
+        for cell in self._spanned_cells(info['column'], info['row'], info['columnspan'], info['rowspan']):
+            widgets = self.cells.get(cell)
+            if widgets is not None:
+                widgets.remove(widget)
+                if not widgets:
+                    del self.cells[cell]
+        self._first_free = min(self._first_free, self._slot(info['column'], info['row']))
+    
+    def is_cell_free(self, column: int, row: int) -> bool:
+        """Whether no child covers a cell"""
+        return (column, row) not in self.cells
+    
+    def _fits(self, column: int, row: int, columnspan: int, rowspan: int) -> bool:
+        """Whether an item of the given span can go at (column, row) without overlapping"""
+        return all(cell not in self.cells for cell in self._spanned_cells(column, row, columnspan, rowspan))
+    
+    def _line_length(self) -> int:
+        """Cells per line in the auto-flow direction: columns per row, or rows per column"""
+        return max(1, self.rows if self.auto_flow.startswith('column') else self.columns)
+    
+    def _slot(self, column: int, row: int) -> int:
+        """Position of a cell in auto-flow order"""
+        if self.auto_flow.startswith('column'):
+            return column * self._line_length() + row
+        return row * self._line_length() + column
+    
+    def _skip_occupied(self):
+        """Move the dense auto-flow start past taken slots, so each slot is stepped over once"""
+        by_column = self.auto_flow.startswith('column')
+        length = self._line_length()
+        while True:
+            line, position = divmod(self._first_free, length)
+            if ((line, position) if by_column else (position, line)) not in self.cells:
+                return
+            self._first_free += 1
+    
+    def next_free_cell(self, columnspan: int = 1, rowspan: int = 1) -> Tuple[int, int]:
+        """(column, row) where auto-flow would put an item of the given span next"""
+        return self._find_slot(columnspan, rowspan)[0]
+    
+    def _find_slot(self, columnspan: int, rowspan: int) -> Tuple[Tuple[int, int], int]:
+        """Scan the index in auto-flow order for the first place an item fits"""
+        by_column = self.auto_flow.startswith('column')
+        length = self._line_length()
+        span = min(rowspan if by_column else columnspan, length)
+        if self.auto_flow.endswith('dense'):
+            slot = self._first_free
+        else:
+            line, position = self._cursor
+            slot = line * length + min(position, length)
+        
+        while True:
+            line, position = divmod(slot, length)
+            if position + span <= length:
+                cell = (line, position) if by_column else (position, line)
+                if self._fits(cell[0], cell[1], columnspan, rowspan):
+                    return cell, slot
+            slot += 1
+    
+    def _auto_place(self, columnspan: int, rowspan: int, column: Optional[int], row: Optional[int]) -> Tuple[int, int]:
+        """Pick a free cell for a new item and advance the auto-flow state"""
+        if column is not None:
+            # Column fixed: first row where the item fits in that column
+            return column, next(r for r in itertools.count() if self._fits(column, r, columnspan, rowspan))
+        if row is not None:
+            return next(c for c in itertools.count() if self._fits(c, row, columnspan, rowspan)), row
+        
+        (column, row), slot = self._find_slot(columnspan, rowspan)
+        by_column = self.auto_flow.startswith('column')
+        length = self._line_length()
+        
+        # Sparse flow never goes back; an item wider than a line still only uses up that line
+        self._cursor = divmod(slot + min(rowspan if by_column else columnspan, length), length)
+        
+        # Grow the implicit axis so new lines get a weight like the others
+        if by_column and column + columnspan > self.columns:
+            self._resize_columns(column + columnspan)
+        elif not by_column and row + rowspan > self.rows:
+            self._resize_rows(row + rowspan)
+        return column, row
+    
+    def set_auto_flow(self, auto_flow: str):
+        """Set how items added without a position are placed"""
+        self.auto_flow = auto_flow
+        self._cursor = (0, 0)
+        self._first_free = 0
     
     def set_column_weight(self, column, weight):
         """Set the weight of a column"""
@@ -85,7 +242,8 @@ class ResponsiveGrid(BaseWidget):
             while len(self.column_weights) <= column:
                 self.column_weights.append(1)
             self.column_weights[column] = weight
-            self.tk_widget.columnconfigure(column, weight=weight)
+            self._weights_dirty = True
+            self._request_layout()
     
     def set_row_weight(self, row, weight):
         """Set the weight of a row"""
@@ -93,42 +251,116 @@ class ResponsiveGrid(BaseWidget):
             while len(self.row_weights) <= row:
                 self.row_weights.append(1)
             self.row_weights[row] = weight
-            self.tk_widget.rowconfigure(row, weight=weight)
+            self._weights_dirty = True
+            self._request_layout()
     
     def set_columns(self, columns):
-        """Set the number of columns"""
+        """Set the number of columns; auto-placed children flow into the new shape"""
+        self.declared = (columns, self.declared[1])
+        self._resize_columns(columns)
+        if not self.auto_flow.startswith('column'):
+            self._reflow()
+    
+    def set_rows(self, rows):
+        """Set the number of rows; auto-placed children flow into the new shape"""
+        self.declared = (self.declared[0], rows)
+        self._resize_rows(rows)
+        if self.auto_flow.startswith('column'):
+            self._reflow()
+    
+    def _resize_columns(self, columns):
+        """Change the column count without moving children"""
         self.columns = columns
         # Ensure column_weights has enough entries
         while len(self.column_weights) < columns:
             self.column_weights.append(1)
-        self._configure_grid_weights()
+        if not self.auto_flow.startswith('column'):
+            # Auto-flow slots are numbered per row
+            self._first_free = 0
+        self._weights_dirty = True
+        self._request_layout()
     
-    def set_rows(self, rows):
-        """Set the number of rows"""
+    def _resize_rows(self, rows):
+        """Change the row count without moving children"""
         self.rows = rows
         # Ensure row_weights has enough entries
         while len(self.row_weights) < rows:
             self.row_weights.append(1)
-        self._configure_grid_weights()
+        if self.auto_flow.startswith('column'):
+            self._first_free = 0
+        self._weights_dirty = True
+        self._request_layout()
+    
+    def _reflow(self):
+        """Re-run auto-flow for auto-placed children; only those whose cell changed are re-gridded"""
+        auto = [widget for widget in self.children if self.child_grid_info[widget]['auto']]
+        if not auto:
+            return
+        
+        previous = {}
+        for widget in auto:
+            info = self.child_grid_info[widget]
+            previous[widget] = (info['column'], info['row'])
+            self._unindex(widget, info)
+        self._cursor = (0, 0)
+        self._first_free = 0
+        self._skip_occupied()
+        
+        for widget in auto:
+            info = self.child_grid_info[widget]
+            info['column'], info['row'] = self._auto_place(info['columnspan'], info['rowspan'], None, None)
+            self._index(widget, info)
+            self._skip_occupied()
+            if (info['column'], info['row']) != previous[widget]:
+                self.pending[widget] = True
+        
+        # The implicit axis shrinks back to what the children now cover
+        if self.auto_flow.startswith('column'):
+            extent = max(info['column'] + info['columnspan'] for info in self.child_grid_info.values())
+            self._resize_columns(max(self.declared[0], extent))
+        else:
+            extent = max(info['row'] + info['rowspan'] for info in self.child_grid_info.values())
+            self._resize_rows(max(self.declared[1], extent))
+        self._request_layout()
+    
+    def set_breakpoint_columns(self, breakpoint_columns: Dict[str, int], responsive_manager):
+        """Use a column count per ResponsiveManager breakpoint, e.g. {'mobile': 1, 'tablet': 2, 'desktop': 4}"""
+        self.breakpoint_columns = dict(breakpoint_columns)
+        if self.responsive_manager is not responsive_manager:
+            self.responsive_manager = responsive_manager
+            responsive_manager.add_breakpoint_handler(self, self._on_breakpoint_change)
+        self._on_breakpoint_change(responsive_manager.get_current_breakpoint(), None)
+    
+    def _on_breakpoint_change(self, breakpoint_name: str, previous: Optional[str]):
+        """Switch to the column count of the new breakpoint"""
+        responsive_manager = self.responsive_manager
+        columns = self.breakpoint_columns.get(breakpoint_name)
+        if columns is None:
+            # Mobile first: an unlisted breakpoint inherits from the widest listed one below it
+            width = responsive_manager.get_breakpoint_width(breakpoint_name)
+            below = [(responsive_manager.get_breakpoint_width(name), count)
+                     for name, count in self.breakpoint_columns.items()
+                     if responsive_manager.get_breakpoint_width(name) <= width]
+            if not below:
+                return
+            columns = max(below)[1]
+        if columns != self.columns:
+            self.set_columns(columns)
     
     def get_children(self) -> List:
         """Get all child widgets"""
         return self.children[:]
     
     def get_cell_widgets(self, column, row) -> List:
-        """Get widgets in a specific cell"""
-        widgets = []
-        for widget in self.children:
-            info = self.child_grid_info.get(widget, {})
-            if (info.get('column') == column and info.get('row') == row):
-                widgets.append(widget)
-        return widgets
+        """Get widgets covering a specific cell, including ones spanning into it"""
+        return list(self.cells.get((column, row), ()))
     
     def reposition(self, widget, column=None, row=None, columnspan=None, 
                    rowspan=None, sticky=None, padx=None, pady=None):
         """Reposition a widget with new grid parameters"""
         if widget in self.children:
             info = self.child_grid_info[widget]
+            self._unindex(widget, info)
             
             # Update parameters if provided
             if column is not None:
@@ -145,11 +377,10 @@ class ResponsiveGrid(BaseWidget):
                 info['padx'] = padx
             if pady is not None:
                 info['pady'] = pady
+            if column is not None or row is not None:
+                info['auto'] = False
+            self._index(widget, info)
             
-            # Remove and re-add widget
-            widget.grid_forget()
-            widget.grid(
-                column=info['column'], row=info['row'],
-                columnspan=info['columnspan'], rowspan=info['rowspan'],
-                sticky=info['sticky'], padx=info['padx'], pady=info['pady']
-            )
\ No newline at end of file
+            # Re-grid in the next layout pass
+            self.pending[widget] = True
+            self._request_layout()
\ No newline at end of file
@@ -1,19 +1,29 @@
 """Responsive layout manager"""
 
 import tkinter as tk
-from typing import Dict, Any, List, Callable, Tuple
+from bisect import bisect_right
+from typing import Dict, Any, List, Callable, Optional, Tuple
 from ..core.base_widget import BaseWidget
 
 class ResponsiveManager:
     """Manages responsive layout behavior"""
     
-    def __init__(self, root_widget=None):
+    def __init__(self, root_widget=None, hysteresis: int = 0):
         self.root_widget = root_widget
         self.breakpoints = {}  # {name: width}
+        self._widths = []  # Breakpoint widths, ascending, for bisect
+        self._names = []   # Breakpoint names in the same order
+        self.hysteresis = hysteresis  # px past a boundary before the breakpoint switches
         self.layout_configs = {}  # {widget: {breakpoint: config}}
+        self._targets = None  # Compiled from layout_configs: {breakpoint: [(widget, target)]}
+        self.applied = {}  # {widget: target last applied}
+        self.configured = {}  # {widget: configure options last applied}, kept across rules without any
+        self.hidden = {}  # {widget: (manager, options)} to restore when shown again
         self.current_breakpoint = None
-        self.resize_handlers = []  # List of (widget, handler) tuples
+        self.resize_handlers = []  # List of (widget, handler, watch) tuples
         self.orientation_handlers = []  # List of (widget, handler) tuples
+        self.breakpoint_handlers = []  # List of (widget, handler(new, previous)) tuples
+        self._size = None  # Last root size seen, to tell which dimension changed
         
         # Default breakpoints
         self.set_breakpoint('mobile', 0)
@@ -23,21 +33,34 @@ class ResponsiveManager:
         
         # Bind to root widget resize events if provided
         if self.root_widget:
-            self.root_widget.bind('<Configure>', self._on_resize)
+            self.root_widget.bind('<Configure>', self._on_resize, add='+')
     
     def set_breakpoint(self, name: str, width: int):
         """Define a breakpoint"""
         self.breakpoints[name] = width
+        # Rebuilt only here, so lookups on every resize are a bisect
+        ordered = sorted(self.breakpoints.items(), key=lambda x: x[1])
+        self._names = [name for name, _ in ordered]
+        self._widths = [width for _, width in ordered]
+    
+    def set_hysteresis(self, hysteresis: int):
+        """Require the width to pass a boundary by this many px before the breakpoint switches"""
+        self.hysteresis = hysteresis
     
     def set_layout_config(self, widget, breakpoint_name: str, config: Dict[str, Any]):
         """Set layout configuration for a widget at a specific breakpoint"""
         if widget not in self.layout_configs:
             self.layout_configs[widget] = {}
         self.layout_configs[widget][breakpoint_name] = config
+        self._targets = None
+    
+    def add_resize_handler(self, widget, handler: Callable, watch: str = 'both'):
+        """Add a handler(width, height) called when the watched dimension changes: 'width', 'height' or 'both'"""
+        self.resize_handlers.append((widget, handler, watch))
     
-    def add_resize_handler(self, widget, handler: Callable):
-        """Add a custom resize handler for a widget"""
-        self.resize_handlers.append((widget, handler))
+    def add_breakpoint_handler(self, widget, handler: Callable):
+        """Add a handler called with (new, previous) breakpoint names when the breakpoint changes"""
+        self.breakpoint_handlers.append((widget, handler))
     
     def add_orientation_handler(self, widget, handler: Callable):
         """Add a custom orientation change handler for a widget"""
@@ -47,106 +70,162 @@ class ResponsiveManager:
         """Handle resize events"""
         if event.widget != self.root_widget:
             return
-            
+        
+        # Moves and child geometry changes arrive here too; only size changes matter
+        previous_size, self._size = self._size, (event.width, event.height)
+        if previous_size == self._size:
+            return
+        width_changed = previous_size is None or previous_size[0] != event.width
+        height_changed = previous_size is None or previous_size[1] != event.height
+        
         # Determine current breakpoint
-        new_breakpoint = self._get_current_breakpoint(event.width)
+        new_breakpoint = self._resolve_breakpoint(event.width) if width_changed else self.current_breakpoint
         
         # Apply layout changes if breakpoint changed
         if new_breakpoint != self.current_breakpoint:
-            self.current_breakpoint = new_breakpoint
+            previous, self.current_breakpoint = self.current_breakpoint, new_breakpoint
             self._apply_breakpoint_layouts(new_breakpoint)
+            for widget, handler in self.breakpoint_handlers:
+                handler(new_breakpoint, previous)
         
         # Call custom resize handlers
-        for widget, handler in self.resize_handlers:
-            handler(event.width, event.height)
+        for widget, handler, watch in self.resize_handlers:
+            if (width_changed and watch != 'height') or (height_changed and watch != 'width'):
+                handler(event.width, event.height)
+    
+    def _resolve_breakpoint(self, width: int) -> str:
+        """Breakpoint for a new width, staying put while within hysteresis of the boundary"""
+        new_breakpoint = self._get_current_breakpoint(width)
+        current = self.current_breakpoint
+        if not self.hysteresis or current not in self.breakpoints or new_breakpoint == current:
+            return new_breakpoint
+        
+        # Look the width up as if it were hysteresis px closer to where we are now
+        current_width = self.breakpoints[current]
+        if self.breakpoints[new_breakpoint] > current_width:
+            shifted = self._get_current_breakpoint(width - self.hysteresis)
+            return shifted if self.breakpoints[shifted] > current_width else current
+        shifted = self._get_current_breakpoint(width + self.hysteresis)
+        return shifted if self.breakpoints[shifted] < current_width else current
     
     def _get_current_breakpoint(self, width: int) -> str:
         """Get the current breakpoint based on width"""
-        # Sort breakpoints by width
-        sorted_breakpoints = sorted(self.breakpoints.items(), key=lambda x: x[1], reverse=True)
+        if not self._names:
+            return 'default'
         
-        # Find the first breakpoint that matches
-        for name, breakpoint_width in sorted_breakpoints:
-            if width >= breakpoint_width:
-                return name
-        
-        # Default to first breakpoint
-        return sorted_breakpoints[-1][0] if sorted_breakpoints else 'default'
+        # Widest breakpoint not wider than the window; below all of them, the narrowest
+        index = bisect_right(self._widths, width) - 1
+        return self._names[max(index, 0)]
     
     def _apply_breakpoint_layouts(self, breakpoint_name: str):
-        """Apply layouts for the current breakpoint"""
+        """Apply layouts for the current breakpoint, touching only widgets whose state differs"""
+        if self._targets is None:
+            self._compile_rules()
+        for widget, target in self._targets.get(breakpoint_name, ()):
+            if self.applied.get(widget) != target:
+                self._apply_target(widget, target)
+    
+    def _compile_rules(self):
+        """Turn rule configs into {breakpoint: [(widget, target state)]}, once per rule change"""
+        self._targets = {}
         for widget, configs in self.layout_configs.items():
-            if breakpoint_name in configs:
-                config = configs[breakpoint_name]
-                self._apply_widget_config(widget, config)
-    
-    def _apply_widget_config(self, widget, config: Dict[str, Any]):
-        """Apply configuration to a widget"""
-        # Handle packing
-        if 'pack' in config:
-            pack_config = config['pack']
-            # Remove from any existing layout
-            widget.pack_forget()
-            widget.grid_forget()
-            widget.place_forget()
-            # Apply new packing
-            widget.pack(**pack_config)
+            for breakpoint_name, config in configs.items():
+                self._targets.setdefault(breakpoint_name, []).append((widget, self._target_state(config)))
+    
+    @staticmethod
+    def _target_state(config: Dict[str, Any]) -> Tuple:
+        """(geometry, visible, configure) a rule asks for; None parts are left as they are"""
+        geometry = None
+        for manager in ('pack', 'grid', 'place'):
+            if manager in config:
+                geometry = (manager, dict(config[manager]))
+                break
+        visible = config.get('visible')
+        return (geometry, None if visible is None else bool(visible), dict(config.get('configure') or {}) or None)
+    
+    def _apply_target(self, widget, target: Tuple):
+        """Move a widget from its applied state to target with as few Tk calls as possible"""
+        geometry, visible, configure = target
+        applied = self.applied.get(widget, (None, None, None))
         
-        # Handle gridding
-        elif 'grid' in config:
-            grid_config = config['grid']
-            # Remove from any existing layout
-            widget.pack_forget()
-            widget.grid_forget()
-            widget.place_forget()
-            # Apply new gridding
-            widget.grid(**grid_config)
+        if visible is False:
+            if widget not in self.hidden:
+                self._hide(widget, geometry)
+            elif geometry is not None:
+                # Stays hidden, but should come back with the new geometry
+                self.hidden[widget] = geometry
+        elif geometry is not None:
+            if geometry != applied[0] or widget in self.hidden:
+                self.hidden.pop(widget, None)
+                self._set_geometry(widget, geometry)
+        elif visible and widget in self.hidden:
+            self._restore(widget)
         
-        # Handle placing
-        elif 'place' in config:
-            place_config = config['place']
-            # Remove from any existing layout
+        if configure is not None and configure != self.configured.get(widget):
+            widget.configure(**configure)
+            self.configured[widget] = configure
+        self.applied[widget] = target
+    
+    @staticmethod
+    def _manager(widget) -> str:
+        """Geometry manager currently in charge of a widget, '' if none"""
+        try:
+            return widget.winfo_manager()
+        except tk.TclError:
+            return ''
+    
+    def _current_geometry(self, widget) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """The widget's geometry manager and options as Tk reports them"""
+        manager = self._manager(widget)
+        if manager not in ('pack', 'grid', 'place'):
+            return None
+        info = getattr(widget, manager + '_info')()
+        return (manager, {key: value for key, value in info.items() if value != ''})
+    
+    def _set_geometry(self, widget, geometry: Tuple[str, Dict[str, Any]]):
+        """Hand a widget to a geometry manager, leaving only the manager it had before"""
+        manager, options = geometry
+        current = self._manager(widget)
+        if current and current != manager:
+            self._forget(widget, current)
+        getattr(widget, manager)(**options)
+    
+    @staticmethod
+    def _forget(widget, manager: str):
+        """Take a widget out of one geometry manager"""
+        if manager == 'pack':
             widget.pack_forget()
+        elif manager == 'grid':
             widget.grid_forget()
+        elif manager == 'place':
             widget.place_forget()
-            # Apply new placing
-            widget.place(**place_config)
-        
-        # Handle widget configuration
-        if 'configure' in config:
-            widget.configure(**config['configure'])
-        
-        # Handle visibility
-        if 'visible' in config:
-            if config['visible']:
-                # Restore previous layout if it was hidden
-                pass
-            else:
-                # Hide widget
-                widget.pack_forget()
-                widget.grid_forget()
-                widget.place_forget()
+    
+    def _hide(self, widget, geometry: Optional[Tuple[str, Dict[str, Any]]] = None):
+        """Unmap a widget, remembering the geometry to come back with"""
+        self.hidden[widget] = geometry or self._current_geometry(widget)
+        manager = self._manager(widget)
+        if manager:
+            self._forget(widget, manager)
+    
+    def _restore(self, widget):
+        """Bring a hidden widget back with the geometry it had"""
+        geometry = self.hidden.pop(widget, None)
+        if geometry is not None:
+            self._set_geometry(widget, geometry)
     
     def hide_widget(self, widget):
-        """Hide a widget"""
-        widget.pack_forget()
-        widget.grid_forget()
-        widget.place_forget()
+        """Hide a widget; restore_widget() brings it back where it was"""
+        if widget not in self.hidden:
+            self._hide(widget)
+    
+    def restore_widget(self, widget):
+        """Show a widget hidden by hide_widget() or a 'visible': False rule"""
+        self._restore(widget)
     
     def show_widget(self, widget, layout_type='pack', **layout_kwargs):
         """Show a widget with specified layout"""
-        # Remove from all layouts first
-        widget.pack_forget()
-        widget.grid_forget()
-        widget.place_forget()
-        
-        # Apply specified layout
-        if layout_type == 'pack':
-            widget.pack(**layout_kwargs)
-        elif layout_type == 'grid':
-            widget.grid(**layout_kwargs)
-        elif layout_type == 'place':
-            widget.place(**layout_kwargs)
+        self.hidden.pop(widget, None)
+        self._set_geometry(widget, (layout_type, layout_kwargs))
     
     def get_current_breakpoint(self) -> str:
         """Get the current breakpoint name"""
@@ -172,7 +251,9 @@ class ResponsiveManager:
         """Remove a rule for a widget at a specific breakpoint"""
         if widget in self.layout_configs and breakpoint_name in self.layout_configs[widget]:
             del self.layout_configs[widget][breakpoint_name]
+            self._targets = None
     
     def clear_all_rules(self):
         """Clear all breakpoint rules"""
-        self.layout_configs.clear()
\ No newline at end of file
+        self.layout_configs.clear()
+        self._targets = None
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""Deferred, coalesced layout passes for Modern TK containers"""
+
+import tkinter as tk
+from typing import Any, Dict
+
+class LayoutScheduler:
+    """One per Tk root: containers mark themselves dirty and are laid out once per idle cycle"""
+    
+    # A pass that keeps dirtying containers (a layout feedback loop) is cut off here
+    max_rounds = 8
+    
+    def __init__(self, root):
+        self.root = root
+        self.dirty = {}  # {container: depth in the widget tree}
+        self._after_id = None
+        self.stats = {
+            'requests': 0,
+            'passes': 0,
+            'layouts': 0
+        }
+    
+    @classmethod
+    def for_widget(cls, widget) -> 'LayoutScheduler':
+        """Get the scheduler for the root that owns a widget"""
+        tk_widget = getattr(widget, 'tk_widget', widget)
+        root = tk_widget._root()
+        scheduler = getattr(root, '_modern_tk_layout_scheduler', None)
+        if scheduler is None:
+            scheduler = cls(root)
+            root._modern_tk_layout_scheduler = scheduler
+        return scheduler
+    
+    def mark_dirty(self, container):
+        """Lay out container on the next idle pass; repeated requests coalesce"""
+        self.stats['requests'] += 1
+        if container not in self.dirty:
+            # Tk path names nest like the widget tree: '.!frame.!frame2' is two levels deep
+            self.dirty[container] = str(container.tk_widget).count('.')
+        if self._after_id is None:
+            try:
+                self._after_id = self.root.after_idle(self.flush)
+            except tk.TclError:
+                self.dirty.clear()
+    
+    def flush(self):
+        """Run every pending layout now, parents before their children"""
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        
+        self.stats['passes'] += 1
+        for _ in range(self.max_rounds):
+            if not self.dirty:
+                break
+            # A parent's pass may resize children and dirty them again; those run in the next round
+            dirty, self.dirty = self.dirty, {}
+            for container in sorted(dirty, key=dirty.get):
+                try:
+                    container._layout_children()
+                    self.stats['layouts'] += 1
+                except tk.TclError:
+                    # Destroyed since it was marked
+                    pass
+                except Exception as e:
+                    print(f"Error in layout pass: {e}")
+        
+        if self.dirty:
+            # Still unsettled; continue on the next idle cycle instead of spinning here
+            try:
+                self._after_id = self.root.after_idle(self.flush)
+            except tk.TclError:
+                self.dirty.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Scheduler counters"""
+        stats = dict(self.stats)
+        stats['pending'] = len(self.dirty)
+        return stats
\ No newline at end of file
@@ -1,17 +1,25 @@
 """Utility functions and classes for Modern TK"""
 
-from .colors import Color, ColorUtils
+from .colors import Color, ColorUtils, ColorRamp, color_ramp_cache, alpha_blend_cache
 from .fonts import FontManager
 from .geometry import GeometryUtils
 from .validators import StyleValidator
 from .animations import AnimationManager
+from .frame_clock import FrameClock
+from .easing import EasingCurve, get_easing
+from .timeline import Timeline, Tween, CanvasItemTween, Sequence, Parallel, Delay, stagger
+from .image_cache import ImageCache, image_cache
 from .icons import IconManager
 
 __all__ = [
-    'Color', 'ColorUtils',
+    'Color', 'ColorUtils', 'ColorRamp', 'color_ramp_cache', 'alpha_blend_cache',
     'FontManager',
     'GeometryUtils', 
     'StyleValidator',
     'AnimationManager',
+    'FrameClock',
+    'EasingCurve', 'get_easing',
+    'Timeline', 'Tween', 'CanvasItemTween', 'Sequence', 'Parallel', 'Delay', 'stagger',
+    'ImageCache', 'image_cache',
     'IconManager'
 ]
\ No newline at end of file
@@ -2,7 +2,14 @@
 
 import tkinter as tk
 from typing import Dict, Any, Callable, Optional
+import functools
 import time
+import weakref
+
+from .frame_clock import FrameClock
+from .easing import get_easing
+from .colors import color_ramp_cache
+from .timeline import Timeline, TimelineNode, CanvasItemTween
 
 class AnimationManager:
     """Manages animations for widgets"""
@@ -11,21 +18,35 @@ class AnimationManager:
         self.animations = {}  # {widget: {property: animation_id}}
         self.running_animations = {}  # {animation_id: animation_data}
         self._animation_counter = 0
+        self._wake_ids = {}  # {clock: after_id} for clocks whose animations are all hidden
+        self._clocks = weakref.WeakSet()  # clocks whose visibility changes we follow
     
     def animate_property(self, widget, property_name: str, start_value, end_value, 
-                        duration: int, easing: str = 'linear', callback: Optional[Callable] = None):
+                        duration: int, easing: str = 'linear', callback: Optional[Callable] = None,
+                        color_space: str = 'srgb'):
         """Animate a widget property"""
         # Cancel any existing animation for this property
-        if widget in self.animations and property_name in self.animations[widget]:
-            old_animation_id = self.animations[widget][property_name]
-            if old_animation_id in self.running_animations:
-                old_animation = self.running_animations[old_animation_id]
-                widget.tk_widget.after_cancel(old_animation['after_id'])
-                del self.running_animations[old_animation_id]
+        self.stop_animation(widget, property_name)
         
         # Create animation data
         self._animation_counter += 1
         animation_id = self._animation_counter
+        clock = FrameClock.for_widget(widget)
+        
+        # Resolve the easing curve once; each frame is then a table lookup
+        try:
+            curve = get_easing(easing)
+        except ValueError as e:
+            print(f"Warning: {e}, using linear easing")
+            curve = get_easing('linear')
+        
+        # Hex colors step through a cached ramp instead of being formatted per frame
+        ramp = None
+        if isinstance(start_value, str) and isinstance(end_value, str) and start_value.startswith('#') and end_value.startswith('#'):
+            try:
+                ramp = color_ramp_cache.get(start_value, end_value, space=color_space)
+            except ValueError as e:
+                print(f"Warning: {e}, color will not be interpolated")
         
         animation_data = {
             'widget': widget,
@@ -33,10 +54,11 @@ class AnimationManager:
             'start_value': start_value,
             'end_value': end_value,
             'duration': duration,
-            'easing': easing,
+            'easing': curve,
+            'ramp': ramp,
             'callback': callback,
-            'start_time': time.time(),
-            'after_id': None
+            'start_time': time.perf_counter(),
+            'clock': clock
         }
         
         # Store animation reference
@@ -45,124 +67,170 @@ class AnimationManager:
         self.animations[widget][property_name] = animation_id
         self.running_animations[animation_id] = animation_data
         
-        # Start animation
-        self._run_animation(animation_id)
+        # All animations on a root advance from that root's single frame clock
+        if clock not in self._clocks:
+            self._clocks.add(clock)
+            clock.visibility_handlers.append(functools.partial(self._wake, clock))
+        self._cancel_wake(clock)
+        clock.add(self, functools.partial(self._on_frame, clock))
         
         return animation_id
     
-    def _run_animation(self, animation_id: int):
-        """Run an animation step"""
-        if animation_id not in self.running_animations:
-            return
+    def animate_properties(self, widget, properties: Dict[str, tuple], duration: int,
+                           easing: str = 'linear', callback: Optional[Callable] = None,
+                           color_space: str = 'srgb') -> list:
+        """Animate several properties of one widget together, {name: (start, end)}"""
+        animation_ids = []
+        names = list(properties)
+        for name in names:
+            start_value, end_value = properties[name]
+            # Only the last animation reports completion
+            done = callback if name == names[-1] else None
+            animation_ids.append(self.animate_property(widget, name, start_value, end_value,
+                                                       duration, easing, done, color_space))
+        return animation_ids
+    
+    def play(self, node: TimelineNode, repeat: int = 0, yoyo: bool = False,
+             callback: Optional[Callable] = None, root=None) -> Timeline:
+        """Play a Tween/Sequence/Parallel tree; the returned Timeline cancels all of it"""
+        return Timeline(node, repeat, yoyo, callback).play(root)
+    
+    def animate_item(self, canvas, item, property_name: str, end_value, duration: int,
+                     easing: str = 'linear', callback: Optional[Callable] = None,
+                     start_value=None, color_space: str = 'srgb') -> Timeline:
+        """Animate a canvas item's 'coords', 'position', color or numeric option"""
+        tween = CanvasItemTween(canvas, item, property_name, start_value, end_value, duration, easing, color_space)
+        return self.play(tween, callback=callback)
+    
+    def _on_frame(self, clock: FrameClock, now: float) -> bool:
+        """Advance every animation driven by a clock; False once none are left"""
+        finished = []
+        active = False
+        wake_at = None
+        
+        for animation_id, animation_data in list(self.running_animations.items()):
+            if animation_data['clock'] is not clock:
+                continue
+            
+            # Hidden widgets get no configure calls; time keeps running so a
+            # resumed animation jumps to where it would have been
+            if not clock.is_viewable(animation_data['widget'].tk_widget):
+                end_time = animation_data['start_time'] + animation_data['duration'] / 1000
+                if now < end_time:
+                    wake_at = end_time if wake_at is None else min(wake_at, end_time)
+                    continue
+            
+            if self._step_animation(animation_data, now):
+                active = True
+            else:
+                finished.append(animation_id)
         
-        animation_data = self.running_animations[animation_id]
+        # Every finished animation is removed before any callback runs, and a
+        # failing callback must not unsubscribe the animations still running
+        callbacks = [self._finish_animation(animation_id) for animation_id in finished]
+        for callback in callbacks:
+            if callback:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Error in animation callback: {e}")
+        
+        if active:
+            return True
+        if wake_at is not None:
+            # Only hidden animations remain; stop ticking until one is shown or ends
+            self._sleep(clock, wake_at)
+        return False
+    
+    def _sleep(self, clock: FrameClock, wake_at: float):
+        """Stop ticking for a clock until wake_at or the next visibility change"""
+        self._cancel_wake(clock)
+        delay = max(1, int((wake_at - time.perf_counter()) * 1000) + 1)
+        try:
+            self._wake_ids[clock] = clock.root.after(delay, functools.partial(self._wake, clock))
+        except tk.TclError:
+            pass
+    
+    def _cancel_wake(self, clock: FrameClock):
+        """Cancel a pending wake-up timer"""
+        after_id = self._wake_ids.pop(clock, None)
+        if after_id is not None:
+            try:
+                clock.root.after_cancel(after_id)
+            except tk.TclError:
+                pass
+    
+    def _wake(self, clock: FrameClock):
+        """Resume ticking a suspended clock"""
+        if clock not in self._wake_ids:
+            return
+        self._cancel_wake(clock)
+        if any(data['clock'] is clock for data in self.running_animations.values()):
+            clock.add(self, functools.partial(self._on_frame, clock))
+    
+    def _step_animation(self, animation_data: Dict[str, Any], now: float) -> bool:
+        """Queue the current value of one animation; False when it has completed"""
         widget = animation_data['widget']
-        property_name = animation_data['property_name']
         start_value = animation_data['start_value']
         end_value = animation_data['end_value']
         duration = animation_data['duration']
-        easing = animation_data['easing']
-        callback = animation_data['callback']
-        start_time = animation_data['start_time']
         
         # Calculate progress
-        elapsed = (time.time() - start_time) * 1000  # Convert to milliseconds
+        elapsed = (now - animation_data['start_time']) * 1000  # Convert to milliseconds
         progress = min(1.0, elapsed / duration) if duration > 0 else 1.0
         
         # Apply easing
-        eased_progress = self._apply_easing(progress, easing)
+        eased_progress = animation_data['easing'](progress)
         
         # Calculate current value
-        if isinstance(start_value, (int, float)) and isinstance(end_value, (int, float)):
-            current_value = start_value + (end_value - start_value) * eased_progress
-        elif isinstance(start_value, str) and isinstance(end_value, str) and start_value.startswith('#') and end_value.startswith('#'):
+        if animation_data['ramp'] is not None:
             # Color interpolation
-            current_value = self._interpolate_color(start_value, end_value, eased_progress)
+            current_value = animation_data['ramp'](eased_progress)
+        elif isinstance(start_value, (int, float)) and isinstance(end_value, (int, float)):
+            current_value = start_value + (end_value - start_value) * eased_progress
         else:
             # For other types, jump to end when complete
             current_value = end_value if progress >= 1.0 else start_value
         
-        # Apply value to widget
-        try:
-            widget.tk_widget.configure(**{property_name: current_value})
-        except:
-            pass
+        # Committed together with every other update of this frame
+        animation_data['clock'].queue(widget.tk_widget, animation_data['property_name'], current_value)
         
-        # Continue animation or finish
-        if progress < 1.0:
-            # Schedule next frame
-            after_id = widget.tk_widget.after(16, lambda: self._run_animation(animation_id))  # ~60 FPS
-            self.running_animations[animation_id]['after_id'] = after_id
-        else:
-            # Animation complete
-            if widget in self.animations and property_name in self.animations[widget]:
-                del self.animations[widget][property_name]
-                if not self.animations[widget]:
-                    del self.animations[widget]
-            
-            del self.running_animations[animation_id]
-            
-            # Call callback if provided
-            if callback:
-                callback()
+        return progress < 1.0
+    
+    def _finish_animation(self, animation_id: int) -> Optional[Callable]:
+        """Remove a completed animation, returning its callback for the caller to run"""
+        animation_data = self.running_animations.pop(animation_id, None)
+        if animation_data is None:
+            return None
+        
+        widget = animation_data['widget']
+        property_name = animation_data['property_name']
+        if self.animations.get(widget, {}).get(property_name) == animation_id:
+            del self.animations[widget][property_name]
+            if not self.animations[widget]:
+                del self.animations[widget]
+        return animation_data['callback']
     
-    def _apply_easing(self, progress: float, easing: str) -> float:
+    def _apply_easing(self, progress: float, easing) -> float:
         """Apply easing function to progress"""
-        if easing == 'linear':
-            return progress
-        elif easing == 'ease-in':
-            return progress ** 2
-        elif easing == 'ease-out':
-            return 1 - (1 - progress) ** 2
-        elif easing == 'ease-in-out':
-            if progress < 0.5:
-                return 2 * progress ** 2
-            else:
-                return 1 - (-2 * progress + 2) ** 2 / 2
-        else:
+        try:
+            return get_easing(easing)(progress)
+        except ValueError:
             return progress
     
-    def _interpolate_color(self, start_color: str, end_color: str, progress: float) -> str:
+    def _interpolate_color(self, start_color: str, end_color: str, progress: float,
+                           color_space: str = 'srgb') -> str:
         """Interpolate between two hex colors"""
-        # Parse start color
-        if len(start_color) == 7:  # #RRGGBB
-            start_r = int(start_color[1:3], 16)
-            start_g = int(start_color[3:5], 16)
-            start_b = int(start_color[5:7], 16)
-        elif len(start_color) == 4:  # #RGB
-            start_r = int(start_color[1:2] + start_color[1:2], 16)
-            start_g = int(start_color[2:3] + start_color[2:3], 16)
-            start_b = int(start_color[3:4] + start_color[3:4], 16)
-        else:
-            return start_color
-        
-        # Parse end color
-        if len(end_color) == 7:  # #RRGGBB
-            end_r = int(end_color[1:3], 16)
-            end_g = int(end_color[3:5], 16)
-            end_b = int(end_color[5:7], 16)
-        elif len(end_color) == 4:  # #RGB
-            end_r = int(end_color[1:2] + end_color[1:2], 16)
-            end_g = int(end_color[2:3] + end_color[2:3], 16)
-            end_b = int(end_color[3:4] + end_color[3:4], 16)
-        else:
-            return end_color
-        
-        # Interpolate
-        r = int(start_r + (end_r - start_r) * progress)
-        g = int(start_g + (end_g - start_g) * progress)
-        b = int(start_b + (end_b - start_b) * progress)
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
+        try:
+            return color_ramp_cache.get(start_color, end_color, space=color_space)(progress)
+        except ValueError:
+            return end_color if progress >= 1.0 else start_color
     
     def stop_animation(self, widget, property_name: str):
         """Stop a specific animation"""
         if widget in self.animations and property_name in self.animations[widget]:
             animation_id = self.animations[widget][property_name]
-            if animation_id in self.running_animations:
-                animation = self.running_animations[animation_id]
-                widget.tk_widget.after_cancel(animation['after_id'])
-                del self.running_animations[animation_id]
+            self.running_animations.pop(animation_id, None)
             del self.animations[widget][property_name]
             if not self.animations[widget]:
                 del self.animations[widget]
@@ -175,4 +243,11 @@ class AnimationManager:
     
     def is_animating(self, widget, property_name: str) -> bool:
         """Check if a widget property is being animated"""
-        return widget in self.animations and property_name in self.animations[widget]
\ No newline at end of file
+        return widget in self.animations and property_name in self.animations[widget]
+    
+    def get_frame_stats(self, widget) -> Dict[str, Any]:
+        """Frame-time statistics of the clock driving a widget's animations"""
+        return FrameClock.for_widget(widget).get_stats()
+
+# Global animation manager instance
+animation_manager = AnimationManager()
\ No newline at end of file
@@ -1,7 +1,8 @@
 """Color manipulation and conversion utilities"""
 
 import colorsys
-from typing import Tuple, Union, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple, Union, Optional
 
 class Color:
     """Color manipulation class"""
@@ -107,4 +108,193 @@ class ColorUtils:
             amount = (i / (count // 2)) * 0.5
             palette.append(base_color.darken(amount))
         
-        return palette
\ No newline at end of file
+        return palette
+    
+    @staticmethod
+    def parse_hex(hex_color: str) -> Tuple[int, int, int]:
+        """Parse #RGB or #RRGGBB into an RGB tuple"""
+        digits = hex_color.lstrip('#')
+        if len(digits) == 3:
+            digits = ''.join(c * 2 for c in digits)
+        if len(digits) != 6:
+            raise ValueError(f"Invalid hex color: {hex_color}")
+        return tuple(int(digits[i:i+2], 16) for i in (0, 2, 4))
+    
+    @staticmethod
+    def split_alpha(color: str) -> Tuple[str, Optional[int]]:
+        """Split #RRGGBBAA into ('#RRGGBB', alpha); other colors have no alpha"""
+        if isinstance(color, str) and color.startswith('#') and len(color) == 9:
+            try:
+                return color[:7], int(color[7:], 16)
+            except ValueError:
+                pass
+        return color, None
+    
+    @staticmethod
+    def rgb_to_oklab(rgb: Tuple[int, int, int]) -> Tuple[float, float, float]:
+        """Convert 8-bit sRGB to OKLab"""
+        r, g, b = [x / 255.0 for x in rgb]
+        r, g, b = [x / 12.92 if x <= 0.04045 else ((x + 0.055) / 1.055) ** 2.4 for x in (r, g, b)]
+        
+        l = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b) ** (1 / 3)
+        m = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b) ** (1 / 3)
+        s = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b) ** (1 / 3)
+        
+        return (0.2104542553 * l + 0.7936177850 * m - 0.0040720468 * s,
+                1.9779984951 * l - 2.4285922050 * m + 0.4505937099 * s,
+                0.0259040371 * l + 0.7827717662 * m - 0.8086757660 * s)
+    
+    @staticmethod
+    def oklab_to_rgb(lab: Tuple[float, float, float]) -> Tuple[int, int, int]:
+        """Convert OKLab to 8-bit sRGB, clipped to gamut"""
+        L, a, b = lab
+        l = (L + 0.3963377774 * a + 0.2158037573 * b) ** 3
+        m = (L - 0.1055613458 * a - 0.0638541728 * b) ** 3
+        s = (L - 0.0894841775 * a - 1.2914855480 * b) ** 3
+        
+        linear = (4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s,
+                  -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s,
+                  -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s)
+        
+        rgb = []
+        for x in linear:
+            x = min(1.0, max(0.0, x))
+            x = x * 12.92 if x <= 0.0031308 else 1.055 * x ** (1 / 2.4) - 0.055
+            rgb.append(int(round(x * 255)))
+        return tuple(rgb)
+
+class ColorRamp:
+    """Precomputed hex colors between two endpoints"""
+    
+    def __init__(self, start: Tuple[int, int, int], end: Tuple[int, int, int],
+                 steps: int = 256, space: str = 'srgb'):
+        self.steps = steps
+        self.space = space
+        self.colors = self._build(start, end, steps, space)
+    
+    @staticmethod
+    def _build(start, end, steps: int, space: str) -> List[str]:
+        """Format every color of the ramp once"""
+        if space == 'oklab':
+            start_lab = ColorUtils.rgb_to_oklab(start)
+            end_lab = ColorUtils.rgb_to_oklab(end)
+            rgbs = []
+            for i in range(steps + 1):
+                t = i / steps
+                rgbs.append(ColorUtils.oklab_to_rgb(tuple(s + (e - s) * t for s, e in zip(start_lab, end_lab))))
+            # Keep the endpoints exact despite round-trip rounding
+            rgbs[0], rgbs[-1] = tuple(start), tuple(end)
+        elif space == 'srgb':
+            rgbs = []
+            for i in range(steps + 1):
+                t = i / steps
+                rgbs.append(tuple(int(s + (e - s) * t) for s, e in zip(start, end)))
+        else:
+            raise ValueError(f"Unknown color space: {space}")
+        
+        return [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in rgbs]
+    
+    def __call__(self, progress: float) -> str:
+        """Color at progress, clamped to [0, 1]"""
+        if progress <= 0.0:
+            return self.colors[0]
+        if progress >= 1.0:
+            return self.colors[-1]
+        return self.colors[int(progress * self.steps + 0.5)]
+
+class ColorRampCache:
+    """LRU cache of color ramps keyed by (start, end, steps, space)"""
+    
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self.ramps = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, start_color: str, end_color: str, steps: int = 256, space: str = 'srgb') -> ColorRamp:
+        """Get a ramp, building it on first use; raises ValueError for bad colors"""
+        key = (start_color, end_color, steps, space)
+        ramp = self.ramps.get(key)
+        if ramp is not None:
+            self.ramps.move_to_end(key)
+            self.hits += 1
+            return ramp
+        
+        self.misses += 1
+        ramp = ColorRamp(ColorUtils.parse_hex(start_color), ColorUtils.parse_hex(end_color), steps, space)
+        self.ramps[key] = ramp
+        if len(self.ramps) > self.max_size:
+            self.ramps.popitem(last=False)
+        return ramp
+    
+    def clear(self):
+        """Drop all cached ramps"""
+        self.ramps.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache counters"""
+        return {
+            'size': len(self.ramps),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+class AlphaBlendCache:
+    """LRU table of #RRGGBBAA colors pre-composited onto opaque backgrounds"""
+    
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.blends = OrderedDict()  # {(color, background): '#rrggbb'}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, color: str, background: str, tk_widget=None) -> str:
+        """Opaque equivalent of color drawn over background; Tk names need tk_widget to resolve"""
+        key = (color, background)
+        blended = self.blends.get(key)
+        if blended is not None:
+            self.blends.move_to_end(key)
+            self.hits += 1
+            return blended
+        
+        self.misses += 1
+        rgb, alpha = ColorUtils.split_alpha(color)
+        if alpha is None:
+            return color
+        
+        try:
+            under = ColorUtils.parse_hex(background)
+        except ValueError:
+            if tk_widget is None:
+                raise
+            r, g, b = tk_widget.winfo_rgb(background)
+            under = (r >> 8, g >> 8, b >> 8)
+        
+        a = alpha / 255.0
+        blended = "#%02x%02x%02x" % tuple(int(round(c * a + u * (1 - a))) for c, u in zip(ColorUtils.parse_hex(rgb), under))
+        self.blends[key] = blended
+        if len(self.blends) > self.max_size:
+            self.blends.popitem(last=False)
+        return blended
+    
+    def clear(self):
+        """Drop all cached blends"""
+        self.blends.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache counters"""
+        return {
+            'size': len(self.blends),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+# Global color ramp and alpha blend cache instances
+color_ramp_cache = ColorRampCache()
+alpha_blend_cache = AlphaBlendCache()
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""Easing curves for Modern TK animations"""
+
+import math
+import re
+from functools import lru_cache
+from typing import Callable, Tuple, Union
+
+# Samples per curve; evaluation interpolates between neighbouring samples
+TABLE_SIZE = 1024
+
+_SPEC_PATTERN = re.compile(r'^\s*([a-z][a-z-]*)\s*(?:\((.*)\))?\s*$')
+
+class EasingCurve:
+    """An easing function compiled once into a sampled lookup table"""
+    
+    __slots__ = ('name', 'table', 'size', 'interpolate')
+    
+    def __init__(self, name: str, func: Callable[[float], float], size: int = TABLE_SIZE,
+                 interpolate: bool = True):
+        self.name = name
+        self.size = size
+        self.interpolate = interpolate
+        self.table = [func(i / size) for i in range(size + 1)]
+        # Guard entry so table[i + 1] is always valid
+        self.table.append(self.table[-1])
+    
+    def __call__(self, progress: float) -> float:
+        """Eased value for progress in [0, 1]"""
+        if progress <= 0.0:
+            return self.table[0]
+        if progress >= 1.0:
+            return self.table[self.size]
+        
+        position = progress * self.size
+        index = int(position)
+        if not self.interpolate:
+            return self.table[index]
+        
+        low = self.table[index]
+        return low + (self.table[index + 1] - low) * (position - index)
+    
+    def __repr__(self) -> str:
+        return f"EasingCurve({self.name!r})"
+
+def get_easing(spec: Union[str, EasingCurve, Callable[[float], float]]) -> EasingCurve:
+    """Resolve an easing name, CSS timing function or callable to a cached compiled curve"""
+    # Names: linear, ease, ease-in, ease-out, ease-in-out, step-start, step-end
+    # Functions: cubic-bezier(x1, y1, x2, y2), steps(n[, jump-start|jump-end|jump-none|jump-both]),
+    # spring([mass[, stiffness[, damping[, velocity]]]])
+    if isinstance(spec, EasingCurve):
+        return spec
+    if callable(spec):
+        return _compile_function(spec)
+    if not isinstance(spec, str):
+        raise ValueError(f"Invalid easing: {spec!r}")
+    
+    match = _SPEC_PATTERN.match(spec.lower())
+    if not match:
+        raise ValueError(f"Invalid easing: {spec!r}")
+    
+    name, args = match.group(1), match.group(2)
+    params = tuple(part.strip() for part in args.split(',')) if args and args.strip() else ()
+    return _compile(name, params)
+
+@lru_cache(maxsize=64)
+def _compile_function(func: Callable[[float], float]) -> EasingCurve:
+    """Compile an arbitrary easing function; bounded, since a fresh lambda per call is a new key"""
+    return EasingCurve(getattr(func, '__name__', 'custom'), func)
+
+@lru_cache(maxsize=256)
+def _compile(name: str, params: Tuple[str, ...]) -> EasingCurve:
+    """Compile a named easing with its (string) parameters"""
+    if name in _KEYWORDS:
+        if params:
+            raise ValueError(f"Easing '{name}' takes no parameters")
+        return _compile(*_KEYWORDS[name])
+    
+    if name == 'linear' and not params:
+        return EasingCurve('linear', lambda p: p)
+    
+    if name == 'ease-in' and not params:
+        return EasingCurve('ease-in', lambda p: p ** 2)
+    
+    if name == 'ease-out' and not params:
+        return EasingCurve('ease-out', lambda p: 1 - (1 - p) ** 2)
+    
+    if name == 'ease-in-out' and not params:
+        return EasingCurve('ease-in-out', lambda p: 2 * p ** 2 if p < 0.5 else 1 - (-2 * p + 2) ** 2 / 2)
+    
+    if name == 'cubic-bezier':
+        x1, y1, x2, y2 = _numbers(name, params, 4)
+        if not (0.0 <= x1 <= 1.0 and 0.0 <= x2 <= 1.0):
+            raise ValueError("cubic-bezier x values must be in [0, 1]")
+        spec = f"cubic-bezier({x1:g}, {y1:g}, {x2:g}, {y2:g})"
+        return EasingCurve(spec, _cubic_bezier(x1, y1, x2, y2))
+    
+    if name == 'steps':
+        if not 1 <= len(params) <= 2:
+            raise ValueError("steps() takes a step count and an optional position")
+        count = int(_numbers(name, params[:1], 1)[0])
+        position = params[1] if len(params) > 1 else 'jump-end'
+        spec = f"steps({count}, {position})"
+        return EasingCurve(spec, _steps(count, position), interpolate=False)
+    
+    if name == 'spring':
+        defaults = (1.0, 100.0, 10.0, 0.0)
+        values = _numbers(name, params, len(params)) if params else ()
+        if len(values) > 4:
+            raise ValueError("spring() takes at most mass, stiffness, damping and velocity")
+        mass, stiffness, damping, velocity = tuple(values) + defaults[len(values):]
+        if mass <= 0 or stiffness <= 0 or damping < 0:
+            raise ValueError("spring() needs positive mass and stiffness and non-negative damping")
+        spec = f"spring({mass:g}, {stiffness:g}, {damping:g}, {velocity:g})"
+        return EasingCurve(spec, _spring(mass, stiffness, damping, velocity))
+    
+    raise ValueError(f"Unknown easing: {name}")
+
+# CSS keywords expressed as parameterised curves
+_KEYWORDS = {
+    'ease': ('cubic-bezier', ('0.25', '0.1', '0.25', '1')),
+    'step-start': ('steps', ('1', 'jump-start')),
+    'step-end': ('steps', ('1', 'jump-end')),
+}
+
+def _numbers(name: str, params: Tuple[str, ...], count: int) -> Tuple[float, ...]:
+    """Parse easing parameters as floats"""
+    if len(params) != count:
+        raise ValueError(f"{name}() takes {count} parameters, got {len(params)}")
+    try:
+        return tuple(float(p) for p in params)
+    except ValueError:
+        raise ValueError(f"Invalid {name}() parameters: {', '.join(params)}")
+
+def _cubic_bezier(x1: float, y1: float, x2: float, y2: float) -> Callable[[float], float]:
+    """CSS cubic-bezier timing function"""
+    # Polynomial coefficients for B(t) = ((a t + b) t + c) t
+    cx = 3 * x1
+    bx = 3 * (x2 - x1) - cx
+    ax = 1 - cx - bx
+    cy = 3 * y1
+    by = 3 * (y2 - y1) - cy
+    ay = 1 - cy - by
+    
+    def sample_x(t):
+        return ((ax * t + bx) * t + cx) * t
+    
+    def sample_y(t):
+        return ((ay * t + by) * t + cy) * t
+    
+    def slope_x(t):
+        return (3 * ax * t + 2 * bx) * t + cx
+    
+    def solve_t(x):
+        # Newton's method, falling back to bisection where the slope is flat
+        t = x
+        for _ in range(8):
+            error = sample_x(t) - x
+            if abs(error) < 1e-7:
+                return t
+            slope = slope_x(t)
+            if abs(slope) < 1e-6:
+                break
+            t -= error / slope
+        
+        low, high = 0.0, 1.0
+        t = x
+        while high - low > 1e-7:
+            if sample_x(t) < x:
+                low = t
+            else:
+                high = t
+            t = (low + high) / 2
+        return t
+    
+    return lambda p: sample_y(solve_t(p))
+
+def _steps(count: int, position: str) -> Callable[[float], float]:
+    """CSS steps() timing function"""
+    if count < 1:
+        raise ValueError("steps() needs at least one step")
+    
+    if position in ('jump-end', 'end'):
+        return lambda p: min(1.0, math.floor(p * count) / count)
+    if position in ('jump-start', 'start'):
+        return lambda p: min(1.0, math.floor(p * count + 1) / count)
+    if position == 'jump-none':
+        if count < 2:
+            raise ValueError("steps() with jump-none needs at least two steps")
+        return lambda p: min(1.0, math.floor(p * count) / (count - 1))
+    if position == 'jump-both':
+        return lambda p: min(1.0, math.floor(p * count + 1) / (count + 1))
+    raise ValueError(f"Invalid steps() position: {position}")
+
+def _spring(mass: float, stiffness: float, damping: float, velocity: float) -> Callable[[float], float]:
+    """Damped spring from 0 to 1, stretched so it settles at progress 1"""
+    omega = math.sqrt(stiffness / mass)
+    zeta = damping / (2 * math.sqrt(stiffness * mass))
+    
+    if zeta < 1:
+        omega_d = omega * math.sqrt(1 - zeta * zeta)
+        b = (zeta * omega - velocity) / omega_d
+        
+        def position(t):
+            envelope = math.exp(-zeta * omega * t)
+            return 1 - envelope * (math.cos(omega_d * t) + b * math.sin(omega_d * t))
+    else:
+        # Critically damped response; also used for over-damped springs
+        b = omega - velocity
+        
+        def position(t):
+            return 1 - (1 + b * t) * math.exp(-omega * t)
+    
+    # Settling time: last moment the spring is more than 0.1% away from rest
+    step = 0.001
+    settle = step
+    t = 0.0
+    while t < 60.0:
+        t += step
+        if abs(1 - position(t)) > 0.001:
+            settle = t
+        elif t - settle > 1.0 and t > 10 * step:
+            break
+    
+    return lambda p: 1.0 if p >= 1.0 else position(p * settle)
\ No newline at end of file
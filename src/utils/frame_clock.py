@@ -0,0 +1,319 @@
+"""Shared frame clock for Modern TK animations"""
+
+import time
+import tkinter as tk
+from collections import deque
+from typing import Any, Callable, Dict, Hashable
+
+class FrameClock:
+    """One frame clock per Tk root; ticks only while something is subscribed"""
+    
+    default_fps = 60
+    
+    # Global low-power mode: cap the frame rate while the app is unfocused
+    low_power = False
+    low_power_fps = 15
+    
+    # Interactive resize: root size changes this close together (ms) count as a drag,
+    # which ends once the size has been still for resize_idle_delay ms
+    resize_stream_window = 100
+    resize_idle_delay = 150
+    
+    def __init__(self, root, fps: int = None):
+        self.root = root
+        self.fps = fps or self.default_fps
+        self.subscribers = {}  # {key: callback(now) -> bool, False unsubscribes}
+        self.pending_updates = {}  # {tk_widget: {option: value}} committed once per tick
+        self.pending_items = {}  # {(canvas path, item, option): Tcl command} run as one script
+        
+        self._after_id = None
+        self._ticking = False  # inside _tick(), which reschedules itself at the end
+        self._next_due = 0.0
+        self._last_tick = None
+        
+        # Rolling window of recent frames for statistics
+        self._frame_times = deque(maxlen=120)  # ms of work per tick
+        self._intervals = deque(maxlen=120)    # ms between tick starts
+        self.frames = 0
+        self.dropped_frames = 0
+        
+        # Visibility and focus tracking
+        self.focused = True
+        self.visibility_handlers = []  # called when anything maps or unmaps
+        self._viewable = {}  # {tk_widget: bool}, cleared on every Map/Unmap
+        self._focus_check_id = None
+        
+        # Interactive resize tracking
+        self.resizing = False
+        self.resize_end_handlers = []  # called once a drag has settled
+        self._root_size = None
+        self._last_resize = 0.0
+        self._resize_end_id = None
+        self._bind_root()
+    
+    @classmethod
+    def for_widget(cls, widget) -> 'FrameClock':
+        """Get the shared clock for the root that owns a widget"""
+        tk_widget = getattr(widget, 'tk_widget', widget)
+        root = tk_widget._root()
+        clock = getattr(root, '_modern_tk_frame_clock', None)
+        if clock is None:
+            clock = cls(root)
+            root._modern_tk_frame_clock = clock
+        return clock
+    
+    @classmethod
+    def set_low_power(cls, enabled: bool = True, fps: int = None):
+        """Enable or disable the frame-rate cap for unfocused windows"""
+        cls.low_power = enabled
+        if fps:
+            cls.low_power_fps = fps
+    
+    @classmethod
+    def set_resize_idle_delay(cls, delay: int):
+        """Set how long (ms) the window must keep its size before full-quality rendering resumes"""
+        cls.resize_idle_delay = delay
+    
+    @property
+    def target_fps(self) -> int:
+        """Frame rate currently aimed for, after any low-power cap"""
+        if self.low_power and not self.focused:
+            return min(self.fps, self.low_power_fps)
+        return self.fps
+    
+    @property
+    def frame_interval(self) -> float:
+        """Seconds per frame"""
+        return 1.0 / self.target_fps
+    
+    @property
+    def running(self) -> bool:
+        """Whether a tick is scheduled"""
+        return self._after_id is not None or self._ticking
+    
+    def add(self, key: Hashable, callback: Callable[[float], bool]):
+        """Subscribe a per-frame callback; starts the clock if idle"""
+        self.subscribers[key] = callback
+        if self._after_id is None and not self._ticking:
+            self._next_due = time.perf_counter() + self.frame_interval
+            self._last_tick = None
+            self._schedule(self._next_due)
+    
+    def remove(self, key: Hashable):
+        """Unsubscribe a callback; the clock stops on its next tick if idle"""
+        self.subscribers.pop(key, None)
+    
+    def _bind_root(self):
+        """Watch mapping and focus changes anywhere under the root"""
+        try:
+            # Bound on 'all' so that unmapping an ancestor (a notebook tab,
+            # a withdrawn Toplevel, a scrolled-out canvas window) is seen too
+            self.root.bind_all('<Map>', self._on_map_change, add='+')
+            self.root.bind_all('<Unmap>', self._on_map_change, add='+')
+            self.root.bind('<FocusIn>', self._on_focus_change, add='+')
+            self.root.bind('<FocusOut>', self._on_focus_change, add='+')
+            self.root.bind('<Configure>', self._on_root_configure, add='+')
+        except tk.TclError:
+            pass
+    
+    def _on_root_configure(self, event):
+        """Detect a stream of root size changes, i.e. the user dragging a window edge"""
+        # The root's bindtag is on every widget it contains; only its own size matters
+        if event.widget is not self.root:
+            return
+        size = (event.width, event.height)
+        if size == self._root_size:
+            return
+        first = self._root_size is None
+        self._root_size = size
+        if first:
+            return
+        
+        now = time.perf_counter()
+        if now - self._last_resize <= self.resize_stream_window / 1000.0:
+            self.resizing = True
+        self._last_resize = now
+        
+        if self.resizing:
+            try:
+                if self._resize_end_id is not None:
+                    self.root.after_cancel(self._resize_end_id)
+                self._resize_end_id = self.root.after(self.resize_idle_delay, self._end_resize)
+            except tk.TclError:
+                pass
+    
+    def _end_resize(self):
+        """The size has settled; let deferred renderers catch up"""
+        self._resize_end_id = None
+        self.resizing = False
+        for handler in list(self.resize_end_handlers):
+            try:
+                handler()
+            except Exception as e:
+                print(f"Error in resize handler: {e}")
+    
+    def add_resize_end_handler(self, handler: Callable[[], None]):
+        """Call handler whenever an interactive resize ends"""
+        if handler not in self.resize_end_handlers:
+            self.resize_end_handlers.append(handler)
+    
+    def _on_map_change(self, event):
+        """Invalidate cached visibility and wake suspended subscribers"""
+        if not self._viewable:
+            return
+        self._viewable.clear()
+        for handler in list(self.visibility_handlers):
+            handler()
+    
+    def _on_focus_change(self, event):
+        """Re-check application focus once the focus events have settled"""
+        if self._focus_check_id is None:
+            try:
+                self._focus_check_id = self.root.after_idle(self._update_focus)
+            except tk.TclError:
+                pass
+    
+    def _update_focus(self):
+        """Record whether the application has keyboard focus"""
+        self._focus_check_id = None
+        try:
+            self.focused = bool(self.root.tk.call('focus', '-displayof', self.root._w))
+        except tk.TclError:
+            self.focused = True
+    
+    def is_viewable(self, tk_widget) -> bool:
+        """Whether a widget and all its ancestors are mapped; cached until the next Map/Unmap"""
+        viewable = self._viewable.get(tk_widget)
+        if viewable is None:
+            try:
+                viewable = bool(tk_widget.winfo_viewable())
+            except tk.TclError:
+                viewable = False
+            self._viewable[tk_widget] = viewable
+        return viewable
+    
+    def queue(self, tk_widget, option: str, value: Any):
+        """Queue an option change to be committed with the rest of this frame"""
+        updates = self.pending_updates.get(tk_widget)
+        if updates is None:
+            self.pending_updates[tk_widget] = {option: value}
+        else:
+            updates[option] = value
+    
+    def queue_item(self, canvas, item, option: str, value: Any):
+        """Queue a canvas item change ('coords', 'position' or an item option)"""
+        if option == 'coords':
+            command = 'coords %s %s' % (item, ' '.join('%g' % v for v in value))
+        elif option == 'position':
+            command = 'moveto %s %g %g' % (item, value[0], value[1])
+        else:
+            command = 'itemconfigure %s -%s {%s}' % (item, option, value)
+        self.pending_items[(canvas._w, item, option)] = command
+    
+    def _schedule(self, due: float):
+        """Schedule the next tick for a perf_counter deadline"""
+        delay = max(1, int(round((due - time.perf_counter()) * 1000)))
+        try:
+            self._after_id = self.root.after(delay, self._tick)
+        except tk.TclError:
+            # Root destroyed
+            self._after_id = None
+            self.subscribers.clear()
+    
+    def _tick(self):
+        """Advance every subscriber with the same timestamp, then commit"""
+        # Subscriptions made by callbacks during this tick are picked up by its own reschedule
+        self._after_id = None
+        self._ticking = True
+        try:
+            self._run_frame()
+        finally:
+            self._ticking = False
+        
+        if not self.subscribers:
+            return
+        
+        # Stay on the frame grid. If this tick overran one or more frame
+        # slots, skip them rather than firing a burst of catch-up ticks.
+        end = time.perf_counter()
+        interval = self.frame_interval
+        next_due = self._next_due + interval
+        if next_due <= end:
+            missed = int((end - next_due) / interval) + 1
+            self.dropped_frames += missed
+            next_due += missed * interval
+        self._next_due = next_due
+        self._schedule(next_due)
+    
+    def _run_frame(self):
+        """Run the subscribers and commit their changes"""
+        now = time.perf_counter()
+        
+        if self._last_tick is not None:
+            self._intervals.append((now - self._last_tick) * 1000)
+        self._last_tick = now
+        
+        for key, callback in list(self.subscribers.items()):
+            try:
+                keep = callback(now)
+            except Exception as e:
+                print(f"Error in frame callback: {e}")
+                keep = False
+            if not keep and self.subscribers.get(key) is callback:
+                del self.subscribers[key]
+        
+        self._commit()
+        
+        self._frame_times.append((time.perf_counter() - now) * 1000)
+        self.frames += 1
+    
+    def _commit(self):
+        """Apply all queued option changes, one configure call per widget"""
+        if self.pending_items:
+            # Every canvas item change of this frame in a single Tcl round trip;
+            # catch keeps one deleted item or canvas from aborting the rest
+            items, self.pending_items = self.pending_items, {}
+            script = ['catch {%s %s}' % (path, command) for (path, _, _), command in items.items()]
+            try:
+                self.root.tk.eval('\n'.join(script))
+            except tk.TclError:
+                pass
+        
+        if not self.pending_updates:
+            return
+        
+        updates, self.pending_updates = self.pending_updates, {}
+        for tk_widget, options in updates.items():
+            try:
+                tk_widget.configure(**options)
+            except tk.TclError:
+                pass
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Frame-time statistics over the recent window"""
+        frame_times = sorted(self._frame_times)
+        intervals = list(self._intervals)
+        
+        def percentile(values, fraction):
+            return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+        
+        return {
+            'fps_target': self.target_fps,
+            'low_power_active': self.target_fps < self.fps,
+            'resizing': self.resizing,
+            'frames': self.frames,
+            'dropped_frames': self.dropped_frames,
+            'subscribers': len(self.subscribers),
+            'avg_frame_time': sum(frame_times) / len(frame_times) if frame_times else 0.0,
+            'p95_frame_time': percentile(frame_times, 0.95),
+            'max_frame_time': frame_times[-1] if frame_times else 0.0,
+            'avg_interval': sum(intervals) / len(intervals) if intervals else 0.0,
+            'effective_fps': 1000.0 / (sum(intervals) / len(intervals)) if intervals else 0.0
+        }
+    
+    def reset_stats(self):
+        """Clear frame statistics"""
+        self._frame_times.clear()
+        self._intervals.clear()
+        self.frames = 0
+        self.dropped_frames = 0
\ No newline at end of file
@@ -5,30 +5,33 @@ from typing import Dict, Any, Optional, Tuple
 from PIL import Image, ImageTk
 import os
 
+from .image_cache import image_cache
+
 class IconManager:
     """Manages icons for the application"""
     
     def __init__(self):
         self.icons = {}  # {name: PhotoImage}
         self.icon_paths = {}  # {name: file_path}
+        self.icon_keys = {}  # {name: shared image cache key}
         self.default_size = (16, 16)
     
     def load_icon(self, name: str, file_path: str, size: Optional[Tuple[int, int]] = None) -> Optional[tk.PhotoImage]:
         """Load an icon from a file"""
-        try:
+        if size is None:
+            size = self.default_size
+        
+        def render():
             # Open image with PIL
             image = Image.open(file_path)
-            
-            # Resize if needed
-            if size is None:
-                size = self.default_size
             image = image.resize(size, Image.Resampling.LANCZOS)
             
             # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(image)
-            
-            # Store references
-            self.icons[name] = photo
+            return ImageTk.PhotoImage(image)
+        
+        try:
+            # The same file at the same size is loaded once however many names use it
+            photo = self._store(name, ('icon', os.path.abspath(file_path), tuple(size)), render)
             self.icon_paths[name] = file_path
             
             return photo
@@ -48,7 +51,7 @@ class IconManager:
         if font is None:
             font = ('Arial', max(8, size[1] - 4), 'normal')
         
-        try:
+        def render():
             # Create image
             image = Image.new('RGBA', size, (0, 0, 0, 0))
             
@@ -74,16 +77,22 @@ class IconManager:
             draw.text((x, y), text, fill=color, font=font_obj)
             
             # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(image)
-            
-            # Store reference
-            self.icons[name] = photo
-            
-            return photo
+            return ImageTk.PhotoImage(image)
+        
+        try:
+            return self._store(name, ('text_icon', text, tuple(size), tuple(font), color), render)
         except Exception as e:
             print(f"Error creating icon from text {name}: {e}")
             return None
     
+    def _store(self, name: str, key: tuple, render) -> tk.PhotoImage:
+        """Register an icon under a name, pinned in the shared image cache"""
+        photo = image_cache.acquire(key, render)
+        image_cache.release(self.icon_keys.get(name))
+        self.icons[name] = photo
+        self.icon_keys[name] = key
+        return photo
+    
     def set_default_size(self, width: int, height: int):
         """Set the default icon size"""
         self.default_size = (width, height)
@@ -109,6 +118,7 @@ class IconManager:
             del self.icons[name]
         if name in self.icon_paths:
             del self.icon_paths[name]
+        image_cache.release(self.icon_keys.pop(name, None))
     
     def list_icons(self) -> list:
         """List all loaded icons"""
@@ -116,8 +126,11 @@ class IconManager:
     
     def clear_icons(self):
         """Clear all loaded icons"""
+        for key in self.icon_keys.values():
+            image_cache.release(key)
         self.icons.clear()
         self.icon_paths.clear()
+        self.icon_keys.clear()
 
 # Global icon manager instance
 icon_manager = IconManager()
\ No newline at end of file
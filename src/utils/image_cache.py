@@ -0,0 +1,103 @@
+"""Process-wide image cache shared by effects and icons"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+class ImageCache:
+    """Byte-budgeted LRU of Tk images; images acquired by widgets are never evicted"""
+    
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = {}  # {key: [image, bytes, refs]}
+        self.idle = OrderedDict()  # keys with no references, least recently used first
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Image for key, created by factory() on a miss; the caller must not hold on to it"""
+        return self._fetch(key, factory, 0)
+    
+    def acquire(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Like get(), but pinned until a matching release()"""
+        return self._fetch(key, factory, 1)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+    
+    def _fetch(self, key: Hashable, factory: Callable[[], Any], refs: int) -> Any:
+        """Look up or create an image, adding refs references to it"""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            entry[2] += refs
+            if entry[2]:
+                self.idle.pop(key, None)
+            else:
+                self.idle.move_to_end(key)
+            return entry[0]
+        
+        self.misses += 1
+        image = factory()
+        size = image_bytes(image)
+        self.entries[key] = [image, size, refs]
+        if not refs:
+            self.idle[key] = None
+        self.total_bytes += size
+        self._evict()
+        return image
+    
+    def release(self, key: Optional[Hashable]):
+        """Drop one reference; unreferenced images become evictable"""
+        entry = self.entries.get(key)
+        if entry is None or entry[2] == 0:
+            return
+        
+        entry[2] -= 1
+        if entry[2] == 0:
+            self.idle[key] = None
+            self._evict()
+    
+    def _evict(self):
+        """Drop least recently used unreferenced images until within budget"""
+        while self.total_bytes > self.max_bytes and self.idle:
+            key, _ = self.idle.popitem(last=False)
+            _, size, _ = self.entries.pop(key)
+            self.total_bytes -= size
+            self.evictions += 1
+    
+    def set_budget(self, max_bytes: int):
+        """Change the byte budget, evicting right away if it shrank"""
+        self.max_bytes = max_bytes
+        self._evict()
+    
+    def clear(self):
+        """Drop every unreferenced image"""
+        for key in list(self.idle):
+            _, size, _ = self.entries.pop(key)
+            self.total_bytes -= size
+        self.idle.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache counters"""
+        lookups = self.hits + self.misses
+        return {
+            'images': len(self.entries),
+            'in_use': len(self.entries) - len(self.idle),
+            'bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions
+        }
+
+def image_bytes(image) -> int:
+    """Memory Tk holds for an image, or a tuple of images (32-bit pixels)"""
+    if isinstance(image, tuple):
+        return sum(image_bytes(part) for part in image)
+    return image.width() * image.height() * 4
+
+# Global image cache instance
+image_cache = ImageCache()
\ No newline at end of file
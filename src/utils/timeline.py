@@ -0,0 +1,289 @@
+"""Declarative animation timelines for Modern TK"""
+
+import re
+import time
+import tkinter as tk
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable, List, Optional, Sequence as SequenceType
+
+from .frame_clock import FrameClock
+from .easing import get_easing
+from .colors import color_ramp_cache
+
+# Marker for a tween that has not emitted a value yet
+_UNSET = object()
+
+class TimelineNode(ABC):
+    """Base class for anything that can be placed on a timeline"""
+    
+    duration = 0.0
+    
+    def __init__(self):
+        self.touched = False  # rendered at least once
+    
+    @abstractmethod
+    def render(self, t: float, clock: FrameClock, force: bool = False):
+        """Queue the state at local time t (ms, within [0, duration])"""
+        pass
+    
+    def targets(self) -> Iterable:
+        """Tk widgets this node animates"""
+        return ()
+
+class Tween(TimelineNode):
+    """One property of one widget moving from start to end"""
+    
+    def __init__(self, widget, property_name: str, start_value, end_value, duration: float,
+                 easing: str = 'linear', color_space: str = 'srgb'):
+        super().__init__()
+        self.tk_widget = getattr(widget, 'tk_widget', widget)
+        self.property_name = property_name
+        self.start_value = start_value
+        self.end_value = end_value
+        self.duration = max(0.0, float(duration))
+        self.easing = get_easing(easing)
+        
+        self.ramp = None
+        if isinstance(start_value, str) and isinstance(end_value, str) and start_value.startswith('#') and end_value.startswith('#'):
+            self.ramp = color_ramp_cache.get(start_value, end_value, space=color_space)
+        
+        # Last value handed to the clock; unchanged values are not re-queued
+        self._last = _UNSET
+    
+    def value_at(self, t: float):
+        """Property value at local time t"""
+        progress = t / self.duration if self.duration > 0 else 1.0
+        eased = self.easing(progress)
+        
+        if self.ramp is not None:
+            return self.ramp(eased)
+        if isinstance(self.start_value, (int, float)) and isinstance(self.end_value, (int, float)):
+            return self.start_value + (self.end_value - self.start_value) * eased
+        if isinstance(self.start_value, (tuple, list)) and isinstance(self.end_value, (tuple, list)) \
+                and len(self.start_value) == len(self.end_value):
+            return tuple(s + (e - s) * eased for s, e in zip(self.start_value, self.end_value))
+        return self.end_value if progress >= 1.0 else self.start_value
+    
+    def render(self, t: float, clock: FrameClock, force: bool = False):
+        """Queue the value at local time t unless it was already emitted"""
+        self.touched = True
+        if not force and not clock.is_viewable(self.tk_widget):
+            # Hidden; re-emitted once visible since the cache is left alone
+            return
+        
+        value = self.value_at(t)
+        if value != self._last:
+            self._last = value
+            self._emit(clock, value)
+    
+    def _emit(self, clock: FrameClock, value):
+        """Hand a new value to the clock"""
+        clock.queue(self.tk_widget, self.property_name, value)
+    
+    def targets(self) -> Iterable:
+        yield self.tk_widget
+
+class CanvasItemTween(Tween):
+    """One canvas item's coords, position (x, y), color or numeric option moving to a target"""
+    
+    _ITEM_PATTERN = re.compile(r'^[\w.:-]+$')
+    
+    def __init__(self, canvas, item, property_name: str, start_value, end_value, duration: float,
+                 easing: str = 'linear', color_space: str = 'srgb'):
+        canvas = getattr(canvas, 'tk_widget', canvas)
+        if not isinstance(item, int) and not self._ITEM_PATTERN.match(str(item)):
+            raise ValueError(f"Canvas item must be an id or a simple tag: {item!r}")
+        if start_value is None:
+            start_value = self._current(canvas, item, property_name)
+        if property_name in ('coords', 'position'):
+            start_value, end_value = tuple(start_value), tuple(end_value)
+        
+        self.item = item
+        super().__init__(canvas, property_name, start_value, end_value, duration, easing, color_space)
+    
+    @staticmethod
+    def _current(canvas, item, property_name: str):
+        """Read the item's current value"""
+        if property_name == 'coords':
+            return canvas.coords(item)
+        if property_name == 'position':
+            return canvas.coords(item)[:2]
+        
+        value = canvas.itemcget(item, property_name)
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            r, g, b = canvas.winfo_rgb(value)
+            return f"#{r >> 8:02x}{g >> 8:02x}{b >> 8:02x}"
+        except tk.TclError:
+            return value
+    
+    def _emit(self, clock: FrameClock, value):
+        """Batch the change into this frame's canvas script"""
+        clock.queue_item(self.tk_widget, self.item, self.property_name, value)
+
+class Delay(TimelineNode):
+    """A gap in a sequence"""
+    
+    def __init__(self, duration: float):
+        super().__init__()
+        self.duration = max(0.0, float(duration))
+    
+    def render(self, t: float, clock: FrameClock, force: bool = False):
+        self.touched = True
+
+class _Group(TimelineNode):
+    """Children placed at fixed offsets (ms) from the start of the group"""
+    
+    def __init__(self, children: List[TimelineNode], offsets: List[float]):
+        super().__init__()
+        self.children = list(zip(offsets, children))
+        self.duration = max((offset + child.duration for offset, child in self.children), default=0.0)
+    
+    def render(self, t: float, clock: FrameClock, force: bool = False):
+        """Render rewound children first and running ones last, so running values win"""
+        self.touched = True
+        running = []
+        for offset, child in self.children:
+            if t < offset:
+                # Not started; only reset children a yoyo pass has already moved
+                if child.touched:
+                    child.render(0.0, clock, force)
+            elif t >= offset + child.duration:
+                child.render(child.duration, clock, force)
+            else:
+                running.append((child, t - offset))
+        
+        for child, local in running:
+            child.render(local, clock, force)
+    
+    def targets(self) -> Iterable:
+        for _, child in self.children:
+            yield from child.targets()
+
+class Sequence(_Group):
+    """Children one after another"""
+    
+    def __init__(self, *children: TimelineNode):
+        offsets = []
+        position = 0.0
+        for child in children:
+            offsets.append(position)
+            position += child.duration
+        super().__init__(list(children), offsets)
+
+class Parallel(_Group):
+    """Children together, optionally each with its own start offset"""
+    
+    def __init__(self, *children: TimelineNode, offsets: Optional[SequenceType[float]] = None):
+        super().__init__(list(children), list(offsets) if offsets is not None else [0.0] * len(children))
+
+def stagger(widgets: Iterable, factory: Callable[[Any], TimelineNode], each: float = 30) -> Parallel:
+    """Run factory(widget) for every widget, each starting `each` ms after the previous"""
+    children = [factory(widget) for widget in widgets]
+    return Parallel(*children, offsets=[i * each for i in range(len(children))])
+
+class Timeline:
+    """Plays a node tree from one frame-clock subscription with one cancel handle"""
+    
+    def __init__(self, node: TimelineNode, repeat: int = 0, yoyo: bool = False,
+                 callback: Optional[Callable] = None):
+        self.node = node
+        self.repeat = repeat  # extra iterations; -1 repeats forever
+        self.yoyo = yoyo      # every other iteration runs backwards
+        self.callback = callback
+        self.clock = None
+        self.start_time = None
+        self.running = False
+        self._targets = ()    # distinct widgets the tree animates
+        self._wake_id = None  # timer ending a sleep while every target is hidden
+    
+    @property
+    def total_duration(self) -> float:
+        """Length of all iterations in ms (inf when repeating forever)"""
+        if self.repeat < 0:
+            return float('inf')
+        return self.node.duration * (self.repeat + 1)
+    
+    def play(self, root=None) -> 'Timeline':
+        """Start (or restart) from the beginning; a tree animating no widget (only Delays) needs root for its clock"""
+        self.cancel()
+        self._targets = tuple(dict.fromkeys(self.node.targets()))
+        if root is None:
+            if not self._targets:
+                raise ValueError("Timeline has no widget targets; pass play(root=...) to time it")
+            root = self._targets[0]
+        self.clock = FrameClock.for_widget(root)
+        self.start_time = time.perf_counter()
+        self.running = True
+        self.clock.add(self, self._on_frame)
+        return self
+    
+    def cancel(self):
+        """Stop without applying the remaining frames"""
+        if self.running:
+            self.running = False
+            self._cancel_wake()
+            self.clock.remove(self)
+    
+    def _on_frame(self, now: float) -> bool:
+        """Render the whole tree at the current time"""
+        if not self.running:
+            return False
+        
+        elapsed = (now - self.start_time) * 1000
+        duration = self.node.duration
+        
+        if elapsed >= self.total_duration or duration <= 0:
+            # Final state, applied even to hidden widgets
+            reverse = self.yoyo and self.repeat >= 0 and self.repeat % 2 == 1
+            self.node.render(0.0 if reverse else duration, self.clock, force=True)
+            self.running = False
+            self._complete()
+            return False
+        
+        if self._targets and not any(self.clock.is_viewable(target) for target in self._targets):
+            # Nothing to draw; time keeps running so it resumes where it would have been
+            self._sleep(self.start_time + self.total_duration / 1000)
+            return False
+        
+        iteration, local = divmod(elapsed, duration)
+        if self.yoyo and int(iteration) % 2 == 1:
+            local = duration - local
+        self.node.render(local, self.clock)
+        return True
+    
+    def _sleep(self, wake_at: float):
+        """Stop ticking until wake_at or the next visibility change"""
+        self._cancel_wake()
+        self.clock.visibility_handlers.append(self._wake)
+        if wake_at != float('inf'):
+            delay = max(1, int((wake_at - time.perf_counter()) * 1000) + 1)
+            try:
+                self._wake_id = self.clock.root.after(delay, self._wake)
+            except tk.TclError:
+                pass
+    
+    def _cancel_wake(self):
+        """Drop the wake-up timer and visibility handler of a sleep"""
+        if self._wake in self.clock.visibility_handlers:
+            self.clock.visibility_handlers.remove(self._wake)
+        if self._wake_id is not None:
+            try:
+                self.clock.root.after_cancel(self._wake_id)
+            except tk.TclError:
+                pass
+            self._wake_id = None
+    
+    def _wake(self):
+        """Resume ticking after a sleep"""
+        self._cancel_wake()
+        if self.running:
+            self.clock.add(self, self._on_frame)
+    
+    def _complete(self):
+        """Run the completion callback"""
+        if self.callback:
+            self.callback()
\ No newline at end of file
@@ -3,11 +3,13 @@
 from typing import Dict, Any, Union, List, Optional
 import re
 
+from .easing import get_easing
+
 class StyleValidator:
     """Validates style properties and values"""
     
     def __init__(self):
-        self.color_pattern = re.compile(r'^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$')
+        self.color_pattern = re.compile(r'^#([A-Fa-f0-9]{8}|[A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$')
     
     def validate(self, style_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Validate a style dictionary"""
@@ -52,6 +54,9 @@ class StyleValidator:
         elif prop == 'gradient' and isinstance(value, dict):
             return self.validate_gradient(value)
         
+        elif prop == 'transition' and isinstance(value, dict):
+            return self.validate_transition(value)
+        
         # Padding/margin
         elif prop in ['padding', 'margin']:
             return self.validate_spacing(value)
@@ -132,7 +137,18 @@ class StyleValidator:
             valid_shadow['blur'] = self.validate_number(shadow['blur'])
         
         if 'color' in shadow:
-            valid_shadow['color'] = self.validate_color(shadow['color'])
+            color = shadow['color']
+            # Shadows are pre-blended, so they may carry their own alpha (#RRGGBBAA)
+            if isinstance(color, str) and re.match(r'^#[A-Fa-f0-9]{8}$', color):
+                valid_shadow['color'] = color
+            else:
+                valid_shadow['color'] = self.validate_color(color)
+        
+        if 'opacity' in shadow:
+            opacity = self.validate_number(shadow['opacity'])
+            if not 0 <= opacity <= 1:
+                raise ValueError("Shadow opacity must be between 0 and 1")
+            valid_shadow['opacity'] = opacity
         
         return valid_shadow
     
@@ -149,15 +165,59 @@ class StyleValidator:
         if 'colors' in gradient:
             colors = gradient['colors']
             if isinstance(colors, list) and len(colors) >= 2:
-                valid_gradient['colors'] = [self.validate_color(c) for c in colors]
+                valid_gradient['colors'] = [self._validate_gradient_stop(c) for c in colors]
             else:
                 raise ValueError("Gradient colors must be list of at least 2 colors")
         
         if 'direction' in gradient:
-            valid_gradient['direction'] = gradient['direction']
+            direction = gradient['direction']
+            if direction not in ('vertical', 'horizontal') and not isinstance(direction, (int, float)):
+                raise ValueError("Gradient direction must be 'vertical', 'horizontal' or an angle in degrees")
+            valid_gradient['direction'] = direction
         
         return valid_gradient
     
+    def _validate_gradient_stop(self, stop):
+        """Validate a gradient color or (offset, color) stop"""
+        if isinstance(stop, (tuple, list)) and len(stop) == 2:
+            offset = self.validate_number(stop[0])
+            if not 0 <= offset <= 1:
+                raise ValueError("Gradient stop offset must be between 0 and 1")
+            return (offset, self.validate_color(stop[1]))
+        return self.validate_color(stop)
+    
+    def validate_transition(self, transition: dict) -> dict:
+        """Validate transition specification"""
+        valid_transition = {}
+        
+        if 'duration' in transition:
+            valid_transition['duration'] = self.validate_number(transition['duration'])
+        
+        if 'easing' in transition:
+            if isinstance(transition['easing'], str):
+                # Raises ValueError for unknown or malformed curves
+                get_easing(transition['easing'])
+                valid_transition['easing'] = transition['easing']
+            else:
+                raise ValueError("Transition easing must be a string")
+        
+        if 'color_space' in transition:
+            if transition['color_space'] in ('srgb', 'oklab'):
+                valid_transition['color_space'] = transition['color_space']
+            else:
+                raise ValueError("Transition color_space must be 'srgb' or 'oklab'")
+        
+        if 'properties' in transition:
+            properties = transition['properties']
+            if isinstance(properties, str):
+                properties = [properties]
+            if isinstance(properties, (list, tuple)) and all(isinstance(p, str) for p in properties):
+                valid_transition['properties'] = list(properties)
+            else:
+                raise ValueError("Transition properties must be a list of property names")
+        
+        return valid_transition
+    
     def validate_spacing(self, spacing: Union[int, tuple, list]) -> tuple:
         """Validate spacing (padding/margin) values"""
         if isinstance(spacing, (int, float)):
@@ -42,7 +42,8 @@ class Button(BaseWidget):
             'hover_bg': '#e0e0e0',
             'active_bg': '#d0d0d0',
             'radius': 0,
-            'padding': (8, 4)
+            'padding': (8, 4),
+            'transition': {'duration': 150, 'easing': 'ease-out', 'properties': ['bg', 'fg']}
         }
     
     def _setup_events(self):
@@ -51,10 +52,6 @@ class Button(BaseWidget):
         
         # Add click animation
         self.bind_event('button_press', self._animate_click)
-        
-        # Custom hover effects
-        self.bind_event('hover_start', self._on_hover_start)
-        self.bind_event('hover_end', self._on_hover_end)
     
     def _animate_click(self, event):
         """Animate button click"""
@@ -67,22 +64,11 @@ class Button(BaseWidget):
         # Restore after short delay
         self.tk_widget.after(100, lambda: self.tk_widget.configure(relief=original_relief))
     
-    def _on_hover_start(self, event):
-        """Handle hover start with smooth transition"""
-        if 'hover_bg' in self.style_states['hover']:
-            # Could add animation here
-            pass
-    
-    def _on_hover_end(self, event):
-        """Handle hover end"""
-        if 'hover_bg' in self.style_states['hover']:
-            # Could add animation here
-            pass
-    
     def set_text(self, text: str):
         """Set button text"""
         self.text = text
         self.tk_widget.configure(text=text)
+        self._content_changed()
     
     def get_text(self) -> str:
         """Get button text"""
@@ -5,6 +5,8 @@ Enhanced Canvas widget with styling support.
 import tkinter as tk
 from typing import Dict, Any
 from ..core.base_widget import BaseWidget
+from ..effects.background import CANVAS_CONTENT
+from ..utils.animations import animation_manager
 
 class Canvas(BaseWidget):
     """Enhanced Canvas with modern styling"""
@@ -53,8 +55,8 @@ class Canvas(BaseWidget):
         self.tk_widget.delete(item)
     
     def delete_all(self):
-        """Delete all items from the canvas"""
-        self.tk_widget.delete("all")
+        """Delete all items from the canvas, keeping its background layer"""
+        self.tk_widget.delete(CANVAS_CONTENT)
     
     def move(self, item, dx, dy):
         """Move an item on the canvas"""
@@ -62,4 +64,8 @@ class Canvas(BaseWidget):
     
     def itemconfig(self, item, **kwargs):
         """Configure an item on the canvas"""
-        self.tk_widget.itemconfig(item, **kwargs)
\ No newline at end of file
+        self.tk_widget.itemconfig(item, **kwargs)
+    
+    def animate_item(self, item, property_name, end_value, duration=300, easing='ease-out', **kwargs):
+        """Animate an item's 'coords', 'position' (x, y), color or numeric option"""
+        return animation_manager.animate_item(self, item, property_name, end_value, duration, easing, **kwargs)
\ No newline at end of file
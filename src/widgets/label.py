@@ -39,6 +39,7 @@ class Label(BaseWidget):
         """Set label text"""
         self.text = text
         self.tk_widget.configure(text=text)
+        self._content_changed()
     
     def get_text(self) -> str:
         """Get label text"""
@@ -5,6 +5,8 @@ Enhanced ProgressBar widget with styling support.
 import tkinter as tk
 from typing import Dict, Any
 from ..core.base_widget import BaseWidget
+from ..effects.background import CANVAS_CONTENT
+from ..utils.animations import animation_manager
 
 class ProgressBar(BaseWidget):
     """Enhanced ProgressBar with modern styling"""
@@ -12,6 +14,7 @@ class ProgressBar(BaseWidget):
     def __init__(self, parent=None, value=0, maximum=100, style=None, style_class=None, **kwargs):
         self.value = value
         self.maximum = maximum
+        self._progress_timeline = None
         super().__init__(parent, style, style_class, **kwargs)
         self._update_progress()
     
@@ -37,8 +40,8 @@ class ProgressBar(BaseWidget):
     
     def _update_progress(self):
         """Update the progress bar display"""
-        # Clear the canvas
-        self.tk_widget.delete("all")
+        # Clear the canvas, keeping its background layer
+        self.tk_widget.delete(CANVAS_CONTENT)
         
         # Get widget dimensions
         width = self.tk_widget.winfo_width()
@@ -58,17 +61,39 @@ class ProgressBar(BaseWidget):
         # Calculate progress width
         progress_width = int((self.value / self.maximum) * width) if self.maximum > 0 else 0
         
-        # Draw progress
-        if progress_width > 0:
-            self.tk_widget.create_rectangle(0, 0, progress_width, height,
-                                           fill=self.style_dict.get('fg', '#0078d4'),
-                                           outline="")
+        # Draw progress; always created so animate_value() has an item to move
+        self.tk_widget.create_rectangle(0, 0, progress_width, height,
+                                       fill=self.style_dict.get('fg', '#0078d4'),
+                                       outline="", tags='progress')
     
     def set_value(self, value):
         """Set the progress value"""
+        if self._progress_timeline:
+            self._progress_timeline.cancel()
         self.value = max(0, min(value, self.maximum))
         self._update_progress()
     
+    def animate_value(self, value, duration=300, easing='ease-out'):
+        """Slide the progress fill to a new value"""
+        value = max(0, min(value, self.maximum))
+        if self._progress_timeline:
+            self._progress_timeline.cancel()
+        
+        coords = self.tk_widget.coords('progress')
+        if len(coords) != 4:
+            self.set_value(value)
+            return
+        
+        width = self.tk_widget.winfo_width()
+        if width <= 1:
+            width = self.style_dict.get('width', 200)
+        x1, y1, _, y2 = coords
+        end_x = (value / self.maximum) * width if self.maximum > 0 else 0
+        
+        self.value = value
+        self._progress_timeline = animation_manager.animate_item(
+            self, 'progress', 'coords', (x1, y1, end_x, y2), duration, easing)
+    
     def get_value(self) -> int:
         """Get the progress value"""
         return self.value
@@ -0,0 +1,40 @@
+"""Shared fixtures: a display-less Tcl interpreter, a way to run its event loop and a stand-in widget"""
+
+import time
+import tkinter as tk
+
+import pytest
+
+
+@pytest.fixture
+def root():
+    interp = tk.Tcl()
+    yield interp
+    for after_id in interp.tk.splitlist(interp.tk.call('after', 'info')):
+        interp.after_cancel(after_id)
+
+
+def pump(root, seconds):
+    """Run the Tcl event loop for a while"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        if not root.dooneevent(tk._tkinter.DONT_WAIT):
+            time.sleep(0.001)
+
+
+class Target:
+    """Stand-in for a Tk widget: records configure calls and can be hidden"""
+    
+    def __init__(self, root, viewable=True):
+        self.root = root
+        self.viewable = viewable
+        self.configured = []
+    
+    def _root(self):
+        return self.root
+    
+    def winfo_viewable(self):
+        return self.viewable
+    
+    def configure(self, **options):
+        self.configured.append(options)
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""Tests for the animation manager, driven by a display-less Tcl interpreter"""
+
+from src.utils.animations import AnimationManager
+from tests.conftest import Target, pump
+
+
+class Widget:
+    """Modern TK widget stand-in wrapping a Target"""
+    
+    def __init__(self, root):
+        self.tk_widget = Target(root)
+
+
+def test_a_failing_callback_does_not_stop_other_animations(root, capsys):
+    manager = AnimationManager()
+    short = Widget(root)
+    long = Widget(root)
+    finished = []
+    
+    def fail():
+        raise RuntimeError('boom')
+    
+    manager.animate_property(short, 'width', 0, 100, 50, callback=fail)
+    manager.animate_property(long, 'width', 0, 100, 200, callback=lambda: finished.append(True))
+    pump(root, 0.4)
+    
+    assert long.tk_widget.configured[-1] == {'width': 100}
+    assert finished == [True]
+    assert manager.running_animations == {}
+    assert 'Error in animation callback: boom' in capsys.readouterr().out
+
+
+def test_callbacks_see_every_finished_animation_removed(root):
+    manager = AnimationManager()
+    widgets = [Widget(root) for _ in range(2)]
+    seen = []
+    
+    for widget in widgets:
+        manager.animate_property(widget, 'width', 0, 100, 0,
+                                 callback=lambda: seen.append(len(manager.running_animations)))
+    pump(root, 0.1)
+    
+    assert seen == [0, 0]
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""Tests for the asyncio/Tk loop, driven by a display-less Tcl interpreter"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core.async_loop import AsyncTkLoop, async_handler, spawn
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_with_loop(root, main):
+    """Run main() alongside an AsyncTkLoop pumping root; stop the pump when it returns"""
+    tk_loop = AsyncTkLoop(root)
+    
+    async def driver():
+        try:
+            return await main(tk_loop)
+        finally:
+            tk_loop.stop()
+    
+    async def runner():
+        task = asyncio.ensure_future(driver())
+        await tk_loop.run()
+        return await task
+    
+    return tk_loop, asyncio.run(runner())
+
+
+def test_tk_timers_stay_on_time_under_thousands_of_coroutines(root):
+    ticks = 0
+    
+    async def worker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+    
+    async def main(tk_loop):
+        for _ in range(2000):
+            tk_loop.spawn(worker())
+        
+        # Tk timers stand in for input events: the delay past their due time is input latency
+        lateness = []
+        done = asyncio.get_running_loop().create_future()
+        
+        def schedule():
+            due = time.perf_counter() + 0.005
+            
+            def fire():
+                lateness.append(time.perf_counter() - due)
+                if len(lateness) < 200:
+                    schedule()
+                elif not done.done():
+                    done.set_result(None)
+            
+            root.after(5, fire)
+        
+        schedule()
+        await asyncio.wait_for(done, 30)
+        return lateness
+    
+    tk_loop, lateness = run_with_loop(root, main)
+    
+    assert ticks > 2000 * 10
+    assert percentile(lateness, 0.99) < 0.1
+    assert not tk_loop.tasks
+
+
+def test_idle_loop_backs_off_instead_of_spinning(root):
+    async def main(tk_loop):
+        await asyncio.sleep(0.5)
+    
+    tk_loop, _ = run_with_loop(root, main)
+    
+    # At the 16 ms ceiling half a second is ~30 pumps; a busy poll would be thousands
+    assert tk_loop.get_stats()['pumps'] < 100
+
+
+def test_handlers_schedule_coroutines_on_the_running_loop(root):
+    results = []
+    
+    @async_handler
+    async def on_click(value):
+        await asyncio.sleep(0)
+        results.append(value)
+    
+    async def main(tk_loop):
+        root.after(1, lambda: on_click('clicked'))
+        while not results:
+            await asyncio.sleep(0.005)
+    
+    run_with_loop(root, main)
+    
+    assert results == ['clicked']
+
+
+def test_spawn_outside_the_loop_raises():
+    async def noop():
+        pass
+    
+    coro = noop()
+    with pytest.raises(RuntimeError):
+        spawn(coro)
+    coro.close()
+
+
+def test_loop_spawn_before_run_raises(root):
+    async def noop():
+        pass
+    
+    coro = noop()
+    with pytest.raises(RuntimeError):
+        AsyncTkLoop(root).spawn(coro)
+    coro.close()
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""Tests for precomputed color ramps and OKLab conversion"""
+
+import pytest
+
+from src.utils.colors import ColorRamp, ColorRampCache, ColorUtils
+
+
+@pytest.mark.parametrize('rgb', [(0, 0, 0), (255, 255, 255), (255, 0, 0), (0, 128, 255),
+                                 (18, 52, 86), (250, 200, 10)])
+def test_oklab_round_trips_to_the_same_rgb(rgb):
+    assert ColorUtils.oklab_to_rgb(ColorUtils.rgb_to_oklab(rgb)) == rgb
+
+
+def test_oklab_matches_reference_values():
+    # White is L=1 with no chroma; sRGB red from the OKLab reference
+    white = ColorUtils.rgb_to_oklab((255, 255, 255))
+    red = ColorUtils.rgb_to_oklab((255, 0, 0))
+    
+    assert white == pytest.approx((1.0, 0.0, 0.0), abs=1e-4)
+    assert red == pytest.approx((0.6279, 0.2249, 0.1258), abs=1e-3)
+
+
+@pytest.mark.parametrize('space', ['srgb', 'oklab'])
+def test_ramp_hits_its_endpoints_and_clamps(space):
+    ramp = ColorRamp((255, 0, 0), (0, 0, 255), steps=64, space=space)
+    
+    assert len(ramp.colors) == 65
+    assert ramp(0.0) == ramp(-1.0) == '#ff0000'
+    assert ramp(1.0) == ramp(2.0) == '#0000ff'
+
+
+def test_srgb_ramp_interpolates_channels_linearly():
+    ramp = ColorRamp((0, 0, 0), (200, 100, 50), steps=4)
+    
+    assert ramp.colors == ['#000000', '#32190c', '#643219', '#964b25', '#c86432']
+    assert ramp(0.5) == '#643219'
+
+
+def test_oklab_ramp_keeps_perceived_lightness_even():
+    srgb = ColorRamp((0, 0, 0), (255, 255, 255), steps=10, space='srgb')
+    oklab = ColorRamp((0, 0, 0), (255, 255, 255), steps=10, space='oklab')
+    
+    def lightness(color):
+        return ColorUtils.rgb_to_oklab(ColorUtils.parse_hex(color))[0]
+    
+    # sRGB midpoints look light-heavy; OKLab steps evenly in L
+    assert lightness(oklab(0.5)) == pytest.approx(0.5, abs=0.01)
+    assert lightness(srgb(0.5)) > 0.55
+
+
+def test_unknown_space_raises():
+    with pytest.raises(ValueError):
+        ColorRamp((0, 0, 0), (255, 255, 255), space='hsv')
+
+
+def test_cache_reuses_ramps_and_evicts_least_recently_used():
+    cache = ColorRampCache(max_size=2)
+    first = cache.get('#000000', '#ffffff')
+    
+    assert cache.get('#000000', '#ffffff') is first
+    assert cache.get('#000000', '#ffffff', space='oklab') is not first
+    
+    cache.get('#000000', '#ffffff')
+    cache.get('#ff0000', '#00ff00')
+    
+    # The OKLab ramp was used least recently
+    assert ('#000000', '#ffffff', 256, 'oklab') not in cache.ramps
+    assert cache.get('#000000', '#ffffff') is first
+    assert cache.get_stats() == {'size': 2, 'max_size': 2, 'hits': 3, 'misses': 3}
+
+
+def test_cache_rejects_bad_colors():
+    with pytest.raises(ValueError):
+        ColorRampCache().get('#12', '#ffffff')
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""Tests for the worker-thread UI dispatcher"""
+
+import threading
+import time
+
+from src.core.dispatcher import UIDispatcher
+from tests.conftest import pump
+
+
+class Widget:
+    def __init__(self):
+        self.texts = []
+    
+    def set_text(self, text):
+        self.texts.append(text)
+
+
+def test_plain_posts_run_in_order_and_are_never_coalesced():
+    dispatcher = UIDispatcher(None)
+    calls = []
+    for i in range(5):
+        dispatcher.post(calls.append, i)
+    dispatcher.post(calls.append, 0)
+    
+    assert dispatcher.drain() == 6
+    assert calls == [0, 1, 2, 3, 4, 0]
+    assert dispatcher.get_stats()['coalesced'] == 0
+
+
+def test_updates_coalesce_to_the_latest_value_in_first_post_order():
+    dispatcher = UIDispatcher(None)
+    first, second = Widget(), Widget()
+    calls = []
+    dispatcher.set_text(first, 'a')
+    dispatcher.post(calls.append, 'plain')
+    dispatcher.set_text(second, 'x')
+    dispatcher.set_text(first, 'b')
+    dispatcher.set_text(first, 'c')
+    dispatcher.post_update(first, 'other', calls.append, 'other')
+    
+    assert dispatcher.drain() == 4
+    assert first.texts == ['c']
+    assert second.texts == ['x']
+    assert calls == ['plain', 'other']
+    assert dispatcher.get_stats()['coalesced'] == 2
+
+
+def test_drain_stops_at_the_time_budget():
+    dispatcher = UIDispatcher(None)
+    for _ in range(100):
+        dispatcher.post(time.sleep, 0.002)
+    
+    executed = dispatcher.drain(budget=10)
+    
+    assert 1 <= executed < 20
+    assert dispatcher.pending_count() == 100 - executed
+
+
+def test_max_batch_limits_how_much_of_the_inbox_is_pulled():
+    dispatcher = UIDispatcher(None, max_batch=10)
+    calls = []
+    for i in range(25):
+        dispatcher.post(calls.append, i)
+    
+    assert dispatcher.drain() == 10
+    assert dispatcher.drain() == 10
+    assert dispatcher.drain() == 5
+    assert calls == list(range(25))
+
+
+def test_errors_are_counted_and_do_not_stop_the_batch(capsys):
+    dispatcher = UIDispatcher(None)
+    calls = []
+    dispatcher.post(lambda: 1 / 0)
+    dispatcher.post(calls.append, 'after')
+    
+    dispatcher.drain()
+    
+    assert calls == ['after']
+    assert dispatcher.get_stats()['errors'] == 1
+    assert 'Error in dispatched callback' in capsys.readouterr().out
+
+
+def test_ticks_drain_posts_from_worker_threads(root):
+    dispatcher = UIDispatcher(root, interval=5, idle_interval=5)
+    dispatcher.start()
+    calls = []
+    
+    def worker(n):
+        for i in range(200):
+            dispatcher.post(calls.append, (n, i))
+    
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    pump(root, 0.2)
+    dispatcher.stop()
+    
+    assert len(calls) == 800
+    for n in range(4):
+        assert [i for m, i in calls if m == n] == list(range(200))
+    assert dispatcher.get_stats()['ticks'] > 0
\ No newline at end of file
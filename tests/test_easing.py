@@ -0,0 +1,81 @@
+"""Tests for compiled easing curves"""
+
+import pytest
+
+from src.utils.easing import TABLE_SIZE, EasingCurve, _compile_function, get_easing
+
+
+@pytest.mark.parametrize('spec', ['linear', 'ease', 'ease-in', 'ease-out', 'ease-in-out',
+                                  'cubic-bezier(0.4, 0, 0.2, 1)', 'spring()', 'spring(1, 170, 26)'])
+def test_curves_run_from_zero_to_one(spec):
+    curve = get_easing(spec)
+    
+    assert curve(0.0) == pytest.approx(0.0, abs=1e-6)
+    assert curve(1.0) == pytest.approx(1.0, abs=2e-3)
+    assert curve(-0.5) == curve(0.0)
+    assert curve(1.5) == curve(1.0)
+
+
+def test_table_interpolates_between_samples():
+    curve = get_easing('ease-in')
+    
+    assert len(curve.table) == TABLE_SIZE + 2
+    for progress in (0.1, 0.3333, 0.5, 0.77, 0.999):
+        assert curve(progress) == pytest.approx(progress ** 2, abs=1e-6)
+
+
+def test_cubic_bezier_matches_css_ease():
+    curve = get_easing('cubic-bezier(0.25, 0.1, 0.25, 1)')
+    
+    # Reference values for CSS 'ease'
+    assert curve(0.25) == pytest.approx(0.4094, abs=1e-3)
+    assert curve(0.5) == pytest.approx(0.8024, abs=1e-3)
+    assert curve(0.75) == pytest.approx(0.9604, abs=1e-3)
+
+
+@pytest.mark.parametrize('spec, values', [
+    ('steps(4)', [0.0, 0.25, 0.5, 0.75, 1.0]),
+    ('steps(4, jump-start)', [0.25, 0.5, 0.75, 1.0, 1.0]),
+    ('steps(5, jump-none)', [0.0, 0.25, 0.5, 1.0, 1.0]),
+    ('steps(3, jump-both)', [0.25, 0.25, 0.5, 0.75, 1.0]),
+])
+def test_steps_hold_their_value_without_interpolating(spec, values):
+    curve = get_easing(spec)
+    
+    assert [curve(p) for p in (0.0, 0.26, 0.51, 0.99, 1.0)] == values
+
+
+def test_spring_overshoots_and_settles():
+    curve = get_easing('spring(1, 100, 5)')
+    samples = [curve(i / 100) for i in range(101)]
+    
+    assert max(samples) > 1.0
+    assert samples[-1] == 1.0
+    assert abs(samples[-2] - 1.0) < 0.01
+
+
+def test_curves_are_compiled_once():
+    assert get_easing('ease') is get_easing(' EASE ')
+    assert get_easing('ease') is get_easing('cubic-bezier(0.25, 0.1, 0.25, 1)')
+    
+    def custom(p):
+        return p ** 3
+    
+    assert get_easing(custom) is get_easing(custom)
+    assert isinstance(get_easing(custom), EasingCurve)
+    assert get_easing(get_easing('linear')) is get_easing('linear')
+
+
+def test_compiled_functions_are_bounded():
+    for i in range(200):
+        get_easing(lambda p, i=i: p)
+    
+    assert _compile_function.cache_info().currsize <= _compile_function.cache_info().maxsize
+
+
+@pytest.mark.parametrize('spec', ['bounce', 'linear(1)', 'cubic-bezier(1.5, 0, 0, 1)',
+                                  'cubic-bezier(0, 0)', 'steps(0)', 'steps(1, jump-none)',
+                                  'steps(2, middle)', 'spring(0)', 'ease(', 42])
+def test_invalid_specs_raise_value_error(spec):
+    with pytest.raises(ValueError):
+        get_easing(spec)
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""Tests for Modern TK event handler tokens, ordering and weak handlers"""
+
+import gc
+import time
+
+from src.core.event_manager import EventManager
+
+
+class Listener:
+    def __init__(self, calls):
+        self.calls = calls
+    
+    def on_click(self, event):
+        self.calls.append(('listener', event.name))
+
+
+def test_tokens_are_unique_and_remove_exactly_one_handler():
+    manager = EventManager()
+    calls = []
+    first = manager.bind('click', lambda e: calls.append('first'))
+    second = manager.bind('click', lambda e: calls.append('second'))
+    
+    assert first != second
+    assert manager.remove_handler(first) is True
+    assert manager.remove_handler(first) is False
+    
+    manager.trigger('click', None)
+    assert calls == ['second']
+    assert manager.handler_count('click') == 1
+
+
+def test_higher_priority_runs_first_and_ties_keep_bind_order():
+    manager = EventManager()
+    calls = []
+    for name, priority in (('a', 0), ('b', 10), ('c', 0), ('d', -5), ('e', 10)):
+        manager.bind('click', lambda e, name=name: calls.append(name), priority=priority)
+    
+    manager.trigger('click', None)
+    
+    assert calls == ['b', 'e', 'a', 'c', 'd']
+
+
+def test_order_is_updated_after_bind_and_unbind():
+    manager = EventManager()
+    calls = []
+    manager.bind('click', lambda e: calls.append('low'))
+    manager.trigger('click', None)
+    token = manager.bind('click', lambda e: calls.append('high'), priority=1)
+    manager.trigger('click', None)
+    manager.unbind(token)
+    manager.trigger('click', None)
+    
+    assert calls == ['low', 'high', 'low', 'low']
+
+
+def test_weak_handlers_remove_themselves_once_collected():
+    manager = EventManager()
+    calls = []
+    listener = Listener(calls)
+    manager.bind('click', listener.on_click, weak=True)
+    
+    def handler(event):
+        calls.append('function')
+    
+    manager.bind('click', handler, weak=True)
+    manager.trigger('click', None)
+    assert calls == [('listener', 'click'), 'function']
+    
+    del listener, handler
+    gc.collect()
+    
+    assert manager.handler_count() == 0
+    assert manager.event_handlers == {}
+
+
+def test_strong_handlers_keep_their_callback_alive():
+    manager = EventManager()
+    calls = []
+    manager.bind('click', Listener(calls).on_click)
+    gc.collect()
+    
+    manager.trigger('click', None)
+    assert calls == [('listener', 'click')]
+
+
+def test_unbind_by_bound_method_matches_a_fresh_method_object():
+    manager = EventManager()
+    calls = []
+    listener, other = Listener(calls), Listener(calls)
+    manager.bind('click', listener.on_click)
+    manager.bind('click', other.on_click)
+    
+    # Each attribute access creates a new bound method object
+    manager.unbind('click', listener.on_click)
+    
+    assert manager.handler_count('click') == 1
+    manager.trigger('click', None)
+    assert len(calls) == 1
+
+
+def test_unbind_event_name_removes_all_of_its_handlers():
+    manager = EventManager()
+    manager.bind('click', lambda e: None)
+    manager.bind('click', lambda e: None)
+    manager.bind('hover', lambda e: None)
+    
+    manager.unbind('click')
+    
+    assert manager.handler_count('click') == 0
+    assert manager.handler_count() == 1
+
+
+def test_removal_does_not_scan_other_handlers():
+    manager = EventManager()
+    tokens = [manager.bind('click', lambda e: None) for _ in range(20000)]
+    
+    start = time.perf_counter()
+    for token in tokens:
+        manager.remove_handler(token)
+    
+    assert manager.handler_count() == 0
+    assert time.perf_counter() - start < 1.0
+
+
+def test_global_handlers_run_after_widget_handlers():
+    manager = EventManager()
+    calls = []
+    manager.bind_global('click', lambda e: calls.append('global'), priority=5)
+    manager.bind('click', lambda e: calls.append('widget'))
+    
+    manager.trigger('click', None)
+    
+    assert calls == ['widget', 'global']
+
+
+def test_errors_are_contained_and_stop_propagation_ends_the_chain(capsys):
+    manager = EventManager()
+    calls = []
+    
+    def stop(event):
+        calls.append('stop')
+        event.stop_propagation = True
+    
+    manager.bind('click', lambda e: 1 / 0, priority=2)
+    manager.bind('click', stop, priority=1)
+    manager.bind('click', lambda e: calls.append('skipped'))
+    
+    manager.trigger('click', None)
+    
+    assert calls == ['stop']
+    assert 'Error in event handler' in capsys.readouterr().out
\ No newline at end of file
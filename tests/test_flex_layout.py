@@ -0,0 +1,106 @@
+"""Tests for the pure flexbox resolver"""
+
+from src.layouts.flex import compute_flex_layout
+
+
+def item(width, height, grow=0, shrink=1, basis='auto', align_self=None, margin=(0, 0, 0, 0)):
+    return {'grow': grow, 'shrink': shrink, 'basis': basis, 'align_self': align_self,
+            'size': (width, height), 'margin': margin}
+
+
+def test_items_keep_their_size_and_stretch_across():
+    boxes, cross = compute_flex_layout([item(50, 20), item(30, 40)], 200, 100)
+    
+    assert boxes == [(0, 0, 50, 100), (50, 0, 30, 100)]
+    assert cross == 40
+
+
+def test_free_space_is_shared_by_grow_ratio():
+    items = [item(0, 10, grow=1, basis=0), item(0, 10, grow=3, basis=0), item(40, 10)]
+    boxes, _ = compute_flex_layout(items, 200, 50)
+    
+    assert [box[2] for box in boxes] == [40, 120, 40]
+    assert [box[0] for box in boxes] == [0, 40, 160]
+
+
+def test_overflow_shrinks_larger_items_more():
+    boxes, _ = compute_flex_layout([item(100, 10), item(300, 10)], 300, 50)
+    
+    assert [box[2] for box in boxes] == [75, 225]
+
+
+def test_zero_shrink_keeps_an_item_whole():
+    boxes, _ = compute_flex_layout([item(100, 10, shrink=0), item(300, 10)], 300, 50)
+    
+    assert [box[2] for box in boxes] == [100, 200]
+
+
+def test_justify_distributes_leftover_space():
+    items = [item(20, 10), item(20, 10)]
+    
+    def starts(justify):
+        boxes, _ = compute_flex_layout(items, 100, 10, justify=justify)
+        return [box[0] for box in boxes]
+    
+    assert starts('start') == [0, 20]
+    assert starts('end') == [60, 80]
+    assert starts('center') == [30, 50]
+    assert starts('space-between') == [0, 80]
+    assert starts('space-around') == [15, 65]
+    assert starts('space-evenly') == [20, 60]
+
+
+def test_cross_alignment_and_align_self():
+    items = [item(10, 20), item(10, 20, align_self='end'), item(10, 20, align_self='stretch')]
+    boxes, _ = compute_flex_layout(items, 100, 60, align='center')
+    
+    assert [(box[1], box[3]) for box in boxes] == [(20, 20), (40, 20), (0, 60)]
+
+
+def test_margins_offset_and_space_items():
+    items = [item(20, 10, margin=(5, 2, 5, 2)), item(20, 10, margin=(5, 2, 5, 2))]
+    boxes, cross = compute_flex_layout(items, 100, 30, align='start')
+    
+    assert boxes == [(5, 2, 20, 10), (35, 2, 20, 10)]
+    assert cross == 14
+
+
+def test_wrapping_breaks_lines_and_reports_their_height():
+    items = [item(40, 10), item(40, 20), item(40, 15)]
+    boxes, cross = compute_flex_layout(items, 100, 35, wrap='wrap', align='start')
+    
+    assert boxes == [(0, 0, 40, 10), (40, 0, 40, 20), (0, 20, 40, 15)]
+    assert cross == 35
+
+
+def test_wrap_reverse_stacks_lines_upwards():
+    items = [item(60, 10), item(60, 10)]
+    boxes, _ = compute_flex_layout(items, 100, 20, wrap='wrap-reverse')
+    
+    assert [box[1] for box in boxes] == [10, 0]
+
+
+def test_column_and_reverse_directions():
+    items = [item(30, 20), item(10, 40)]
+    
+    boxes, cross = compute_flex_layout(items, 50, 100, direction='column', align='start')
+    assert boxes == [(0, 0, 30, 20), (0, 20, 10, 40)]
+    assert cross == 30
+    
+    boxes, _ = compute_flex_layout(items, 100, 50, direction='row-reverse')
+    assert [(box[0], box[2]) for box in boxes] == [(70, 30), (60, 10)]
+
+
+def test_reverse_directions_keep_margins_on_their_own_side():
+    items = [item(50, 10, margin=(10, 0, 0, 0)), item(50, 10)]
+    
+    boxes, _ = compute_flex_layout(items, 300, 10, direction='row-reverse')
+    assert [box[0] for box in boxes] == [250, 190]
+    
+    items = [item(10, 50, margin=(0, 0, 0, 10)), item(10, 50)]
+    boxes, _ = compute_flex_layout(items, 10, 300, direction='column-reverse')
+    assert [box[1] for box in boxes] == [240, 190]
+
+
+def test_no_items():
+    assert compute_flex_layout([], 100, 100) == ([], 0)
\ No newline at end of file
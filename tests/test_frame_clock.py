@@ -0,0 +1,36 @@
+"""Tests for the shared frame clock, driven by a display-less Tcl interpreter"""
+
+from src.utils.frame_clock import FrameClock
+from tests.conftest import pump
+
+
+def pending_timers(root):
+    return len(root.tk.splitlist(root.tk.call('after', 'info')))
+
+
+def test_subscriptions_added_during_a_tick_share_its_timer(root):
+    clock = FrameClock(root)
+    
+    def chain(i):
+        def callback(now):
+            if i < 60:
+                clock.add(('chain', i + 1), chain(i + 1))
+            return True
+        return callback
+    
+    clock.add(('chain', 0), chain(0))
+    pump(root, 1.0)
+    
+    assert pending_timers(root) == 1
+    assert clock.frames <= clock.fps * 1.2
+
+
+def test_clock_stops_when_nothing_is_subscribed(root):
+    clock = FrameClock(root)
+    ticks = []
+    clock.add('once', lambda now: ticks.append(now))
+    pump(root, 0.2)
+    
+    assert len(ticks) == 1
+    assert not clock.running
+    assert pending_timers(root) == 0
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""Tests for the ResponsiveGrid cell index and auto-flow placement"""
+
+import pytest
+
+from src.layouts.grid import ResponsiveGrid
+
+
+class Grid(ResponsiveGrid):
+    """ResponsiveGrid without its Tk frame; the cell index and auto-flow are plain bookkeeping"""
+    
+    def _create_widget(self, **kwargs):
+        return None
+    
+    def _apply_styles(self):
+        pass
+    
+    def _setup_events(self):
+        pass
+    
+    def _request_layout(self):
+        pass
+
+
+class Child:
+    def grid_forget(self):
+        pass
+
+
+def add(grid, count=1, **kwargs):
+    children = [Child() for _ in range(count)]
+    for child in children:
+        grid.add(child, **kwargs)
+    return children
+
+
+def cell(grid, child):
+    info = grid.child_grid_info[child]
+    return info['column'], info['row']
+
+
+def test_row_flow_fills_rows_and_adds_implicit_ones():
+    grid = Grid(columns=3)
+    children = add(grid, 7)
+    
+    assert [cell(grid, child) for child in children] == [(0, 0), (1, 0), (2, 0), (0, 1), (1, 1), (2, 1), (0, 2)]
+    assert grid.rows == 3
+    assert len(grid.row_weights) == 3
+
+
+def test_column_flow_fills_columns():
+    grid = Grid(rows=2, auto_flow='column')
+    children = add(grid, 5)
+    
+    assert [cell(grid, child) for child in children] == [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)]
+    assert grid.columns == 3
+
+
+def test_spans_are_indexed_under_every_cell_they_cover():
+    grid = Grid(columns=4)
+    wide, = add(grid, columnspan=2, rowspan=2)
+    
+    assert grid.get_cell_widgets(1, 1) == [wide]
+    assert not grid.is_cell_free(0, 1)
+    assert grid.is_cell_free(2, 0)
+    assert grid.next_free_cell() == (2, 0)
+
+
+def test_auto_flow_skips_explicitly_placed_children():
+    grid = Grid(columns=3)
+    fixed = Child()
+    grid.add(fixed, column=1, row=0)
+    children = add(grid, 3)
+    
+    assert [cell(grid, child) for child in children] == [(0, 0), (2, 0), (0, 1)]
+    assert grid.get_cell_widgets(1, 0) == [fixed]
+
+
+def test_sparse_flow_leaves_holes_that_dense_flow_fills():
+    def place(auto_flow):
+        grid = Grid(columns=3, auto_flow=auto_flow)
+        add(grid)
+        wide, = add(grid, columnspan=3)
+        small, = add(grid)
+        return cell(grid, wide), cell(grid, small)
+    
+    # The full-width item wraps to row 1; only dense flow goes back to the gap it left
+    assert place('row') == ((0, 1), (0, 2))
+    assert place('row dense') == ((0, 1), (1, 0))
+
+
+def test_sparse_flow_resumes_on_the_line_after_an_overflowing_item():
+    grid = Grid(columns=3)
+    wide, = add(grid, columnspan=5)
+    children = add(grid, 2)
+    
+    assert cell(grid, wide) == (0, 0)
+    assert [cell(grid, child) for child in children] == [(0, 1), (1, 1)]
+
+
+def test_fixed_column_takes_the_first_free_row():
+    grid = Grid(columns=2)
+    add(grid, 3)
+    child, = add(grid, column=1)
+    
+    assert cell(grid, child) == (1, 1)
+
+
+def test_removed_cells_are_reused_by_dense_flow():
+    grid = Grid(columns=2, auto_flow='row dense')
+    children = add(grid, 4)
+    grid.remove(children[1])
+    
+    assert grid.is_cell_free(1, 0)
+    assert grid.get_cell_widgets(1, 0) == []
+    child, = add(grid)
+    assert cell(grid, child) == (1, 0)
+
+
+def test_set_columns_reflows_auto_placed_children_only():
+    grid = Grid(columns=4)
+    fixed = Child()
+    grid.add(fixed, column=3, row=1)
+    children = add(grid, 4)
+    grid.pending.clear()
+    
+    grid.set_columns(2)
+    
+    assert [cell(grid, child) for child in children] == [(0, 0), (1, 0), (0, 1), (1, 1)]
+    assert cell(grid, fixed) == (3, 1)
+    # (0, 0) and (1, 0) did not move, so they are not re-gridded
+    assert list(grid.pending) == children[2:]
+    assert grid.rows == 2
+
+
+@pytest.mark.parametrize('auto_flow', ['row', 'row dense', 'column', 'column dense'])
+def test_index_matches_a_full_scan(auto_flow):
+    grid = Grid(columns=5, rows=5, auto_flow=auto_flow)
+    for i in range(60):
+        add(grid, columnspan=1 + i % 3, rowspan=1 + i % 2)
+    
+    covered = {}
+    for child, info in grid.child_grid_info.items():
+        for c in range(info['column'], info['column'] + info['columnspan']):
+            for r in range(info['row'], info['row'] + info['rowspan']):
+                covered.setdefault((c, r), []).append(child)
+    
+    assert grid.cells == covered
+    assert all(len(widgets) == 1 for widgets in covered.values())
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""Tests for the byte-budgeted image cache"""
+
+from src.utils.image_cache import ImageCache, image_bytes
+
+
+class Image:
+    """Stand-in exposing the PhotoImage size methods the cache reads"""
+    
+    def __init__(self, width, height):
+        self._width, self._height = width, height
+    
+    def width(self):
+        return self._width
+    
+    def height(self):
+        return self._height
+
+
+def factory(width=16, height=16, created=None):
+    def make():
+        image = Image(width, height)
+        if created is not None:
+            created.append(image)
+        return image
+    return make
+
+
+def test_image_bytes_counts_32_bit_pixels_and_tuples():
+    assert image_bytes(Image(10, 20)) == 800
+    assert image_bytes((Image(10, 20), Image(1, 1))) == 804
+
+
+def test_get_creates_once_and_counts_hits():
+    cache = ImageCache()
+    created = []
+    
+    first = cache.get('a', factory(created=created))
+    assert cache.get('a', factory(created=created)) is first
+    assert len(created) == 1
+    
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['bytes']) == (1, 1, 1024)
+    assert stats['hit_rate'] == 0.5
+
+
+def test_least_recently_used_images_are_evicted_first():
+    cache = ImageCache(max_bytes=3 * 1024)
+    for key in 'abc':
+        cache.get(key, factory())
+    cache.get('a', factory())
+    cache.get('d', factory())
+    
+    assert 'b' not in cache
+    assert all(key in cache for key in 'acd')
+    assert cache.get_stats()['evictions'] == 1
+    assert cache.total_bytes == 3 * 1024
+
+
+def test_acquired_images_survive_until_released():
+    cache = ImageCache(max_bytes=1024)
+    pinned = cache.acquire('pinned', factory())
+    cache.acquire('pinned', factory())
+    cache.get('other', factory())
+    
+    # Over budget, but only the unreferenced image can go
+    assert 'pinned' in cache
+    assert 'other' not in cache
+    
+    cache.release('pinned')
+    cache.get('other', factory())
+    assert cache.get('pinned', factory()) is pinned
+    
+    cache.release('pinned')
+    cache.get('other', factory())
+    assert 'pinned' not in cache
+    assert cache.get_stats()['in_use'] == 0
+
+
+def test_get_on_a_pinned_image_keeps_it_pinned():
+    cache = ImageCache(max_bytes=1024)
+    cache.acquire('pinned', factory())
+    cache.get('pinned', factory())
+    cache.get('other', factory())
+    
+    assert 'pinned' in cache
+    assert cache.entries['pinned'][2] == 1
+
+
+def test_extra_releases_are_ignored():
+    cache = ImageCache()
+    cache.get('a', factory())
+    cache.release('a')
+    cache.release('missing')
+    cache.release(None)
+    
+    assert cache.entries['a'][2] == 0
+    assert list(cache.idle) == ['a']
+
+
+def test_shrinking_the_budget_and_clear_keep_pinned_images():
+    cache = ImageCache()
+    cache.acquire('pinned', factory())
+    for key in 'abc':
+        cache.get(key, factory())
+    
+    cache.set_budget(2 * 1024)
+    assert set(cache.entries) == {'pinned', 'c'}
+    
+    cache.clear()
+    assert set(cache.entries) == {'pinned'}
+    assert cache.total_bytes == 1024
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""Tests for ResponsiveManager breakpoint resolution"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.layouts.responsive import ResponsiveManager
+
+
+def resize(manager, width, height=600):
+    manager._on_resize(SimpleNamespace(widget=manager.root_widget, width=width, height=height))
+
+
+@pytest.mark.parametrize('width, expected', [
+    (-5, 'mobile'), (0, 'mobile'), (767, 'mobile'), (768, 'tablet'), (1023, 'tablet'),
+    (1024, 'desktop'), (1439, 'desktop'), (1440, 'large'), (5000, 'large'),
+])
+def test_widest_breakpoint_not_wider_than_the_window(width, expected):
+    assert ResponsiveManager()._get_current_breakpoint(width) == expected
+
+
+def test_breakpoints_stay_sorted_when_added_out_of_order():
+    manager = ResponsiveManager()
+    manager.set_breakpoint('watch', -100)
+    manager.set_breakpoint('phablet', 600)
+    manager.set_breakpoint('tablet', 900)
+    
+    assert manager._names == ['watch', 'mobile', 'phablet', 'tablet', 'desktop', 'large']
+    assert manager._get_current_breakpoint(-50) == 'watch'
+    assert manager._get_current_breakpoint(800) == 'phablet'
+    assert manager._get_current_breakpoint(900) == 'tablet'
+
+
+def test_below_every_breakpoint_resolves_to_the_narrowest():
+    manager = ResponsiveManager()
+    manager.set_breakpoint('mobile', 320)
+    
+    assert manager._get_current_breakpoint(100) == 'mobile'
+
+
+def test_without_hysteresis_boundaries_switch_immediately():
+    manager = ResponsiveManager()
+    manager.current_breakpoint = 'tablet'
+    
+    assert manager._resolve_breakpoint(1024) == 'desktop'
+    assert manager._resolve_breakpoint(767) == 'mobile'
+
+
+def test_hysteresis_holds_the_breakpoint_near_a_boundary():
+    manager = ResponsiveManager(hysteresis=20)
+    manager.current_breakpoint = 'tablet'
+    
+    assert manager._resolve_breakpoint(1030) == 'tablet'
+    assert manager._resolve_breakpoint(1044) == 'desktop'
+    assert manager._resolve_breakpoint(760) == 'tablet'
+    assert manager._resolve_breakpoint(747) == 'mobile'
+
+
+def test_hysteresis_does_not_hold_back_a_jump_over_several_breakpoints():
+    manager = ResponsiveManager(hysteresis=20)
+    manager.current_breakpoint = 'mobile'
+    
+    # Within hysteresis of 'large', but well past 'desktop'
+    assert manager._resolve_breakpoint(1450) == 'desktop'
+    assert manager._resolve_breakpoint(1500) == 'large'
+
+
+def test_resizing_back_and_forth_across_a_boundary_does_not_flap():
+    manager = ResponsiveManager(hysteresis=16)
+    changes = []
+    manager.add_breakpoint_handler(None, lambda new, previous: changes.append((previous, new)))
+    
+    resize(manager, 900)
+    for width in (1020, 1030, 1018, 1035, 1025):
+        resize(manager, width)
+    resize(manager, 1100)
+    for width in (1030, 1012, 1020):
+        resize(manager, width)
+    
+    assert changes == [(None, 'tablet'), ('tablet', 'desktop')]
+
+
+def test_height_only_resizes_skip_the_lookup():
+    manager = ResponsiveManager()
+    calls = []
+    manager.add_resize_handler(None, lambda w, h: calls.append(('width', w)), watch='width')
+    manager.add_resize_handler(None, lambda w, h: calls.append(('height', h)), watch='height')
+    
+    resize(manager, 800, 600)
+    manager.current_breakpoint = 'sentinel'
+    resize(manager, 800, 700)
+    resize(manager, 800, 700)
+    
+    assert manager.current_breakpoint == 'sentinel'
+    assert calls == [('width', 800), ('height', 600), ('height', 700)]
+
+class Widget:
+    def __init__(self):
+        self.configured = []
+    
+    def configure(self, **options):
+        self.configured.append(options)
+
+
+def test_configure_is_compared_with_what_was_last_applied():
+    manager = ResponsiveManager()
+    widget = Widget()
+    manager.set_layout_config(widget, 'mobile', {'configure': {'text': 'short'}})
+    manager.set_layout_config(widget, 'tablet', {'visible': True})
+    manager.set_layout_config(widget, 'desktop', {'configure': {'text': 'short'}})
+    manager.set_layout_config(widget, 'large', {'configure': {'text': 'long'}})
+    
+    for width in (500, 800, 1100, 800, 1500, 1100):
+        resize(manager, width)
+    
+    # A rule without 'configure' leaves the applied options in place
+    assert widget.configured == [{'text': 'short'}, {'text': 'long'}, {'text': 'short'}]
\ No newline at end of file
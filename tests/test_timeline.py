@@ -0,0 +1,77 @@
+"""Tests for timelines, driven by a display-less Tcl interpreter"""
+
+import pytest
+
+from src.utils.frame_clock import FrameClock
+from src.utils.timeline import Delay, Sequence, Timeline, TimelineNode, Tween
+from tests.conftest import Target, pump
+
+
+def test_nodes_must_implement_render():
+    with pytest.raises(TypeError):
+        TimelineNode()
+
+
+def test_timeline_sleeps_while_every_target_is_hidden(root):
+    target = Target(root, viewable=False)
+    clock = FrameClock.for_widget(target)
+    timeline = Timeline(Tween(target, 'width', 0, 100, 300)).play()
+    pump(root, 0.1)
+    
+    # One frame noticed nothing was visible; after that the clock stopped
+    assert clock.frames == 1
+    assert not clock.running
+    assert target.configured == []
+    assert timeline.running
+    
+    target.viewable = True
+    clock._on_map_change(None)
+    pump(root, 0.1)
+    
+    assert clock.running
+    assert 0 < target.configured[0]['width'] < 100
+
+
+def test_hidden_timeline_still_lands_on_its_final_state(root):
+    target = Target(root, viewable=False)
+    clock = FrameClock.for_widget(target)
+    done = []
+    Timeline(Tween(target, 'width', 0, 100, 100), callback=lambda: done.append(True)).play()
+    pump(root, 0.3)
+    
+    assert clock.frames == 2
+    assert target.configured == [{'width': 100}]
+    assert done == [True]
+
+
+def test_cancel_drops_a_sleeping_timeline(root):
+    target = Target(root, viewable=False)
+    clock = FrameClock.for_widget(target)
+    timeline = Timeline(Tween(target, 'width', 0, 100, 100)).play()
+    pump(root, 0.05)
+    timeline.cancel()
+    pump(root, 0.15)
+    
+    assert clock.visibility_handlers == []
+    assert target.configured == []
+    assert root.tk.call('after', 'info') == ''
+
+
+def test_delay_only_timeline_runs_on_the_given_root(root):
+    done = []
+    timeline = Timeline(Sequence(Delay(100)), callback=lambda: done.append(True)).play(root=root)
+    
+    assert done == []
+    pump(root, 0.05)
+    assert done == []
+    assert timeline.running
+    pump(root, 0.15)
+    assert done == [True]
+
+
+def test_delay_only_timeline_needs_a_root():
+    done = []
+    
+    with pytest.raises(ValueError):
+        Timeline(Delay(100), callback=lambda: done.append(True)).play()
+    assert done == []
\ No newline at end of file